@@ -0,0 +1,84 @@
+"""Compare DetMapHeightScanLiveDispatcher event processing against the equivalent scipp code.
+
+Run using::
+
+    python benchmarks/det_map_height_scan.py
+
+For each detector size, this prints the mean time taken to normalize one event's detector
+counts using the dispatcher, and using scipp variables (as the dispatcher used to), and
+checks that both give the same values and uncertainties. It also prints the mean time per
+event when the dispatcher normalizes a whole event page of events at once.
+"""
+
+import functools
+import math
+import timeit
+
+import numpy as np
+import numpy.typing as npt
+import scipp as sc
+
+from ibex_bluesky_core.callbacks.reflectometry import DetMapHeightScanLiveDispatcher
+from ibex_bluesky_core.devices.simpledae import VARIANCE_ADDITION
+
+PIXEL_COUNTS = (1_000, 2_000, 5_000, 10_000)
+REPEATS = 2_000
+PAGE_SIZE = 10
+
+
+def scipp_height_scan(
+    det_data: npt.NDArray[np.int64], mon_data: npt.NDArray[np.int64], flood: sc.Variable
+) -> tuple[float, float]:
+    """Normalize one event's detector counts using scipp."""
+    det = sc.Variable(dims=["spectrum"], values=det_data, variances=det_data, dtype="float64")
+    mon = sc.Variable(dims=["spectrum"], values=mon_data, variances=mon_data, dtype="float64")
+    det /= flood
+    det_sum = det.sum()
+    det_sum.variance += VARIANCE_ADDITION
+    normalized = det_sum / mon.sum()
+    return normalized.value, math.sqrt(normalized.variance)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    rng = np.random.default_rng(seed=0)
+    print(
+        f"{'pixels':>8} {'numpy (us)':>12} {'scipp (us)':>12} {'speedup':>8} "
+        f"{'page (us/event)':>16}"
+    )
+    for pixels in PIXEL_COUNTS:
+        flood = sc.array(
+            dims=["spectrum"],
+            values=rng.uniform(0.5, 1.5, pixels),
+            variances=rng.uniform(0.001, 0.01, pixels),
+        )
+        det_data = rng.integers(0, 1000, pixels)
+        mon_data = rng.integers(1, 1000, 1)
+
+        dispatcher = DetMapHeightScanLiveDispatcher(
+            mon_name="mon", det_name="det", out_name="out", flood=flood
+        )
+        normalize = functools.partial(dispatcher._normalize, det_data, mon_data)  # noqa: SLF001
+        normalize_scipp = functools.partial(scipp_height_scan, det_data, mon_data, flood)
+        normalize_page = functools.partial(
+            dispatcher._normalize,  # noqa: SLF001
+            np.tile(det_data, (PAGE_SIZE, 1)),
+            np.tile(mon_data, (PAGE_SIZE, 1)),
+        )
+
+        value, error = normalize()
+        expected_value, expected_error = normalize_scipp()
+        assert math.isclose(value, expected_value, rel_tol=1e-12)
+        assert math.isclose(error, expected_error, rel_tol=1e-12)
+
+        numpy_s = timeit.timeit(normalize, number=REPEATS) / REPEATS
+        scipp_s = timeit.timeit(normalize_scipp, number=REPEATS) / REPEATS
+        page_s = timeit.timeit(normalize_page, number=REPEATS // PAGE_SIZE) / REPEATS
+        print(
+            f"{pixels:>8} {numpy_s * 1e6:>12.1f} {scipp_s * 1e6:>12.1f} {scipp_s / numpy_s:>7.1f}x "
+            f"{page_s * 1e6:>16.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -17,13 +17,15 @@ import bluesky.preprocessors as bpp
 import matplotlib.pyplot as plt
 import numpy as np
 import numpy.typing as npt
-from bluesky.callbacks import CallbackBase, CollectThenCompute, LiveFitPlot, LiveTable
+from bluesky.callbacks import CallbackBase, CollectThenCompute, LiveTable
 from bluesky.callbacks.fitting import PeakStats
 from bluesky.callbacks.mpl_plotting import QtAwareCallback
 from bluesky.utils import Msg, make_decorator
 from event_model import RunStart
 from matplotlib.axes import Axes
 
+from ibex_bluesky_core.callbacks._background import BackgroundCallback, OverflowPolicy
+from ibex_bluesky_core.callbacks._binary_file_writer import BinaryFileCallback, load_binary_scan
 from ibex_bluesky_core.callbacks._centre_of_mass import (
     CentreOfMass,
 )
@@ -35,9 +37,11 @@ from ibex_bluesky_core.callbacks._fitting import (
     ChainedLiveFit,
     LiveFit,
     LiveFitLogger,
+    _LiveFitPlot,
 )
 from ibex_bluesky_core.callbacks._kafka import KafkaCallback
 from ibex_bluesky_core.callbacks._plotting import LivePColorMesh, LivePlot, PlotPNGSaver, show_plot
+from ibex_bluesky_core.callbacks._scan_columns import ScanColumns
 from ibex_bluesky_core.callbacks._utils import get_default_output_path
 from ibex_bluesky_core.fitting import FitMethod
 from ibex_bluesky_core.utils import is_matplotlib_backend_qt
@@ -48,6 +52,8 @@ logger = logging.getLogger(__name__)
 
 
 __all__ = [
+    "BackgroundCallback",
+    "BinaryFileCallback",
     "CentreOfMass",
     "ChainedLiveFit",
     "CustomCallback",
@@ -60,8 +66,11 @@ __all__ = [
     "LiveFitLogger",
     "LivePColorMesh",
     "LivePlot",
+    "OverflowPolicy",
     "PlotPNGSaver",
+    "ScanColumns",
     "get_default_output_path",
+    "load_binary_scan",
     "show_plot",
 ]
 
@@ -81,6 +90,8 @@ class ISISCallbacks:
         add_human_readable_file_cb: bool = True,
         fields_for_hr_file: list[str] | None = None,
         human_readable_file_output_dir: str | PathLike[str] | None = None,
+        add_binary_file_cb: bool = False,
+        binary_file_output_dir: str | PathLike[str] | None = None,
         add_plot_cb: bool = True,
         ax: Axes | None = None,
         fit: FitMethod | None = None,
@@ -96,6 +107,9 @@ class ISISCallbacks:
         plot_png_postfix: str = "",
         live_fit_update_every: int | None = 1,
         live_plot_update_on_every_event: bool = True,
+        live_fit_in_background: bool = False,
+        save_plot_png_in_background: bool = False,
+        write_files_in_background: bool = False,
     ) -> None:
         """A collection of ISIS standard callbacks.
 
@@ -121,6 +135,11 @@ class ISISCallbacks:
 
         - :py:obj:`ibex_bluesky_core.callbacks.CentreOfMass`
 
+        If fitting or plotting callbacks are used, the x, y and yerr data for each point are
+        stored once, by a :py:obj:`~ibex_bluesky_core.callbacks.ScanColumns` callback, and read
+        from there by those callbacks. This data is available from the
+        :py:obj:`~ibex_bluesky_core.callbacks.ISISCallbacks.columns` property.
+
         Results can be accessed from the :py:obj:`~ibex_bluesky_core.callbacks.ISISCallbacks.live_fit`,
         :py:obj:`~ibex_bluesky_core.callbacks.ISISCallbacks.com` and
         :py:obj:`~ibex_bluesky_core.callbacks.ISISCallbacks.peak_stats` properties.
@@ -156,6 +175,8 @@ class ISISCallbacks:
             add_human_readable_file_cb: whether to add a human-readable file callback.
             fields_for_hr_file: the fields to measure for the human-readable file (in addition to `measured_fields`).
             human_readable_file_output_dir: the output directory for human-readable files. can be blank and will default.
+            add_binary_file_cb: whether to add a :py:obj:`~ibex_bluesky_core.callbacks.BinaryFileCallback`, which writes every field of each scan to NumPy binary files.
+            binary_file_output_dir: the output directory for binary files. can be blank and will default.
             add_plot_cb: whether to add a plot callback.
             ax: An optional axes object to use for plotting.
             fit: The fit method to use when fitting.
@@ -171,12 +192,20 @@ class ISISCallbacks:
             plot_png_postfix: the postfix to add to PNG plot files.
             live_fit_update_every: How often, in points, to recompute the fit. If None, do not compute until the end.
             live_plot_update_on_every_event: whether to show the live plot on every event, or just at the end.
+            live_fit_in_background: whether to run intermediate fits on a background thread. A final fit is always performed at the end of the run.
+            save_plot_png_in_background: whether to write PNG plot files on a background thread, so that the end of the run does not wait for them.
+            write_files_in_background: whether to run the human-readable file, binary file and live fit logger callbacks on a background thread, using :py:obj:`~ibex_bluesky_core.callbacks.BackgroundCallback`. All files are written before the run finishes.
         """  # noqa
         fig = None
-        self._subs = []
+        self._subs: list[CallbackBase] = []
         self._peak_stats = None
         self._com = None
         self._live_fit = None
+        self._columns = None
+        if fit is not None or add_plot_cb or show_fit_on_plot:
+            # Subscribed first, so that other callbacks can read each point's data from it.
+            self._columns = ScanColumns(x=x, y=y, yerr=yerr)
+            self._subs.append(self._columns)
         if measured_fields is None:
             measured_fields = []
         if fields_for_live_table is None:
@@ -191,14 +220,26 @@ class ISISCallbacks:
 
         if add_human_readable_file_cb:
             combined_hr_fields = measured_fields + fields_for_hr_file
+            hr_file_cb = HumanReadableFileCallback(
+                fields=combined_hr_fields,
+                output_dir=Path(human_readable_file_output_dir)
+                if human_readable_file_output_dir
+                else get_default_output_path(),
+                postfix=human_readable_file_postfix,
+            )
+            self._subs.append(
+                BackgroundCallback(hr_file_cb) if write_files_in_background else hr_file_cb
+            )
+
+        if add_binary_file_cb:
+            binary_file_cb = BinaryFileCallback(
+                output_dir=Path(binary_file_output_dir)
+                if binary_file_output_dir
+                else get_default_output_path(),
+                postfix=human_readable_file_postfix,
+            )
             self._subs.append(
-                HumanReadableFileCallback(
-                    fields=combined_hr_fields,
-                    output_dir=Path(human_readable_file_output_dir)
-                    if human_readable_file_output_dir
-                    else get_default_output_path(),
-                    postfix=human_readable_file_postfix,
-                ),
+                BackgroundCallback(binary_file_cb) if write_files_in_background else binary_file_cb
             )
 
         if add_table_cb:
@@ -240,7 +281,15 @@ class ISISCallbacks:
                 fig, ax = plt.subplots()
 
         if fit is not None:
-            self._live_fit = LiveFit(fit, y=y, x=x, yerr=yerr, update_every=live_fit_update_every)
+            self._live_fit = LiveFit(
+                fit,
+                y=y,
+                x=x,
+                yerr=yerr,
+                update_every=live_fit_update_every,
+                fit_in_background=live_fit_in_background,
+                columns=self._columns,
+            )
 
             if show_fit_on_plot:
                 if is_matplotlib_backend_qt():
@@ -254,20 +303,24 @@ class ISISCallbacks:
                 # Sample 5000 points as this strikes a reasonable balance between displaying
                 # 'enough' points for almost any scan (even after zooming in on a peak), while
                 # not taking 'excessive' compute time to generate these samples.
-                self._subs.append(LiveFitPlot(livefit=self._live_fit, ax=ax, num_points=5000))
+                self._subs.append(_LiveFitPlot(livefit=self._live_fit, ax=ax, num_points=5000))
             else:
                 self._subs.append(self._live_fit)
 
             if add_live_fit_logger:
+                live_fit_logger = LiveFitLogger(
+                    livefit=self._live_fit,
+                    x=x,
+                    y=y,
+                    yerr=yerr,
+                    output_dir=live_fit_logger_output_dir,
+                    postfix=live_fit_logger_postfix,
+                    columns=self._columns,
+                )
                 self._subs.append(
-                    LiveFitLogger(
-                        livefit=self._live_fit,
-                        x=x,
-                        y=y,
-                        yerr=yerr,
-                        output_dir=live_fit_logger_output_dir,
-                        postfix=live_fit_logger_postfix,
-                    )
+                    BackgroundCallback(live_fit_logger)
+                    if write_files_in_background
+                    else live_fit_logger
                 )
 
         if add_plot_cb or show_fit_on_plot:
@@ -280,6 +333,7 @@ class ISISCallbacks:
                     ax=ax,
                     yerr=yerr,
                     update_on_every_event=live_plot_update_on_every_event,
+                    columns=self._columns,
                 )
             )
             if save_plot_to_png and ax is not None:
@@ -290,6 +344,7 @@ class ISISCallbacks:
                         ax=ax,
                         output_dir=plot_png_output_dir,
                         postfix=plot_png_postfix,
+                        save_in_background=save_plot_png_in_background,
                     )
                 )
 
@@ -314,6 +369,13 @@ class ISISCallbacks:
             raise ValueError("centre of mass was not added as a callback.")
         return self._com
 
+    @property
+    def columns(self) -> ScanColumns:
+        """The x, y and yerr data collected so far, shared by the fitting and plotting callbacks."""
+        if self._columns is None:
+            raise ValueError("scan columns were not added as a callback.")
+        return self._columns
+
     @property
     def subs(self) -> list[CallbackBase]:
         """The list of all subscribed callbacks."""
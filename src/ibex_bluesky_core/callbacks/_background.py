@@ -0,0 +1,223 @@
+"""Run a callback on a background thread, so that it does not slow down a scan."""
+
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, Literal
+
+from bluesky.callbacks import CallbackBase
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["BackgroundCallback", "OverflowPolicy"]
+
+OverflowPolicy = Literal["block", "drop"]
+"""What :py:obj:`BackgroundCallback` does when its queue is full.
+
+- ``"block"``: wait for space in the queue, so that every document is passed on.
+- ``"drop"``: drop the event or event page, and carry on. Other documents (such as start,
+  descriptor and stop documents) are never dropped.
+"""
+
+# A document to pass on, an event to set once earlier documents have been passed on, or None
+# to stop the worker thread.
+_QueueItem = tuple[str, dict[str, Any]] | threading.Event | None
+
+# Documents which may be dropped when the queue is full.
+_DROPPABLE = frozenset({"event", "event_page"})
+
+
+class BackgroundCallback(CallbackBase):
+    """Pass documents to another callback, on a background thread."""
+
+    def __init__(
+        self,
+        callback: Callable[[str, dict[str, Any]], Any],
+        *,
+        maxsize: int = 1000,
+        overflow: OverflowPolicy = "block",
+        drain_on_stop: bool = True,
+        stop_timeout_s: float | None = None,
+    ) -> None:
+        """Pass documents to another callback, on a background thread.
+
+        The bluesky :py:obj:`~bluesky.run_engine.RunEngine` calls each subscribed callback in
+        turn, so a slow callback (for example, one which writes files) slows down the scan.
+        This callback instead puts each document on a queue, and returns immediately. A
+        worker thread then passes the documents to the wrapped callback, in the order they
+        were emitted. The worker thread exits once it has passed on a run's stop document.
+
+        Exceptions raised by the wrapped callback are logged, and counted in
+        :py:obj:`errors`, but are not raised to the run engine.
+
+        .. note::
+
+            Callbacks which draw plots should not be wrapped, as matplotlib must only be
+            used from one thread.
+
+        Args:
+            callback: The callback to pass documents to.
+            maxsize: The maximum number of documents waiting to be passed on.
+            overflow: What to do when ``maxsize`` documents are already waiting. See
+                :py:obj:`OverflowPolicy`.
+            drain_on_stop: Whether to wait, when a run stops, until the wrapped callback has
+                processed all of that run's documents. This means that the wrapped callback's
+                results are ready as soon as the run finishes.
+            stop_timeout_s: the maximum time, in seconds, to wait for the wrapped callback when
+                a run stops, if ``drain_on_stop`` is set. An error is logged if this time runs
+                out. :py:obj:`None` to wait indefinitely.
+
+        """
+        super().__init__()
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+        if overflow not in {"block", "drop"}:
+            raise ValueError(f"overflow must be 'block' or 'drop', got {overflow!r}")
+        self.callback = callback
+        self.overflow = overflow
+        self.drain_on_stop = drain_on_stop
+        self.stop_timeout_s = stop_timeout_s
+
+        self.dropped = 0
+        """Number of events and event pages dropped because the queue was full."""
+        self.errors = 0
+        """Number of documents for which the wrapped callback raised an exception."""
+        self.blocked_puts = 0
+        """Number of documents which had to wait for space in the queue."""
+        self.max_queue_depth = 0
+        """Largest number of documents which have been waiting to be passed on at once."""
+
+        self._dropped_this_run = 0
+        self._queue: queue.Queue[_QueueItem] = queue.Queue(maxsize=maxsize)
+        self._thread: threading.Thread | None = None
+        self._closing = False
+
+    def __call__(
+        self, name: str, doc: dict[str, Any], validate: bool = False
+    ) -> tuple[str, dict[str, Any]]:
+        """Queue a document to be passed to the wrapped callback.
+
+        :meta private:
+        """
+        self._start_thread()
+        if name == "start":
+            self._dropped_this_run = 0
+
+        if self.overflow == "drop" and name in _DROPPABLE:
+            try:
+                self._queue.put_nowait((name, doc))
+            except queue.Full:
+                self.dropped += 1
+                self._dropped_this_run += 1
+        else:
+            self._put(name, doc)
+        self.max_queue_depth = max(self.max_queue_depth, self._queue.qsize())
+
+        if name == "stop":
+            if self._dropped_this_run:
+                logger.warning(
+                    "%s dropped %d events from run %s because its queue was full",
+                    self,
+                    self._dropped_this_run,
+                    doc.get("run_start"),
+                )
+            # The worker thread exits once it has processed the stop document; the next run
+            # starts a new one.
+            self._queue.put(None)
+            self._closing = True
+            if self.drain_on_stop and not self.flush(self.stop_timeout_s):
+                logger.error(
+                    "Timed out after %ss waiting for %r to process run %s",
+                    self.stop_timeout_s,
+                    self.callback,
+                    doc.get("run_start"),
+                )
+        return name, doc
+
+    def flush(self, timeout_s: float | None = None) -> bool:
+        """Wait for the wrapped callback to process all documents queued so far.
+
+        Args:
+            timeout_s: the maximum time, in seconds, to wait. :py:obj:`None` to wait
+                indefinitely.
+
+        Returns:
+            :py:obj:`True` if all documents were processed, :py:obj:`False` on timeout.
+
+        """
+        if self._thread is None:
+            return True
+        if self._closing:
+            self._thread.join(timeout_s)
+            return not self._thread.is_alive()
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout_s)
+
+    def close(self, timeout_s: float | None = None) -> bool:
+        """Stop the worker thread, once it has processed all documents queued so far.
+
+        The worker thread also stops after each run's stop document, so this only needs to
+        be called to stop the thread part-way through a run. If more documents are passed
+        to this callback afterwards, a new worker thread is started.
+
+        Args:
+            timeout_s: the maximum time, in seconds, to wait. :py:obj:`None` to wait
+                indefinitely.
+
+        Returns:
+            :py:obj:`True` if the worker thread stopped, :py:obj:`False` on timeout.
+
+        """
+        if self._thread is not None and not self._closing:
+            self._queue.put(None)
+            self._closing = True
+        return self.flush(timeout_s)
+
+    def __repr__(self) -> str:
+        """Describe this callback, and the callback it wraps."""
+        return f"BackgroundCallback({self.callback!r})"
+
+    def _put(self, name: str, doc: dict[str, Any]) -> None:
+        try:
+            self._queue.put_nowait((name, doc))
+        except queue.Full:
+            self.blocked_puts += 1
+            start = time.monotonic()
+            self._queue.put((name, doc))
+            logger.warning("%s queue full, blocked for %.3fs", self, time.monotonic() - start)
+
+    def _start_thread(self) -> None:
+        if self._thread is not None and not self._closing:
+            return
+        # Each worker thread has its own queue, and waits for the previous one to finish, so
+        # that documents are still passed on in order.
+        if self._closing:
+            self._queue = queue.Queue(maxsize=self._queue.maxsize)
+        self._closing = False
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(self._queue, self._thread),
+            name=f"BackgroundCallback-{type(self.callback).__name__}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _run(self, items: queue.Queue[_QueueItem], previous: threading.Thread | None) -> None:
+        if previous is not None:
+            previous.join()
+        while True:
+            item = items.get()
+            if item is None:
+                return
+            if isinstance(item, threading.Event):
+                item.set()
+                continue
+            name, doc = item
+            try:
+                self.callback(name, doc)
+            except Exception:
+                logger.exception("%r failed to process %s document", self.callback, name)
+                self.errors += 1
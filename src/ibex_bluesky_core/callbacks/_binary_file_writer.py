@@ -0,0 +1,240 @@
+"""Writes each bluesky run to a directory of NumPy ``.npy`` columns, with a JSON header."""
+
+import json
+import logging
+import os
+from pathlib import Path
+from stat import S_IRGRP, S_IROTH, S_IRUSR
+from typing import Any, Literal
+
+import numpy as np
+import numpy.typing as npt
+from bluesky.callbacks import CallbackBase
+from event_model import Event, EventDescriptor, EventPage, RunStart, RunStop
+
+from ibex_bluesky_core.callbacks._utils import (
+    DATA,
+    DATA_KEYS,
+    DESCRIPTOR,
+    MOTORS,
+    NAME,
+    SEQ_NUM,
+    TIME,
+    UID,
+    format_time,
+    get_default_output_path,
+    get_instrument,
+    get_scan_output_dir,
+)
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["BinaryFileCallback", "load_binary_scan"]
+
+HEADER_FILE = "header.json"
+FORMAT_NAME = "ibex_bluesky_core.binary_scan"
+FORMAT_VERSION = 1
+
+# Columns taken from the event itself, rather than from the event's data.
+_EVENT_COLUMNS = (SEQ_NUM, TIME)
+
+
+def _to_json(value: Any) -> Any:  # noqa: ANN401
+    # Documents may contain numpy values (for example, in plan arguments).
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+class BinaryFileCallback(CallbackBase):
+    """Writes each bluesky run to a directory of NumPy ``.npy`` columns, with a JSON header."""
+
+    def __init__(
+        self,
+        fields: list[str] | None = None,
+        *,
+        output_dir: Path | None = None,
+        postfix: str = "",
+    ) -> None:
+        """Write each bluesky run to a directory of NumPy ``.npy`` columns, with a JSON header.
+
+        This is a companion to :py:obj:`~ibex_bluesky_core.callbacks.HumanReadableFileCallback`,
+        for scans which are too large to write, or read back, quickly as text, or which
+        contain array-valued fields (such as the detector integrals from
+        :py:obj:`~ibex_bluesky_core.devices.simpledae.PeriodSpecIntegralsReducer`).
+
+        Each run is written to a directory, named in the same way as the human-readable file
+        (without the ``.txt`` extension), in the same ``RB<number>/bluesky_scans`` folder.
+        The directory contains one ``.npy`` file per field, with one row per event, and also
+        ``seq_num.npy`` and ``time.npy``. ``header.json`` describes the run and each column,
+        and is written last, once all of the columns have been written.
+
+        The files are written when the run stops. Columns can then be loaded, without any
+        parsing, and optionally memory-mapped, using :py:obj:`load_binary_scan` or
+        :py:obj:`numpy.load`.
+
+        Only events in the ``primary`` stream are written. Events which do not contain all
+        of the fields are ignored.
+
+        Args:
+            fields: the fields to write. :py:obj:`None` to write every field in the first
+                ``primary`` event descriptor of each run.
+            output_dir: the directory under which to write output files.
+            postfix: optional postfix to append to output directory names.
+
+        """
+        super().__init__()
+        self.fields = fields
+        self.output_dir: Path = output_dir or get_default_output_path()
+        self.postfix = postfix
+        self.filename: Path | None = None
+        """The directory that the current (or last) run is written to."""
+
+        self._start: RunStart | None = None
+        self._descriptors: dict[str, EventDescriptor] = {}
+        self._run_fields: list[str] = []
+        self._columns: dict[str, list[Any]] = {}
+
+    def start(self, doc: RunStart) -> None:
+        """Start collecting columns for a new run.
+
+        :meta private:
+        """
+        motors = list(doc.get(MOTORS, []))
+        self.filename = (
+            get_scan_output_dir(self.output_dir, doc)
+            / f"{get_instrument()}{'_' + '_'.join(motors) if motors else ''}_"
+            f"{format_time(doc)}Z{self.postfix}"
+        )
+        logger.info("collecting binary columns for %s", self.filename)
+        self._start = doc
+        self._descriptors = {}
+        self._set_run_fields([] if self.fields is None else self.fields)
+
+    def descriptor(self, doc: EventDescriptor) -> None:
+        """Store the descriptor, if it describes the primary stream.
+
+        :meta private:
+        """
+        if doc.get(NAME) != "primary":
+            return
+        self._descriptors[doc[UID]] = doc
+        if self.fields is None and not self._run_fields:
+            self._set_run_fields(list(doc[DATA_KEYS]))
+
+    def _set_run_fields(self, fields: list[str]) -> None:
+        self._run_fields = [field for field in fields if field not in _EVENT_COLUMNS]
+        self._columns = {field: [] for field in (*self._run_fields, *_EVENT_COLUMNS)}
+
+    def _wanted(self, descriptor_uid: str, data: dict[str, Any]) -> bool:
+        return descriptor_uid in self._descriptors and all(
+            field in data for field in self._run_fields
+        )
+
+    def event(self, doc: Event) -> Event:
+        """Add an event's values to the columns.
+
+        :meta private:
+        """
+        if self._wanted(doc[DESCRIPTOR], doc[DATA]):
+            for field in self._run_fields:
+                self._columns[field].append(doc[DATA][field])
+            for field in _EVENT_COLUMNS:
+                self._columns[field].append(doc[field])
+        return doc
+
+    def event_page(self, doc: EventPage) -> EventPage:
+        """Add all of an event page's values to the columns at once.
+
+        :meta private:
+        """
+        if self._wanted(doc[DESCRIPTOR], doc[DATA]):
+            for field in self._run_fields:
+                self._columns[field].extend(doc[DATA][field])
+            for field in _EVENT_COLUMNS:
+                self._columns[field].extend(doc[field])
+        return doc
+
+    def stop(self, doc: RunStop) -> None:
+        """Write the columns, and then the header, to the output directory.
+
+        :meta private:
+        """
+        if self.filename is None or self._start is None:
+            logger.error("Run has not been started yet - doing nothing")
+            return
+
+        self.filename.mkdir(parents=True, exist_ok=True)
+        data_keys: dict[str, Any] = {}
+        for descriptor in self._descriptors.values():
+            data_keys = {**descriptor[DATA_KEYS], **data_keys}
+
+        columns: dict[str, dict[str, Any]] = {}
+        for field, values in self._columns.items():
+            column = self._write_column(field, values)
+            if column is not None:
+                columns[field] = {**column, **data_keys.get(field, {})}
+
+        header = {
+            "format": FORMAT_NAME,
+            "version": FORMAT_VERSION,
+            "num_events": len(self._columns[SEQ_NUM]),
+            "start": self._start,
+            "stop": doc,
+            "columns": columns,
+        }
+        header_path = self.filename / HEADER_FILE
+        with open(header_path, "w", encoding="utf-8") as f:
+            json.dump(header, f, indent=2, default=_to_json)
+        os.chmod(header_path, S_IRUSR | S_IRGRP | S_IROTH)
+
+        logger.info("Binary columns successfully written to: %s", self.filename)
+        self._columns = {}
+        self._descriptors = {}
+        self._start = None
+
+    def _write_column(self, field: str, values: list[Any]) -> dict[str, Any] | None:
+        assert self.filename is not None
+        try:
+            array = np.asarray(values)
+        except ValueError:
+            array = None
+        if array is None or array.dtype == np.object_:
+            # For example, arrays of different shapes in different events.
+            logger.warning("Cannot write %s as a binary column; skipping it", field)
+            return None
+
+        file = f"{field}.npy"
+        path = self.filename / file
+        np.save(path, array, allow_pickle=False)
+        os.chmod(path, S_IRUSR | S_IRGRP | S_IROTH)
+        return {"file": file, "numpy_dtype": array.dtype.str, "numpy_shape": list(array.shape)}
+
+
+def load_binary_scan(
+    path: str | os.PathLike[str], mmap_mode: Literal["r", "r+", "c"] | None = "r"
+) -> tuple[dict[str, Any], dict[str, npt.NDArray[Any]]]:
+    """Load a scan written by :py:obj:`BinaryFileCallback`.
+
+    Args:
+        path: the directory that the scan was written to.
+        mmap_mode: passed to :py:obj:`numpy.load`. By default, columns are memory-mapped
+            read-only, so that only the parts of each column which are used are read from
+            disk. :py:obj:`None` to read each column into memory.
+
+    Returns:
+        The header, and a dictionary of each column's values, by field name.
+
+    """
+    path = Path(path)
+    with open(path / HEADER_FILE, encoding="utf-8") as f:
+        header = json.load(f)
+    if header.get("format") != FORMAT_NAME:
+        raise ValueError(f"{path} does not contain a binary scan")
+    columns = {
+        field: np.load(path / column["file"], mmap_mode=mmap_mode, allow_pickle=False)
+        for field, column in header["columns"].items()
+    }
+    return header, columns
@@ -1,7 +1,10 @@
 import logging
+from bisect import bisect_right
 
 import numpy as np
-from bluesky.callbacks import CollectThenCompute
+import numpy.typing as npt
+from bluesky.callbacks import CallbackBase
+from event_model import Event, EventPage, RunStart, RunStop
 
 from ibex_bluesky_core.utils import center_of_mass_of_area_under_curve
 
@@ -9,18 +12,103 @@ logger = logging.getLogger(__name__)
 
 __all__ = ["CentreOfMass"]
 
-
-class CentreOfMass(CollectThenCompute):
+# Relative size of the area under the curve, below which the data is treated as flat.
+_FLAT_AREA_TOLERANCE = 1e-12
+
+
+class _AreaUnderCurve:
+    """Incrementally-updated area under a curve, and its first moment along the x-axis.
+
+    Points are kept sorted by x. The area under each pair of neighbouring points is a
+    trapezoid; its area and moment are summed relative to ``y = 0``, and corrected for the
+    ``min(y)`` baseline when the centre of mass is requested. Adding a point therefore only
+    changes the trapezoids either side of it, even if it changes ``min(y)``.
+
+    Keeping the points sorted still means a list insert, which is O(n) per point. That is a
+    single memmove, which is much cheaper than recalculating the whole curve, even for scans
+    with many thousands of points.
+    """
+
+    def __init__(self) -> None:
+        self.x: list[float] = []
+        self.y: list[float] = []
+        self._area = 0.0
+        self._moment = 0.0
+        self._min_y = float("inf")
+
+    def _add_segment(self, index: int, sign: float) -> None:
+        x0, x1 = self.x[index], self.x[index + 1]
+        y0, y1 = self.y[index], self.y[index + 1]
+        width = x1 - x0
+        self._area += sign * width * (y0 + y1) / 2.0
+        self._moment += sign * width * (y0 * (2.0 * x0 + x1) + y1 * (x0 + 2.0 * x1)) / 6.0
+
+    def insert(self, x: float, y: float) -> None:
+        # Equal x values are kept in the order they arrived, as for a stable sort.
+        index = bisect_right(self.x, x)
+        has_left = index > 0
+        has_right = index < len(self.x)
+        if has_left and has_right:
+            self._add_segment(index - 1, -1.0)
+
+        self.x.insert(index, x)
+        self.y.insert(index, y)
+        self._min_y = min(self._min_y, y)
+
+        if has_left:
+            self._add_segment(index - 1, 1.0)
+        if has_right:
+            self._add_segment(index, 1.0)
+
+    def extend(self, x: npt.ArrayLike, y: npt.ArrayLike) -> None:
+        # Merges many points at once, then sums every trapezoid in one go, which is cheaper
+        # than inserting the points one at a time when there are many of them.
+        new_x = np.asarray(x, dtype=np.float64).reshape(-1)
+        new_y = np.asarray(y, dtype=np.float64).reshape(-1)
+        if len(new_x) == 0:
+            return
+        all_x = np.concatenate([self.x, new_x])
+        all_y = np.concatenate([self.y, new_y])
+        # A stable sort keeps equal x values in the order they arrived, as for insert.
+        order = np.argsort(all_x, kind="stable")
+        all_x, all_y = all_x[order], all_y[order]
+
+        x0, x1 = all_x[:-1], all_x[1:]
+        y0, y1 = all_y[:-1], all_y[1:]
+        width = x1 - x0
+        self._area = float(np.sum(width * (y0 + y1) / 2.0))
+        self._moment = float(np.sum(width * (y0 * (2.0 * x0 + x1) + y1 * (x0 + 2.0 * x1)) / 6.0))
+        self._min_y = min(self._min_y, float(np.min(new_y)))
+        self.x = all_x.tolist()
+        self.y = all_y.tolist()
+
+    def centre_of_mass(self) -> float:
+        # Only valid once at least one point has been inserted.
+        x_min, x_max = self.x[0], self.x[-1]
+        area = self._area - self._min_y * (x_max - x_min)
+        moment = self._moment - self._min_y * (x_max**2 - x_min**2) / 2.0
+        scale = abs(self._area) + abs(self._min_y) * (x_max - x_min)
+        if area <= _FLAT_AREA_TOLERANCE * scale:
+            # If all data was flat, return central x
+            return (x_min + x_max) / 2.0
+        return moment / area
+
+
+class CentreOfMass(CallbackBase):
     """Centre of mass callback."""
 
     def __init__(self, x: str, y: str) -> None:
-        """Compute centre of mass after a run finishes.
+        """Compute centre of mass during, and after, a run.
 
         This callback calculates the centre of mass of the 2D region
         bounded by ``min(y)``, ``min(x)``, ``max(x)``, and straight-line
         segments joining (x, y) data points with their nearest neighbours
         along the x axis.
 
+        Only the x and y values of each point are kept, sorted along the x axis, and the
+        centre of mass is updated incrementally as each point (or event page of points)
+        arrives.
+
         Args:
             x: Name of independent variable in event data
             y: Name of dependent variable in event data
@@ -29,39 +117,81 @@ class CentreOfMass(CollectThenCompute):
         super().__init__()
         self.x: str = x
         self.y: str = y
+        self._curve = _AreaUnderCurve()
         self._result: float | None = None
+        self._missing_field_error: str | None = None
 
     @property
     def result(self) -> float | None:
         """The centre-of-mass calculated by this callback.
 
         The returned position is a :py:obj:`float` along the x-axis, or :py:obj:`None`
-        if no centre of mass has been calculated (for example if the bluesky run has
-        not yet finished).
+        if no centre of mass has been calculated (for example if no points have been
+        received yet). During a run, this is updated after every point.
         """
         return self._result
 
-    def compute(self) -> None:
-        """Calculate statistics at the end of the run.
+    def start(self, doc: RunStart) -> None:
+        """Clear data from any previous run.
 
         :meta private:
         """
-        x_values = []
-        y_values = []
+        self._curve = _AreaUnderCurve()
+        self._result = None
+        self._missing_field_error = None
+        super().start(doc)
+
+    def _has_fields(self, doc: Event | EventPage, doc_type: str) -> bool:
+        # A missing field is reported when the run stops, rather than raising from inside
+        # the running scan. Until then, documents without both fields are skipped.
+        for field in (self.x, self.y):
+            if field not in doc["data"]:
+                if self._missing_field_error is None:
+                    self._missing_field_error = f"{field} is not in {doc_type} document."
+                logger.warning("%s is not in %s document, skipping", field, doc_type)
+                return False
+        return True
+
+    def event(self, doc: Event) -> Event:
+        """Add a point, and update the centre of mass.
 
-        for event in self._events:
-            if self.x not in event["data"]:
-                raise ValueError(f"{self.x} is not in event document.")
+        :meta private:
+        """
+        if not self._has_fields(doc, "event"):
+            return doc
 
-            if self.y not in event["data"]:
-                raise ValueError(f"{self.y} is not in event document.")
+        self._curve.insert(float(doc["data"][self.x]), float(doc["data"][self.y]))
+        self._result = self._curve.centre_of_mass()
+        return doc
 
-            x_values.append(event["data"][self.x])
-            y_values.append(event["data"][self.y])
+    def event_page(self, doc: EventPage) -> EventPage:
+        """Add all of an event page's points, and update the centre of mass once.
 
-        if not x_values:
-            return
+        :meta private:
+        """
+        if not self._has_fields(doc, "event page"):
+            return doc
+
+        self._curve.extend(doc["data"][self.x], doc["data"][self.y])
+        if self._curve.x:
+            self._result = self._curve.centre_of_mass()
+        return doc
+
+    def stop(self, doc: RunStop) -> None:
+        """Recalculate the centre of mass from all of the points in the run.
 
-        x_data = np.array(x_values, dtype=np.float64)
-        y_data = np.array(y_values, dtype=np.float64)
-        (self._result, _) = center_of_mass_of_area_under_curve(x_data, y_data)
+        This avoids any rounding errors accumulated by the incremental calculation. If any
+        event in the run did not contain both the x and y fields, this raises
+        :py:obj:`ValueError` instead.
+
+        :meta private:
+        """
+        if self._missing_field_error is not None:
+            raise ValueError(self._missing_field_error)
+
+        if self._curve.x:
+            (self._result, _) = center_of_mass_of_area_under_curve(
+                np.array(self._curve.x, dtype=np.float64),
+                np.array(self._curve.y, dtype=np.float64),
+            )
+        super().stop(doc)
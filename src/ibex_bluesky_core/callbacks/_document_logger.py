@@ -1,19 +1,108 @@
 """Logs all documents that the BlueSky run engine creates via a callback."""
 
+import gzip
+import logging
+import os
+from io import BufferedIOBase
 from pathlib import Path
 from typing import Any
 
 import orjson
 
+from ibex_bluesky_core.callbacks._background import BackgroundCallback
+
+logger = logging.getLogger(__name__)
+
 log_location = Path("C:\\") / "instrument" / "var" / "logs" / "bluesky" / "raw_documents"
 
 __all__ = ["DocLoggingCallback"]
 
 
+def _log_filename(uid: str, *, compress: bool) -> Path:
+    suffix = ".log.gz" if compress else ".log"
+    return log_location / f"{uid}{suffix}"
+
+
+class _DocumentWriter:
+    """Write documents to a file per run; called on a BackgroundCallback's worker thread."""
+
+    def __init__(self, *, compress: bool, fsync_on_stop: bool) -> None:
+        self.compress = compress
+        self.fsync_on_stop = fsync_on_stop
+
+        self.documents_written = 0
+        self.write_errors = 0
+
+        self._filename: Path | None = None
+        self._handle: BufferedIOBase | None = None
+        self._handle_filename: Path | None = None
+
+    def __call__(self, name: str, document: dict[str, Any]) -> None:
+        if name == "start":
+            self._filename = _log_filename(document["uid"], compress=self.compress)
+        assert self._filename is not None
+
+        to_write: dict[str, Any] = {"type": name, "document": document}
+        try:
+            line = orjson.dumps(
+                to_write, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+            )
+            self._open(self._filename).write(line)
+            self.documents_written += 1
+            if name == "stop":
+                self._close()
+        except Exception:
+            logger.exception("Failed to write %s document to %s", name, self._filename)
+            self.write_errors += 1
+            self._discard()
+
+    def _open(self, filename: Path) -> BufferedIOBase:
+        if self._handle is not None and self._handle_filename == filename:
+            return self._handle
+        self._close()
+        filename.parent.mkdir(parents=True, exist_ok=True)
+        handle: BufferedIOBase
+        if self.compress:
+            handle = gzip.GzipFile(filename, "ab")
+        else:
+            handle = open(filename, "ab")  # noqa: SIM115
+        self._handle = handle
+        self._handle_filename = filename
+        return handle
+
+    def _close(self) -> None:
+        handle, self._handle, self._handle_filename = self._handle, None, None
+        if handle is None:
+            return
+        try:
+            handle.flush()
+            if self.fsync_on_stop:
+                os.fsync(handle.fileno())
+        finally:
+            handle.close()
+
+    def _discard(self) -> None:
+        # Close the file after a failed write, so that it is not left open.
+        handle, self._handle, self._handle_filename = self._handle, None, None
+        if handle is None:
+            return
+        try:
+            handle.close()
+        except Exception:
+            logger.exception("Failed to close %s", handle)
+
+
 class DocLoggingCallback:
     """Logs all documents under log_location, with the file name of their UID (.log)."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        compress: bool = False,
+        fsync_on_stop: bool = False,
+        max_queue_size: int = 10000,
+        stop_timeout_s: float | None = 60.0,
+    ) -> None:
         """Log bluesky documents to line-delimited JSON files.
 
         .. tip::
@@ -23,10 +112,37 @@ class DocLoggingCallback:
             :py:obj:`~ibex_bluesky_core.run_engine.get_run_engine`.
             Manually creating this callback is unnecessary.
 
+        Documents are encoded to JSON and written to file on a background thread, using a
+        :py:obj:`~ibex_bluesky_core.callbacks.BackgroundCallback`. The file for each run is
+        kept open, and buffered, for the duration of that run. When a run stops, this callback
+        waits until every document from that run has been written, and the file has been
+        flushed and closed, before returning.
+
+        Args:
+            compress: whether to write gzip-compressed files (``.log.gz``), rather than
+                uncompressed files (``.log``).
+            fsync_on_stop: whether to ask the operating system to write each file to disk
+                when a run stops, rather than only flushing it.
+            max_queue_size: the maximum number of documents waiting to be written. If the
+                background thread falls this far behind, receiving a new document blocks until
+                there is space in the queue.
+            stop_timeout_s: the maximum time, in seconds, to wait for a run's documents to be
+                written when it stops. :py:obj:`None` to wait indefinitely.
+
         """
         self.current_start_document = None
         self.filename = None
 
+        self.compress = compress
+
+        self.documents_queued = 0
+        """Number of documents received by this callback."""
+
+        self._writer = _DocumentWriter(compress=compress, fsync_on_stop=fsync_on_stop)
+        self._background = BackgroundCallback(
+            self._writer, maxsize=max_queue_size, stop_timeout_s=stop_timeout_s
+        )
+
     def __call__(self, name: str, document: dict[str, Any]) -> None:
         """Is called when a new document needs to be processed. Writes document to a file.
 
@@ -36,19 +152,44 @@ class DocLoggingCallback:
 
         """
         if name == "start":
-            log_location.mkdir(parents=True, exist_ok=True)
-
             self.current_start_document = document["uid"]
-            self.filename = log_location / f"{self.current_start_document}.log"
+            self.filename = _log_filename(self.current_start_document, compress=self.compress)
 
         assert self.filename is not None, "Could not create filename."
         assert self.current_start_document is not None, "Saw a non-start document before a start."
 
-        to_write: dict[str, Any] = {"type": name, "document": document}
+        self._background(name, document)
+        self.documents_queued += 1
 
-        with open(self.filename, "ab") as outfile:
-            outfile.write(
-                orjson.dumps(
-                    to_write, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
-                )
-            )
+    @property
+    def documents_written(self) -> int:
+        """Number of documents written to file."""
+        return self._writer.documents_written
+
+    @property
+    def write_errors(self) -> int:
+        """Number of documents which could not be written to file."""
+        return self._writer.write_errors
+
+    @property
+    def blocked_puts(self) -> int:
+        """Number of documents received while the queue was full."""
+        return self._background.blocked_puts
+
+    @property
+    def max_queue_depth(self) -> int:
+        """Largest number of documents which have been waiting to be written at once."""
+        return self._background.max_queue_depth
+
+    def flush(self, timeout_s: float | None = None) -> bool:
+        """Wait for all documents received so far to be written.
+
+        Args:
+            timeout_s: the maximum time, in seconds, to wait. :py:obj:`None` to wait
+                indefinitely.
+
+        Returns:
+            :py:obj:`True` if all documents were written, :py:obj:`False` on timeout.
+
+        """
+        return self._background.flush(timeout_s)
@@ -3,15 +3,22 @@
 import csv
 import logging
 import os
+import time
+from collections.abc import Callable
 from pathlib import Path
 from stat import S_IRGRP, S_IROTH, S_IRUSR
+from typing import IO, TYPE_CHECKING, Any
 
 from bluesky.callbacks import CallbackBase
 from event_model.documents.event import Event
 from event_model.documents.event_descriptor import EventDescriptor
+from event_model.documents.event_page import EventPage
 from event_model.documents.run_start import RunStart
 from event_model.documents.run_stop import RunStop
 
+if TYPE_CHECKING:
+    from _csv import Writer
+
 from ibex_bluesky_core.callbacks._utils import (
     DATA,
     DATA_KEYS,
@@ -24,10 +31,10 @@ from ibex_bluesky_core.callbacks._utils import (
     TIME,
     UID,
     UNITS,
-    _get_rb_num,
     format_time,
     get_default_output_path,
     get_instrument,
+    get_scan_output_dir,
 )
 
 logger = logging.getLogger(__name__)
@@ -39,15 +46,33 @@ __all__ = ["HumanReadableFileCallback"]
 class HumanReadableFileCallback(CallbackBase):
     """Outputs bluesky runs to human-readable output files in the specified directory path."""
 
-    def __init__(self, fields: list[str], *, output_dir: Path | None, postfix: str = "") -> None:
+    def __init__(
+        self,
+        fields: list[str],
+        *,
+        output_dir: Path | None,
+        postfix: str = "",
+        flush_every_n_events: int | None = 1,
+        flush_interval_s: float | None = None,
+    ) -> None:
         """Write human-readable files for each bluesky run.
 
         If fields are specified, just output those, otherwise output all hinted signals.
 
+        The output file is kept open for the duration of each run, and written through a
+        buffer. The buffer is always flushed, and the file closed, when the run stops. The
+        buffer can additionally be flushed during a run, after a number of events or after an
+        interval of time, so that the file can be inspected while the run is in progress.
+
         Args:
             fields: a list of field names to include in output files
             output_dir: file path into which to write output files
             postfix: optional postfix to append to output file names
+            flush_every_n_events: flush the file after this many events. :py:obj:`None` to not
+                flush based on the number of events.
+            flush_interval_s: flush the file on an event, if at least this many seconds have
+                passed since the file was last flushed. :py:obj:`None` to not flush based on
+                time.
 
         """
         super().__init__()
@@ -57,6 +82,57 @@ class HumanReadableFileCallback(CallbackBase):
         self.descriptors: dict[str, EventDescriptor] = {}
         self.filename: Path | None = None
         self.postfix: str = postfix
+        self.flush_every_n_events = flush_every_n_events
+        self.flush_interval_s = flush_interval_s
+
+        self._outfile: IO[str] | None = None
+        self._writer: Writer | None = None
+        self._formatters: dict[str, list[Callable[[Any], Any]]] = {}
+        self._events_since_flush = 0
+        self._last_flush_time = time.monotonic()
+
+    def _open(self) -> "tuple[IO[str], Writer]":
+        assert self.filename is not None
+        if self._outfile is None or self._writer is None:
+            logger.debug("opening %s", self.filename)
+            self._outfile = open(self.filename, "a", newline="", encoding="utf-8")  # noqa: SIM115
+            self._writer = csv.writer(self._outfile, delimiter=",", lineterminator="\n")
+            self._events_since_flush = 0
+            self._last_flush_time = time.monotonic()
+        return self._outfile, self._writer
+
+    def _close(self) -> None:
+        if self._outfile is not None:
+            logger.debug("closing %s", self.filename)
+            try:
+                self._outfile.close()
+            finally:
+                self._outfile = None
+                self._writer = None
+
+    def _maybe_flush(self, outfile: IO[str], num_events: int = 1) -> None:
+        self._events_since_flush += num_events
+        now = time.monotonic()
+        if (
+            self.flush_every_n_events is not None
+            and self._events_since_flush >= self.flush_every_n_events
+        ) or (
+            self.flush_interval_s is not None
+            and now - self._last_flush_time >= self.flush_interval_s
+        ):
+            outfile.flush()
+            self._events_since_flush = 0
+            self._last_flush_time = now
+
+    def _get_formatters(self, descriptor_id: str) -> list[Callable[[Any], Any]]:
+        formatters = self._formatters.get(descriptor_id)
+        if formatters is None:
+            descriptor_data = self.descriptors[descriptor_id][DATA_KEYS]
+            formatters = [
+                _make_formatter(descriptor_data[field].get(PRECISION)) for field in self.fields
+            ]
+            self._formatters[descriptor_id] = formatters
+        return formatters
 
     def start(self, doc: RunStart) -> None:
         """Start writing an output file.
@@ -69,18 +145,13 @@ class HumanReadableFileCallback(CallbackBase):
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.current_start_document = doc[UID]
 
-        rb_num = _get_rb_num(doc)
-        rb_num_str = rb_num if rb_num == "Unknown RB" else f"RB{rb_num}"
-
         # motors is a tuple, we need to convert to a list to join the two below
         motors = list(doc.get(MOTORS, []))
 
         formatted_time = format_time(doc)
 
         self.filename = (
-            self.output_dir
-            / rb_num_str
-            / "bluesky_scans"
+            get_scan_output_dir(self.output_dir, doc)
             / f"{get_instrument()}{'_' + '_'.join(motors) if motors else ''}_"
             f"{formatted_time}Z{self.postfix}.txt"
         )
@@ -97,8 +168,12 @@ class HumanReadableFileCallback(CallbackBase):
         # make sure the parent directory exists, create it if not
         os.makedirs(self.filename.parent, exist_ok=True)
 
-        with open(self.filename, "a", newline="\n", encoding="utf-8") as outfile:
-            outfile.writelines([f"{key}: {value}\n" for key, value in header_data.items()])
+        # Close any file left open by a previous run which did not stop cleanly.
+        self._close()
+        self._formatters.clear()
+        outfile, _ = self._open()
+        outfile.writelines([f"{key}: {value}\n" for key, value in header_data.items()])
+        outfile.flush()
 
         logger.debug("successfully wrote header in %s", self.filename)
 
@@ -115,6 +190,15 @@ class HumanReadableFileCallback(CallbackBase):
         descriptor_id = doc[UID]
         self.descriptors[descriptor_id] = doc
 
+    def _write_units(self, outfile: IO[str], descriptor_id: str) -> None:
+        # Written before the first event's data.
+        descriptor_data = self.descriptors[descriptor_id][DATA_KEYS]
+        units_line = ",".join(
+            f"{field_name}{f'({descriptor_data[field_name].get(UNITS, None)})' if descriptor_data[field_name].get(UNITS, None) else ''}"  # noqa: E501
+            for field_name in self.fields
+        )
+        outfile.write(f"\n{units_line}\n")
+
     def event(self, doc: Event) -> Event:
         """Append an event's output to the file.
 
@@ -126,44 +210,66 @@ class HumanReadableFileCallback(CallbackBase):
 
         logger.debug("Appending event document %s", doc.get(UID))
 
-        formatted_event_data = {}
         descriptor_id = doc[DESCRIPTOR]
         event_data = doc[DATA]
-        descriptor_data = self.descriptors[descriptor_id][DATA_KEYS]
+        formatters = self._get_formatters(descriptor_id)
+
+        outfile, writer = self._open()
+        if doc[SEQ_NUM] == 1:
+            self._write_units(outfile, descriptor_id)
+        writer.writerow(
+            [
+                formatter(event_data[field])
+                for field, formatter in zip(self.fields, formatters, strict=True)
+            ]
+        )
+        self._maybe_flush(outfile)
+        return doc
+
+    def event_page(self, doc: EventPage) -> EventPage:
+        """Append all of an event page's rows to the file at once.
 
-        for field in self.fields:
-            value = event_data[field]
-            formatted_event_data[field] = (
-                f"{value:.{descriptor_data[field].get(PRECISION)}f}"
-                if descriptor_data[field].get(PRECISION) is not None and isinstance(value, float)
-                else value
-            )
-
-        with open(self.filename, "a", newline="", encoding="utf-8") as outfile:
-            file_delimiter = ","
-            if doc[SEQ_NUM] == 1:
-                # If this is the first event, write out the units before writing event data.
-                units_line = file_delimiter.join(
-                    f"{field_name}{f'({descriptor_data[field_name].get(UNITS, None)})' if descriptor_data[field_name].get(UNITS, None) else ''}"  # noqa: E501
-                    for field_name in self.fields
-                )
-                outfile.write(f"\n{units_line}\n")
-            writer = csv.DictWriter(
-                outfile,
-                fieldnames=formatted_event_data,
-                delimiter=file_delimiter,
-                lineterminator="\n",
-            )
-            writer.writerows([formatted_event_data])
+        :meta private:
+        """
+        if not self.filename:
+            logger.error("File has not been started yet - doing nothing")
+            return doc
+
+        seq_nums = doc[SEQ_NUM]
+        logger.debug("Appending event page with %d events", len(seq_nums))
+        if not seq_nums:
+            return doc
+
+        descriptor_id = doc[DESCRIPTOR]
+        page_data = doc[DATA]
+        formatters = self._get_formatters(descriptor_id)
+
+        outfile, writer = self._open()
+        if seq_nums[0] == 1:
+            self._write_units(outfile, descriptor_id)
+        columns = [
+            map(formatter, page_data[field])
+            for field, formatter in zip(self.fields, formatters, strict=True)
+        ]
+        writer.writerows(zip(*columns, strict=True))
+        self._maybe_flush(outfile, len(seq_nums))
         return doc
 
     def stop(self, doc: RunStop) -> RunStop | None:
-        """Clear descriptors.
+        """Flush and close the output file, and clear descriptors.
 
         :meta private:
         """
         logger.info("Stopping run, clearing descriptors, filename=%s", self.filename)
+        self._close()
         self.descriptors.clear()
+        self._formatters.clear()
         if self.filename is not None:
             os.chmod(self.filename, S_IRUSR | S_IRGRP | S_IROTH)
         return super().stop(doc)
+
+
+def _make_formatter(precision: int | None) -> Callable[[Any], Any]:
+    if precision is None:
+        return lambda value: value
+    return lambda value: f"{value:.{precision}f}" if isinstance(value, float) else value
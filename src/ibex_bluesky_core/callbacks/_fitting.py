@@ -3,28 +3,35 @@
 import csv
 import logging
 import os
+import threading
 import warnings
+from dataclasses import dataclass
 from itertools import zip_longest
 from pathlib import Path
 from stat import S_IRGRP, S_IROTH, S_IRUSR
+from typing import Any, cast
 
 import lmfit
 import numpy as np
 from bluesky.callbacks import CallbackBase, LiveFitPlot
 from bluesky.callbacks import LiveFit as _DefaultLiveFit
 from bluesky.callbacks.core import make_class_safe
-from event_model import Event, EventDescriptor, RunStart, RunStop
+from event_model import Event, EventDescriptor, EventPage, RunStart, RunStop
 from lmfit import Parameter
 from matplotlib.axes import Axes
 from numpy import typing as npt
 
+from ibex_bluesky_core.callbacks._scan_columns import ScanColumns
 from ibex_bluesky_core.callbacks._utils import (
     DATA,
     UID,
-    _get_rb_num,
+    FloatColumn,
+    FloatColumnView,
     format_time,
     get_default_output_path,
     get_instrument,
+    get_scan_output_dir,
+    get_yerr_values,
 )
 from ibex_bluesky_core.fitting import FitMethod
 
@@ -33,11 +40,40 @@ logger = logging.getLogger(__name__)
 __all__ = ["ChainedLiveFit", "LiveFit", "LiveFitLogger"]
 
 
+@dataclass(frozen=True, kw_only=True)
+class _FitRequest:
+    generation: int
+    independent_vars_data: dict[str, npt.NDArray[np.float64]]
+    ydata: npt.NDArray[np.float64]
+    weights: npt.NDArray[np.float64] | None
+
+
+def _weights_from_yerr(yerr: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    # As for individual events, points with zero uncertainty, or with no uncertainty (which is
+    # stored as NaN), have a weight of zero.
+    return np.divide(1.0, yerr, out=np.zeros_like(yerr), where=(yerr != 0) & np.isfinite(yerr))
+
+
+def _page_needs_fit(num_before: int, num_after: int, num_params: int, update_every: int) -> bool:
+    # Whether LiveFit would have updated the fit for any of the points from num_before + 1 to
+    # num_after, had they arrived one at a time: once there are enough points to fit, and then
+    # for every point i where (i - 1) % update_every == 0.
+    if num_after < num_params:
+        return False
+    if num_before < num_params:
+        return True
+    first = num_before + 1
+    next_update = first + (-(first - 1) % update_every)
+    return next_update <= num_after
+
+
 @make_class_safe(logger=logger)  # pyright: ignore (pyright doesn't understand this decorator)
 class LiveFit(_DefaultLiveFit):
     """LiveFit, customized for IBEX."""
 
-    def __init__(
+    update_every: int | None
+
+    def __init__(  # noqa: PLR0913
         self,
         method: FitMethod,
         y: str,
@@ -45,6 +81,8 @@ class LiveFit(_DefaultLiveFit):
         *,
         update_every: int | None = 1,
         yerr: str | None = None,
+        fit_in_background: bool = False,
+        columns: ScanColumns | None = None,
     ) -> None:
         """:py:obj:`bluesky.callbacks.LiveFit`, with support for uncertainties and dynamic guesses.
 
@@ -56,6 +94,15 @@ class LiveFit(_DefaultLiveFit):
         - Support for dynamic fit guesses, as performed by the models defined in
           :py:obj:`ibex_bluesky_core.fitting`.
 
+        - Optionally, running intermediate fits on a background thread, so that the
+          :py:obj:`~bluesky.run_engine.RunEngine` does not wait for fits to complete
+          between points. Only the most recent data is fitted: if new data arrives while a
+          fit is running, any older fits which have not yet started are skipped. Each
+          intermediate fit starts from the parameter values of the previous fit. A final fit
+          is always performed, on the run engine's thread, when the run stops; this final fit
+          uses only the guess function, so its result does not depend on the timing of
+          intermediate fits.
+
         Args:
             method (FitMethod): The FitMethod (Model & Guess) to use when fitting.
             y (str): The name of the dependent variable.
@@ -64,11 +111,31 @@ class LiveFit(_DefaultLiveFit):
             yerr (str or None, optional): Name of field in the Event document
                 that provides standard deviation for each Y value. None meaning
                 do not use uncertainties in fit.
+            fit_in_background (bool, optional): Whether to run intermediate fits on a
+                background thread.
+            columns (ScanColumns or None, optional): Shared scan columns, which must store
+                the same x, y and yerr fields, to read data from instead of storing it in this
+                callback. The :py:obj:`~ibex_bluesky_core.callbacks.ScanColumns` callback must
+                be subscribed before this callback.
 
         """
+        if columns is not None:
+            columns.check_fields(x=x, y=y, yerr=yerr)
         self.method = method
         self.yerr = yerr
-        self.weight_data = []
+        self.weight_data = FloatColumn()
+        self._columns = columns
+        self._yerr_data: FloatColumnView | None = None
+
+        self.fit_in_background = fit_in_background
+        self._fit_condition = threading.Condition()
+        self._pending_fit: _FitRequest | None = None
+        self._fit_generation = 0
+        # Whether data has arrived since the fit was last updated on this thread.
+        self._stale = False
+        self._fit_thread: threading.Thread | None = None
+        self._stop_fit_thread = False
+        self._final_fit = False
 
         super().__init__(
             model=method.model,
@@ -83,26 +150,78 @@ class LiveFit(_DefaultLiveFit):
         :meta private:
         """
         weight = None
-        if self.yerr is not None:
-            try:
-                weight = 1 / doc["data"][self.yerr]
-            except ZeroDivisionError:
+        if self.yerr is not None and self.y in doc["data"]:
+            if self.yerr not in doc["data"]:
                 warnings.warn(
-                    "standard deviation for y is 0, therefore applying weight of 0 on fit",
+                    f"{self.yerr} is not in event, therefore applying weight of 0 on fit",
                     stacklevel=1,
                 )
                 weight = 0.0
+            else:
+                try:
+                    weight = 1 / doc["data"][self.yerr]
+                except ZeroDivisionError:
+                    warnings.warn(
+                        "standard deviation for y is 0, therefore applying weight of 0 on fit",
+                        stacklevel=1,
+                    )
+                    weight = 0.0
 
         self.update_weight(weight)
+        if self.y in doc["data"]:
+            self._stale = True
         super().event(doc)
 
+    def event_page(self, doc: EventPage) -> EventPage:
+        """When an event page is received, update caches, and then update the fit at most once.
+
+        The fit is updated if it would have been updated by any of the page's events, had
+        they been received one at a time.
+
+        :meta private:
+        """
+        if self.y not in doc["data"]:
+            return doc
+
+        num_before = len(self.ydata)
+        self.ydata.extend(doc["data"][self.y])
+        for k, v in self.independent_vars.items():
+            self.independent_vars_data[k].extend(doc["data"][v])
+        if self.yerr is not None:
+            yerr = get_yerr_values(doc, self.yerr, len(self.ydata) - num_before)
+            if self._yerr_data is not None:
+                self._yerr_data.extend(yerr)
+            else:
+                if self.yerr not in doc["data"]:
+                    warnings.warn(
+                        f"{self.yerr} is not in event page, therefore applying weight of 0 on fit",
+                        stacklevel=1,
+                    )
+                elif np.any(yerr == 0):
+                    warnings.warn(
+                        "standard deviation for y is 0, therefore applying weight of 0 on fit",
+                        stacklevel=1,
+                    )
+                self.weight_data.extend(_weights_from_yerr(yerr))
+        self._stale = True
+
+        if self.update_every is not None and _page_needs_fit(
+            num_before, len(self.ydata), len(self.model.param_names), self.update_every
+        ):
+            self.update_fit()
+        return doc
+
     def update_weight(self, weight: float | None = 0.0) -> None:
         """Update uncertainties cache.
 
         :meta private:
         """
-        if self.yerr is not None:
-            self.weight_data.append(weight)
+        if self.yerr is not None and weight is not None:
+            if self._yerr_data is not None:
+                # Only counted: the uncertainty itself is stored in the shared columns.
+                self._yerr_data.append(weight)
+            else:
+                self.weight_data.append(weight)
 
     def can_fit(self) -> bool:
         """Check if enough data points have been collected to fit.
@@ -112,6 +231,53 @@ class LiveFit(_DefaultLiveFit):
         n = len(self.model.param_names)
         return len(self.ydata) >= n
 
+    def _reset(self) -> None:
+        super()._reset()
+        self._stale = False
+        # Store data in float64 columns, rather than lists, so that it can be fitted without
+        # converting it to arrays on every update.
+        self.ydata = self._new_column(self.y)
+        self.independent_vars_data.update(
+            {k: self._new_column(v) for k, v in self.independent_vars.items()}
+        )
+        self.weight_data = FloatColumn()
+        if self._columns is not None and self.yerr is not None:
+            self._yerr_data = self._columns.view(self.yerr)
+
+    def _new_column(self, field: str) -> FloatColumn | FloatColumnView:
+        return FloatColumn() if self._columns is None else self._columns.view(field)
+
+    def _weights(self) -> npt.NDArray[np.float64] | None:
+        if self.yerr is None:
+            return None
+        if self._yerr_data is None:
+            return self.weight_data.values
+        return _weights_from_yerr(self._yerr_data.values)
+
+    def start(self, doc: RunStart) -> None:
+        """Clear data, and discard any background fits from a previous run.
+
+        :meta private:
+        """
+        self._discard_background_fits()
+        super().start(doc)
+
+    def stop(self, doc: RunStop) -> None:
+        """Stop any background fits, and fit all of the data from this run.
+
+        :meta private:
+        """
+        self._stop_background_fits()
+        self._final_fit = True
+        try:
+            if self._stale:
+                self.update_fit()
+        finally:
+            self._final_fit = False
+        # The bluesky LiveFit.stop would refit using its own record of whether the fit is
+        # stale, which does not know about event pages, so is skipped.
+        CallbackBase.stop(self, doc)
+
     def update_fit(self) -> None:
         """Use the guess function with the most recent x and y values after every update.
 
@@ -123,28 +289,138 @@ class LiveFit(_DefaultLiveFit):
                 {len(self.model.param_names)} data points""",
                 stacklevel=1,
             )
+        elif self.fit_in_background and not self._final_fit:
+            self._request_background_fit()
         else:
-            logger.debug("updating guess for %s ", self.method)
-            self.init_guess = self.method.guess(
-                np.array(next(iter(self.independent_vars_data.values()))),
-                np.array(self.ydata),
-                # Calls the guess function on the set of data already collected in the run
-            )
-
-            logger.info("new guess for %s: %s", self.method, self.init_guess)
+            request = self._make_fit_request()
+            self.init_guess = self._guess(request)
+            self.result = self._fit(request, self.init_guess)
+            self._stale = False
+
+    def _make_fit_request(self) -> _FitRequest:
+        # Views of the data collected so far. These are not copied, and are not modified by
+        # later events, so are safe to use while a background fit is running.
+        return _FitRequest(
+            generation=self._fit_generation,
+            independent_vars_data={k: v.values for k, v in self.independent_vars_data.items()},
+            ydata=self.ydata.values,
+            weights=self._weights(),
+        )
 
-            kwargs = {}
-            kwargs.update(self.independent_vars_data)
-            kwargs.update(self.init_guess)
-            self.result = self.model.fit(
-                self.ydata, weights=None if self.yerr is None else self.weight_data, **kwargs
+    def _guess(self, request: _FitRequest) -> dict[str, Parameter]:
+        logger.debug("updating guess for %s ", self.method)
+        init_guess = self.method.guess(
+            next(iter(request.independent_vars_data.values())),
+            request.ydata,
+            # Calls the guess function on the set of data already collected in the run
+        )
+        logger.info("new guess for %s: %s", self.method, init_guess)
+        return init_guess
+
+    def _fit(self, request: _FitRequest, init_guess: dict[str, Parameter]) -> Any:  # noqa: ANN401
+        # Returns an lmfit ModelResult. Typed as Any, like the result attribute of the
+        # (untyped) bluesky LiveFit base class, which this is assigned to.
+        kwargs = {}
+        kwargs.update(request.independent_vars_data)
+        kwargs.update(init_guess)
+        return self.model.fit(request.ydata, weights=request.weights, **kwargs)
+
+    def _request_background_fit(self) -> None:
+        with self._fit_condition:
+            # Replaces any older request which has not started yet.
+            self._pending_fit = self._make_fit_request()
+            self._fit_condition.notify()
+        if self._fit_thread is None:
+            self._fit_thread = threading.Thread(
+                target=self._run_background_fits, name="LiveFit", daemon=True
             )
+            self._fit_thread.start()
+
+    def _discard_background_fits(self) -> None:
+        with self._fit_condition:
+            self._pending_fit = None
+            self._fit_generation += 1
+
+    def _stop_background_fits(self) -> None:
+        # Discards any pending fit, and waits for the background thread to finish any fit which
+        # it has already started (the result of which is also discarded), and then exit.
+        self._discard_background_fits()
+        if self._fit_thread is None:
+            return
+        with self._fit_condition:
+            self._stop_fit_thread = True
+            self._fit_condition.notify()
+        self._fit_thread.join()
+        self._fit_thread = None
+        self._stop_fit_thread = False
+
+    def _run_background_fits(self) -> None:
+        while True:
+            with self._fit_condition:
+                while self._pending_fit is None and not self._stop_fit_thread:
+                    self._fit_condition.wait()
+                if self._pending_fit is None:
+                    # Asked to stop.
+                    return
+                request, self._pending_fit = self._pending_fit, None
+                previous = self.result if request.generation == self._fit_generation else None
+
+            try:
+                result = self._warm_started_fit(request, previous)
+            except Exception:
+                logger.exception("Background fit for %s failed", self.method)
+                continue
+
+            with self._fit_condition:
+                if request.generation == self._fit_generation:
+                    self.result = result
+
+    def _warm_started_fit(self, request: _FitRequest, previous: Any) -> Any:  # noqa: ANN401
+        init_guess = self._guess(request)
+        if previous is not None:
+            # Warm-start from the previous fit's values, keeping any guessed bounds.
+            for name, param in previous.params.items():
+                guess = init_guess.get(name)
+                if isinstance(guess, Parameter):
+                    guess.set(value=param.value)
+                else:
+                    init_guess[name] = param.value
+        return self._fit(request, init_guess)
+
+
+class _LiveFitPlot(LiveFitPlot):
+    """:py:obj:`~bluesky.callbacks.mpl_plotting.LiveFitPlot`, which also handles event pages.
+
+    An event page is passed to the :py:obj:`LiveFit` as a whole, so that it is fitted at most
+    once, and the fit is then drawn once.
+    """
+
+    def event_page(self, doc: EventPage) -> EventPage:
+        livefit = cast(LiveFit, self.livefit)
+        livefit.event_page(doc)
+        if livefit.result is not None:
+            # As for LiveFitPlot.event: evaluate the model at equally-spaced points, across
+            # xlim if given, or otherwise across the range of x measured so far.
+            (x_key,) = livefit.independent_vars.keys()
+            if self._xlim is None:
+                x_data = livefit.independent_vars_data[x_key]
+                xmin, xmax = np.min(x_data), np.max(x_data)
+            else:
+                xmin, xmax = self._xlim
+            x_points = np.linspace(xmin, xmax, self.num_points)
+            kwargs = {x_key: x_points, **livefit.result.values}
+            self.y_data = livefit.result.model.eval(**kwargs)
+            self.x_data = x_points
+            kwargs.update(livefit.result.init_values)
+            self.y_guess = livefit.result.model.eval(**kwargs)
+            self.update_plot()
+        return doc
 
 
 class LiveFitLogger(CallbackBase):
     """Generates files as part of a scan that describe the fit(s) which have been performed."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         livefit: LiveFit,
         y: str,
@@ -152,6 +428,8 @@ class LiveFitLogger(CallbackBase):
         postfix: str,
         output_dir: str | os.PathLike[str] | None,
         yerr: str | None = None,
+        *,
+        columns: ScanColumns | None = None,
     ) -> None:
         """Write data files containing the results of a fit.
 
@@ -163,9 +441,15 @@ class LiveFitLogger(CallbackBase):
             postfix (str): A small string that should be placed at the end of the
                 filename to disambiguate multiple fits and avoid overwriting.
             yerr (str): The name of the signal pointing to y count uncertainties data.
+            columns (ScanColumns or None, optional): Shared scan columns, which must store
+                the same x, y and yerr fields, to read data from instead of storing it in this
+                callback. The :py:obj:`~ibex_bluesky_core.callbacks.ScanColumns` callback must
+                be subscribed before this callback.
 
         """
         super().__init__()
+        if columns is not None:
+            columns.check_fields(x=x, y=y, yerr=yerr)
 
         self.livefit = livefit
         self.postfix = postfix
@@ -176,12 +460,16 @@ class LiveFitLogger(CallbackBase):
         self.y = y
         self.yerr = yerr
 
-        self.x_data = []
-        self.y_data = []
-        self.yerr_data = []
+        self._columns = columns
+        self.x_data = self._new_column(x)
+        self.y_data = self._new_column(y)
+        self.yerr_data = FloatColumn() if yerr is None else self._new_column(yerr)
+
+    def _new_column(self, field: str) -> FloatColumn | FloatColumnView:
+        return FloatColumn() if self._columns is None else self._columns.view(field)
 
     def start(self, doc: RunStart) -> None:
-        """Create the output directory if it doesn't already exist then setting the filename.
+        """Clear data, create the output directory if needed, and set the filename.
 
         Args:
             doc (RunStart): The start bluesky document.
@@ -189,15 +477,15 @@ class LiveFitLogger(CallbackBase):
         :meta private:
 
         """
+        self.x_data.clear()
+        self.y_data.clear()
+        self.yerr_data.clear()
         title_format_datetime = format_time(doc)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.current_start_document = doc[UID]
         file = f"{get_instrument()}_{self.x}_{self.y}_{title_format_datetime}Z{self.postfix}.txt"
 
-        rb_num = _get_rb_num(doc)
-        rb_num_str = rb_num if rb_num == "Unknown RB" else f"RB{rb_num}"
-
-        self.filename = self.output_dir / f"{rb_num_str}" / "bluesky_scans" / file
+        self.filename = get_scan_output_dir(self.output_dir, doc) / file
 
     def event(self, doc: Event) -> Event:
         """Start collecting, y, x, and yerr data.
@@ -216,15 +504,38 @@ class LiveFitLogger(CallbackBase):
         if self.y not in event_data:
             raise OSError(f"{self.y} is not in event document.")
 
+        # Checked before any values are stored, so that the columns stay the same length.
+        if self.yerr is not None and self.yerr not in event_data:
+            raise OSError(f"{self.yerr} is not in event document.")
+
         self.x_data.append(event_data[self.x])
         self.y_data.append(event_data[self.y])
-
         if self.yerr is not None:
-            if self.yerr not in event_data:
-                raise OSError(f"{self.yerr} is not in event document.")
             self.yerr_data.append(event_data[self.yerr])
 
-        return super().event(doc)
+        return doc
+
+    def event_page(self, doc: EventPage) -> EventPage:
+        """Collect y, x, and yerr data from all of an event page's events at once.
+
+        Args:
+            doc: (EventPage): An event page document.
+
+        :meta private:
+
+        """
+        page_data = doc[DATA]
+
+        for field in (self.x, self.y) if self.yerr is None else (self.x, self.y, self.yerr):
+            if field not in page_data:
+                raise OSError(f"{field} is not in event page document.")
+
+        self.x_data.extend(page_data[self.x])
+        self.y_data.extend(page_data[self.y])
+        if self.yerr is not None:
+            self.yerr_data.extend(page_data[self.yerr])
+
+        return doc
 
     def stop(self, doc: RunStop) -> None:
         """Write to the fitting file.
@@ -240,7 +551,7 @@ class LiveFitLogger(CallbackBase):
             return
 
         # Evaluate the model function for each x point
-        kwargs = {"x": np.array(self.x_data)}
+        kwargs = {"x": self.x_data.values}
         kwargs.update(self.livefit.result.values)
         self.y_fit_data = self.livefit.result.model.eval(**kwargs)
 
@@ -337,8 +648,8 @@ class ChainedLiveFit(CallbackBase):
             for y_name, yerr_name in zip_longest(y, yerr or [])
         ]  # if yerrs then create a LiveFit with a yerr else create a LiveFit without a yerr
 
-        self._livefitplots = [
-            LiveFitPlot(livefit=livefit, ax=axis)
+        self._livefitplots: list[LiveFitPlot] = [
+            _LiveFitPlot(livefit=livefit, ax=axis)
             for livefit, axis in zip(self._livefits, ax or [], strict=False)
         ]  # if ax then create a LiveFitPlot with ax else do not create any LiveFitPlots
 
@@ -387,6 +698,29 @@ class ChainedLiveFit(CallbackBase):
 
         :meta private:
 
+        """
+        self._fit_in_turn(doc, "event")
+        return doc
+
+    def event_page(self, doc: EventPage) -> EventPage:
+        """Process event page document for all callbacks, fitting each at most once.
+
+        Args:
+            doc: EventPage document
+
+        :meta private:
+
+        """
+        self._fit_in_turn(doc, "event_page")
+        return doc
+
+    def _fit_in_turn(self, doc: Event | EventPage, method_name: str) -> None:
+        """Pass a document to each fit in turn, using each fit's result as the next guess.
+
+        Args:
+            doc: document to process
+            method_name: Name of the method to call ('event' or 'event_page')
+
         """
         init_guess = {}
 
@@ -409,9 +743,10 @@ class ChainedLiveFit(CallbackBase):
                     livefit.method.guess = guess_func
 
                 if self._livefitplots:
-                    self._livefitplots[self._livefits.index(livefit)].event(doc)
+                    callback = self._livefitplots[self._livefits.index(livefit)]
                 else:
-                    livefit.event(doc)
+                    callback = livefit
+                getattr(callback, method_name)(doc)
 
             finally:
                 livefit.method.guess = rem_guess
@@ -422,8 +757,6 @@ class ChainedLiveFit(CallbackBase):
 
                     init_guess = livefit.result.params
 
-        return doc
-
     def stop(self, doc: RunStop) -> None:
         """Process stop document and update fitting parameters.
 
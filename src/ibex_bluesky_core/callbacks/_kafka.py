@@ -1,11 +1,14 @@
 import logging
 import os
 import socket
+import time
 from typing import Any
 
 import msgpack_numpy
 from bluesky.callbacks import CallbackBase
-from confluent_kafka import Producer
+from confluent_kafka import KafkaError, Message, Producer
+
+from ibex_bluesky_core.callbacks._background import BackgroundCallback
 
 logger = logging.getLogger(__name__)
 
@@ -38,18 +41,60 @@ class KafkaCallback(CallbackBase):
         to be configured manually.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         *,
         bootstrap_servers: list[str] | None = None,
         topic: str | None = None,
         key: str,
         kafka_config: dict[str, Any],
+        linger_ms: int = 50,
+        batch_num_messages: int = 1000,
+        compression_type: str = "lz4",
+        max_queue_size: int = 10000,
+        stop_flush_timeout_s: float = 5.0,
+        poll_interval_s: float = 0.1,
+        produce_timeout_s: float = 5.0,
     ) -> None:
-        super().__init__()
+        """Forward all bluesky documents to Kafka.
+
+        Documents are handed to a background thread, using a
+        :py:obj:`~ibex_bluesky_core.callbacks.BackgroundCallback`, which encodes them,
+        produces them to Kafka and serves delivery reports. Kafka is not considered critical,
+        so the :py:obj:`~bluesky.run_engine.RunEngine` never waits for messages to be
+        delivered: if the background thread falls too far behind, new events are dropped
+        (and logged) rather than waiting. Start, descriptor and stop documents are never
+        dropped.
+
+        When a run stops, the background thread waits for outstanding messages to be
+        delivered, for up to ``stop_flush_timeout_s``, and then exits. A new background
+        thread is started for the next run. :py:obj:`close` does the same part-way through a
+        run.
 
-        self._topic = topic or get_kafka_topic_name()
-        self._key = msgpack_numpy.dumps(key)
+        Args:
+            bootstrap_servers: Kafka brokers to connect to. Defaults to the broker in the
+                ``IBEX_BLUESKY_CORE_KAFKA_BROKER`` environment variable, or the ISIS broker.
+            topic: Kafka topic to produce to. Defaults to
+                :py:obj:`~ibex_bluesky_core.callbacks.get_kafka_topic_name`.
+            key: Kafka message key.
+            kafka_config: additional ``librdkafka`` configuration. Settings given here take
+                priority over ``linger_ms``, ``batch_num_messages`` and ``compression_type``.
+            linger_ms: time, in milliseconds, to wait for further messages before sending a
+                batch to the broker (``linger.ms``).
+            batch_num_messages: maximum number of messages in one batch
+                (``batch.num.messages``).
+            compression_type: compression used for batches (``compression.type``).
+            max_queue_size: maximum number of documents waiting for the background thread.
+            stop_flush_timeout_s: maximum time, in seconds, to wait for outstanding messages to
+                be delivered when a run stops.
+            poll_interval_s: interval, in seconds, at which delivery reports are served while
+                waiting for space in the producer's local queue.
+            produce_timeout_s: maximum time, in seconds, to wait for space in the producer's
+                local queue for a message. If there is still no space (for example, because
+                the broker is unavailable), the document is counted as failed.
+
+        """
+        super().__init__()
 
         if "bootstrap.servers" in kafka_config:
             raise ValueError(
@@ -61,20 +106,155 @@ class KafkaCallback(CallbackBase):
                 os.environ.get("IBEX_BLUESKY_CORE_KAFKA_BROKER", DEFAULT_KAFKA_BROKER)
             ]
 
-        kafka_config["bootstrap.servers"] = ",".join(bootstrap_servers)
+        config = {
+            "linger.ms": linger_ms,
+            "batch.num.messages": batch_num_messages,
+            "compression.type": compression_type,
+            **kafka_config,
+            "bootstrap.servers": ",".join(bootstrap_servers),
+        }
+
+        self._stop_flush_timeout_s = stop_flush_timeout_s
 
-        self._producer = Producer(kafka_config)
+        self.documents_queued = 0
+        """Number of documents received by this callback."""
+
+        self._sender = _KafkaSender(
+            producer=Producer(config),
+            topic=topic or get_kafka_topic_name(),
+            key=msgpack_numpy.dumps(key),
+            stop_flush_timeout_s=stop_flush_timeout_s,
+            poll_interval_s=poll_interval_s,
+            produce_timeout_s=produce_timeout_s,
+        )
+        self._background = BackgroundCallback(
+            self._sender, maxsize=max_queue_size, overflow="drop", drain_on_stop=False
+        )
 
     def __call__(
         self, name: str, doc: dict[str, Any], validate: bool = False
     ) -> tuple[str, dict[str, Any]]:
+        self.documents_queued += 1
+        self._background(name, doc)
+        return name, doc
+
+    @property
+    def documents_delivered(self) -> int:
+        """Number of documents successfully delivered to Kafka."""
+        return self._sender.documents_delivered
+
+    @property
+    def documents_failed(self) -> int:
+        """Number of documents which were dropped, or could not be delivered to Kafka."""
+        return self._sender.documents_failed + self._background.dropped
+
+    def flush(self, timeout_s: float) -> bool:
+        """Wait for all documents received so far to be delivered to Kafka.
+
+        Args:
+            timeout_s: the maximum time, in seconds, to wait.
+
+        Returns:
+            :py:obj:`True` if all documents were delivered, :py:obj:`False` on timeout.
+
+        """
+        return self._background.flush(timeout_s) and self._sender.flush(timeout_s) == 0
+
+    def close(self, timeout_s: float | None = None) -> bool:
+        """Stop the background thread, once it has handled all documents received so far.
+
+        Outstanding messages are then flushed, for up to ``stop_flush_timeout_s``. The
+        background thread also stops after each run's stop document, so this only needs to
+        be called to stop it part-way through a run. If more documents are received
+        afterwards, a new background thread is started.
+
+        Args:
+            timeout_s: the maximum time, in seconds, to wait for the background thread to
+                stop. :py:obj:`None` to wait indefinitely.
+
+        Returns:
+            :py:obj:`True` if the background thread stopped, :py:obj:`False` on timeout.
+
+        """
+        stopped = self._background.close(timeout_s)
+        self._sender.flush(self._stop_flush_timeout_s)
+        return stopped
+
+
+class _KafkaSender:
+    """Encode documents and produce them to Kafka; called on a BackgroundCallback's thread."""
+
+    def __init__(
+        self,
+        *,
+        producer: Producer,
+        topic: str,
+        key: bytes,
+        stop_flush_timeout_s: float,
+        poll_interval_s: float,
+        produce_timeout_s: float,
+    ) -> None:
+        self._producer = producer
+        self._topic = topic
+        self._key = key
+        self._stop_flush_timeout_s = stop_flush_timeout_s
+        self._poll_interval_s = poll_interval_s
+        self._produce_timeout_s = produce_timeout_s
+
+        self.documents_delivered = 0
+        self.documents_failed = 0
+
+    def __call__(self, name: str, doc: dict[str, Any]) -> None:
         try:
             data = msgpack_numpy.dumps([name, doc])
-            self._producer.produce(topic=self._topic, key=self._key, value=data)
+        except Exception:
+            # If we can't encode the document, log and carry on. We don't want
+            # kafka failures to kill a scan - kafka is currently considered
+            # 'non-critical'.
+            logger.exception("Failed to encode %s document for Kafka", name)
+            self.documents_failed += 1
+            return
+
+        self._produce(data)
+        if name == "stop":
+            self.flush(self._stop_flush_timeout_s)
+        self._producer.poll(0)
+
+    def _produce(self, data: bytes) -> None:
+        try:
+            self._produce_blocking(data)
         except Exception:
             # If we can't produce to kafka, log and carry on. We don't want
             # kafka failures to kill a scan - kafka is currently considered
             # 'non-critical'.
             logger.exception("Failed to publish Kafka message")
+            self.documents_failed += 1
 
-        return name, doc
+    def _produce_blocking(self, data: bytes) -> None:
+        deadline = time.monotonic() + self._produce_timeout_s
+        while True:
+            try:
+                self._producer.produce(
+                    topic=self._topic, key=self._key, value=data, on_delivery=self._on_delivery
+                )
+                return
+            except BufferError:
+                if time.monotonic() >= deadline:
+                    raise
+                # The producer's local queue is full - serve delivery reports to make space.
+                self._producer.poll(self._poll_interval_s)
+
+    def flush(self, timeout_s: float) -> int:
+        remaining = self._producer.flush(timeout_s)
+        if remaining:
+            logger.warning(
+                "%d Kafka messages not delivered after waiting %ss", remaining, timeout_s
+            )
+        return remaining
+
+    def _on_delivery(self, err: KafkaError | None, msg: Message) -> None:
+        if err is None:
+            self.documents_delivered += 1
+        else:
+            self.documents_failed += 1
+            logger.error("Failed to deliver Kafka message to %s: %s", msg.topic(), err)
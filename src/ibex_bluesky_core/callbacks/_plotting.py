@@ -3,25 +3,37 @@
 import logging
 import os
 import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
 from stat import S_IRGRP, S_IROTH, S_IRUSR
-from typing import Any
+from typing import Any, cast
 
 import matplotlib
+import matplotlib.image
 import matplotlib.pyplot as plt
 import numpy as np
 import numpy.typing as npt
 from bluesky.callbacks import LivePlot as _DefaultLivePlot
 from bluesky.callbacks.core import get_obj_fields, make_class_safe
 from bluesky.callbacks.mpl_plotting import QtAwareCallback
-from event_model.documents import Event, RunStart, RunStop
+from event_model.documents import Event, EventPage, RunStart, RunStop
 from matplotlib.axes import Axes
+from matplotlib.backend_bases import FigureCanvasBase, TimerBase
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import QuadMesh
+from matplotlib.figure import Figure
 
+from ibex_bluesky_core.callbacks._scan_columns import ScanColumns
 from ibex_bluesky_core.callbacks._utils import (
-    _get_rb_num,
+    FloatColumn,
+    FloatColumnView,
     format_time,
     get_default_output_path,
     get_instrument,
+    get_scan_output_dir,
+    get_yerr_values,
 )
 
 logger = logging.getLogger(__name__)
@@ -39,6 +51,85 @@ def show_plot() -> None:
         plt.show()
 
 
+class _RedrawThrottle:
+    """Limit the rate of redraws, drawing any skipped redraw once enough time has passed.
+
+    When a redraw is skipped, a single-shot timer is started on the figure's canvas, which
+    calls ``flush`` once the next redraw is allowed. This means that the last points of a
+    burst are drawn even if no further events arrive for a long time (for example, during a
+    long count). The timer runs in the GUI event loop, so does nothing with non-interactive
+    backends; the plot is then redrawn by the next event, or when the run stops.
+    """
+
+    def __init__(
+        self,
+        max_rate_hz: float | None,
+        get_canvas: Callable[[], FigureCanvasBase],
+        flush: Callable[[], None],
+    ) -> None:
+        self.max_rate_hz = max_rate_hz
+        self.pending = False
+        self._get_canvas = get_canvas
+        self._flush = flush
+        self._last_redraw = -float("inf")
+        self._timer: TimerBase | None = None
+
+    def reset(self) -> None:
+        self._cancel()
+        self.pending = False
+        self._last_redraw = -float("inf")
+
+    def should_redraw(self, force: bool = False) -> bool:
+        now = time.monotonic()
+        if (
+            not force
+            and self.max_rate_hz is not None
+            and now - self._last_redraw < 1 / self.max_rate_hz
+        ):
+            self.pending = True
+            self._schedule(self._last_redraw + 1 / self.max_rate_hz - now)
+            return False
+        self._cancel()
+        self._last_redraw = now
+        self.pending = False
+        return True
+
+    def _schedule(self, delay_s: float) -> None:
+        if self._timer is not None:
+            return
+        self._timer = self._get_canvas().new_timer(interval=max(1, round(delay_s * 1000)))
+        self._timer.single_shot = True
+        self._timer.add_callback(self._on_timer)
+        self._timer.start()
+
+    def _cancel(self) -> None:
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        if self.pending:
+            try:
+                self._flush()
+            except Exception:
+                logger.exception("Failed to draw plot")
+
+
+def _centres_to_edges(centres: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    # Equivalent to the edges calculated by pcolormesh for "nearest" shading.
+    if len(centres) < 2:  # noqa: PLR2004
+        return np.concatenate((centres, centres))
+    half_widths = np.diff(centres) * 0.5
+    return np.concatenate(
+        (
+            [centres[0] - half_widths[0]],
+            centres[:-1] + half_widths,
+            [centres[-1] + half_widths[-1]],
+        )
+    )
+
+
 @make_class_safe(logger=logger)  # pyright: ignore (pyright doesn't understand this decorator)
 class LivePlot(_DefaultLivePlot):
     """Live plot, customized for IBEX."""
@@ -50,6 +141,8 @@ class LivePlot(_DefaultLivePlot):
         yerr: str | None = None,
         *args: Any,  # noqa: ANN401
         update_on_every_event: bool = True,
+        max_redraw_rate_hz: float | None = 5.0,
+        columns: ScanColumns | None = None,
         **kwargs: Any,  # noqa: ANN401
     ) -> None:
         """:py:obj:`bluesky.callbacks.mpl_plotting.LivePlot` with support for uncertainties.
@@ -60,6 +153,9 @@ class LivePlot(_DefaultLivePlot):
         - Support for rendering uncertainties as error-bars on the plot.
         - Support for automatically calling :py:obj:`matplotlib.pyplot.show` when needed,
           if using the IBEX matplotlib backend.
+        - Limiting the rate at which the plot is redrawn, so that plotting does not slow down
+          fast scans. Events arriving faster than this rate are drawn together on the next
+          redraw, and the plot is always redrawn when the run stops.
 
         Args:
             y (str): The name of the dependent variable.
@@ -69,70 +165,163 @@ class LivePlot(_DefaultLivePlot):
             *args: As per :py:obj:`bluesky.callbacks.mpl_plotting.LivePlot`
             update_on_every_event (bool, optional): Whether to update plot every event,
                 or just at the end.
+            max_redraw_rate_hz (float or None, optional): The maximum rate, in Hz, at which
+                the plot is redrawn during a run. None to redraw on every event.
+            columns (ScanColumns or None, optional): Shared scan columns, which must store
+                the same x, y and yerr fields, to read data from instead of storing it in this
+                callback. The :py:obj:`~ibex_bluesky_core.callbacks.ScanColumns` callback must
+                be subscribed before this callback.
             **kwargs: As per :py:obj:`bluesky.callbacks.mpl_plotting.LivePlot`
 
         """
         self.update_on_every_event = update_on_every_event
+        self._throttle = _RedrawThrottle(
+            max_redraw_rate_hz, self._get_canvas, lambda: self.update_plot(force=True)
+        )
         super().__init__(y=y, x=x, *args, **kwargs)  # noqa: B026
         if yerr is not None:
             self.yerr, *_others = get_obj_fields([yerr])
         else:
             self.yerr = None
-        self.yerr_data = []
+        if columns is not None:
+            # The base class only sets self.x and self.y when the first run starts.
+            x_field = "seq_num" if x is None else get_obj_fields([x])[0]
+            columns.check_fields(x=x_field, y=get_obj_fields([y])[0], yerr=self.yerr)
+        self._columns = columns
+        self.yerr_data = self._new_yerr_column()
+        self._yerr_segments: list[tuple[tuple[float, float], tuple[float, float]]] = []
 
         self._mpl_errorbar_container = None
 
     def event(self, doc: Event) -> None:
-        """Process an event document (delegate to superclass, then show the plot).
+        """Process an event document (delegate to superclass, which updates the plot).
 
         :meta private:
         """
-        new_yerr = None if self.yerr is None else doc["data"][self.yerr]
+        new_yerr = None
+        # Set by the base class when the run starts.
+        if self.yerr is not None and self.y in doc["data"]:  # pyright: ignore [reportAttributeAccessIssue]
+            # As in the shared scan columns, a missing uncertainty is NaN (and is not drawn).
+            new_yerr = doc["data"].get(self.yerr, np.nan)
         self.update_yerr(new_yerr)
         super().event(doc)
-        if self.update_on_every_event:
-            show_plot()
 
-    def update_plot(self, force: bool = False) -> None:
-        """Create error bars if needed, then update plot.
+    def event_page(self, doc: EventPage) -> EventPage:
+        """Process an event page, adding all of its points and then updating the plot once.
 
         :meta private:
         """
-        if self.update_on_every_event or force:
-            if self.yerr is not None:
-                if self._mpl_errorbar_container is not None:
-                    # Remove old error bars before drawing new ones
-                    self._mpl_errorbar_container.remove()
-                self._mpl_errorbar_container = self.ax.errorbar(  # type: ignore
-                    x=self.x_data, y=self.y_data, yerr=self.yerr_data, fmt="none"
+        # Set by the base class when the run starts.
+        x, y, epoch = self.x, self.y, self._epoch  # pyright: ignore [reportAttributeAccessIssue]
+        data = doc["data"]
+        if y not in data:
+            # wrong event stream, skip it
+            return doc
+        if x in data:
+            new_x = np.asarray(data[x], dtype=np.float64)
+        elif x in {"time", "seq_num"}:
+            new_x = np.asarray(doc[x], dtype=np.float64)
+        else:
+            return doc
+        new_y = np.asarray(data[y], dtype=np.float64)
+
+        if x == "time" and epoch == "run":
+            new_x -= self._epoch_offset
+
+        self.x_data.extend(new_x)
+        self.y_data.extend(new_y)
+        if self.yerr is not None:
+            new_yerr = get_yerr_values(doc, self.yerr, len(new_y))
+            self.yerr_data.extend(new_yerr)
+            self._yerr_segments.extend(
+                ((x, y - yerr), (x, y + yerr))
+                for x, y, yerr in zip(
+                    new_x.tolist(), new_y.tolist(), new_yerr.tolist(), strict=True
                 )
+            )
+        self.update_plot()
+        return doc
+
+    def update_caches(self, x: float, y: float) -> None:
+        """Update x and y data, and the error bar which will be drawn for this point.
+
+        :meta private:
+        """
+        super().update_caches(x, y)
+        if self.yerr is not None:
+            yerr = self.yerr_data[-1]
+            self._yerr_segments.append(((x, y - yerr), (x, y + yerr)))
+
+    def update_plot(self, force: bool = False) -> None:
+        """Update error bars and plot, and show the plot.
 
-            super().update_plot()
+        Redraws are skipped if the previous redraw was too recent, unless ``force`` is set.
+
+        :meta private:
+        """
+        if not (self.update_on_every_event or force) or not self._throttle.should_redraw(force):
+            return
+
+        if self.yerr is not None:
+            self._update_errorbars()
+        super().update_plot()
+        show_plot()
+
+    def _update_errorbars(self) -> None:
+        if self._mpl_errorbar_container is None:
+            self._mpl_errorbar_container = self.ax.errorbar(  # type: ignore
+                x=self.x_data, y=self.y_data, yerr=self.yerr_data.values, fmt="none"
+            )
+        else:
+            # Move the existing error bars, rather than removing and recreating them.
+            (barlines,) = self._mpl_errorbar_container.lines[2]
+            barlines.set_segments(self._yerr_segments)
 
     def update_yerr(self, yerr: float | None) -> None:
         """Update uncertainties data.
 
         :meta private:
         """
-        self.yerr_data.append(yerr)
+        if yerr is not None:
+            self.yerr_data.append(yerr)
 
     def start(self, doc: RunStart) -> None:
         """Process a start document (delegate to superclass, then show the plot).
 
         :meta private:
         """
+        if self._mpl_errorbar_container is not None:
+            # Remove error bars from any previous run
+            self._mpl_errorbar_container.remove()
+            self._mpl_errorbar_container = None
+        self.yerr_data = self._new_yerr_column()
+        self._yerr_segments = []
+        self._throttle.reset()
         super().start(doc)
+        if self._columns is not None:
+            # Plot against time relative to the start of the run, so need a separate x column.
+            if self._columns.x != "time":
+                self.x_data = self._columns.view(self._columns.x)
+            self.y_data = self._columns.view(self._columns.y)
         show_plot()
 
+    def _get_canvas(self) -> FigureCanvasBase:
+        # Set by the base class when the run starts.
+        return cast(Figure, self.ax.figure).canvas  # pyright: ignore [reportAttributeAccessIssue]
+
+    def _new_yerr_column(self) -> FloatColumn | FloatColumnView:
+        if self._columns is None or self.yerr is None:
+            return FloatColumn()
+        return self._columns.view(self.yerr)
+
     def stop(self, doc: RunStop) -> None:
-        """Process a stop document (delegate to superclass, then show the plot).
+        """Process a stop document (delegate to superclass, then show the final plot).
 
         :meta private:
         """
         super().stop(doc)
-        if not self.update_on_every_event:
+        if self._throttle.pending or not self.update_on_every_event:
             self.update_plot(force=True)
-            show_plot()
 
 
 class LivePColorMesh(QtAwareCallback):
@@ -146,6 +335,7 @@ class LivePColorMesh(QtAwareCallback):
         x_coord: npt.NDArray[np.float64],
         ax: Axes,
         x_name: str | None = None,
+        max_redraw_rate_hz: float | None = 5.0,
         **kwargs: Any,  # noqa: ANN401
     ) -> None:
         """Live :py:obj:`PColorMesh<matplotlib.pyplot.pcolormesh>`-based heatmap.
@@ -154,6 +344,9 @@ class LivePColorMesh(QtAwareCallback):
         signal is therefore expected to contain array data, which should be of the same
         length for every measurement.
 
+        Rows are stored in a preallocated buffer, which grows as needed, and the existing
+        heatmap is updated in-place on each redraw, rather than being recreated.
+
         Args:
             y: the name of the signal appearing along the y-axis.
             x: the name of the signal appearing along the x-axis. This signal is
@@ -163,30 +356,52 @@ class LivePColorMesh(QtAwareCallback):
             ax: a set of :py:obj:`~matplotlib.axes.Axes` on which to plot.
             x_name: A display name for the x-axis. Defaults to the same as :code:`x`
                 if not provided.
+            max_redraw_rate_hz: The maximum rate, in Hz, at which the heatmap is redrawn
+                during a run. None to redraw on every event.
             **kwargs: Arbitrary keyword arguments are passed through to
-                :py:obj:`matplotlib.pyplot.pcolormesh`
+                :py:obj:`matplotlib.pyplot.pcolormesh`. Cells are always centred on their
+                coordinates, so only ``"auto"`` or ``"nearest"`` shading is supported.
 
         """
         super().__init__(use_teleporter=kwargs.pop("use_teleporter", None))
-        self.__setup_lock = threading.Lock()
-        self.__setup_event = threading.Event()
-        self._data: npt.NDArray[np.float64] | None = None
+        shading = kwargs.pop("shading", "nearest")
+        if shading not in {"auto", "nearest"}:
+            raise ValueError(f"LivePColorMesh does not support '{shading}' shading")
+
+        self._buffer: npt.NDArray[np.float64] = np.empty((0, len(x_coord)))
+        self._num_rows = 0
+        self._vmin = float("inf")
+        self._vmax = -float("inf")
+        self._mesh: QuadMesh | None = None
+        self._throttle = _RedrawThrottle(
+            max_redraw_rate_hz, self._get_canvas, lambda: self.update_plot(force=True)
+        )
         self._x: str = x
         self._y: str = y
         self._y_coords: list[float] = []
         self._x_name: str = x if x_name is None else x_name
         self._x_coords: npt.NDArray[np.float64] = x_coord
+        self._x_edges = _centres_to_edges(np.asarray(x_coord, dtype=np.float64))
 
         self.ax: Axes = ax
         self.kwargs = kwargs
 
+    @property
+    def _data(self) -> npt.NDArray[np.float64]:
+        return self._buffer[: self._num_rows]
+
     def start(self, doc: RunStart) -> RunStart | None:
         """Start a new plot (clear any old data).
 
         :meta private:
         """
         # The doc is not used; we just use the signal that a new run began.
-        self._data = None
+        self._buffer = np.empty((0, len(self._x_coords)))
+        self._num_rows = 0
+        self._vmin = float("inf")
+        self._vmax = -float("inf")
+        self._mesh = None
+        self._throttle.reset()
         self._y_coords = []
 
         return super().start(doc)
@@ -196,42 +411,122 @@ class LivePColorMesh(QtAwareCallback):
 
         :meta private:
         """
-        new_x = doc["data"][self._x]
+        new_x = np.asarray(doc["data"][self._x], dtype=np.float64)
         new_y = doc["data"][self._y]
 
-        if self._data is None:
-            self._data = np.asarray(new_x).reshape((1, len(new_x)))
-        else:
-            self._data = np.vstack((self._data, np.asarray(new_x)))
-
+        if self._num_rows == len(self._buffer):
+            self._grow()
+        self._buffer[self._num_rows] = new_x
+        self._num_rows += 1
         self._y_coords.append(new_y)
 
+        if not np.all(np.isnan(new_x)):
+            self._vmin = min(self._vmin, float(np.nanmin(new_x)))
+            self._vmax = max(self._vmax, float(np.nanmax(new_x)))
+
         self.update_plot()
-        return super().event(doc)
+        return doc
 
-    def update_plot(self) -> None:
-        """Redraw the heatmap.
+    def event_page(self, doc: EventPage) -> EventPage:
+        """Add one row to the heatmap for each event in the page, and then redraw once.
 
         :meta private:
         """
-        assert self._data is not None
-        assert self.ax is not None
+        new_rows = np.asarray(doc["data"][self._x], dtype=np.float64).reshape(
+            -1, len(self._x_coords)
+        )
+        if len(new_rows) == 0:
+            return doc
 
+        while self._num_rows + len(new_rows) > len(self._buffer):
+            self._grow()
+        self._buffer[self._num_rows : self._num_rows + len(new_rows)] = new_rows
+        self._num_rows += len(new_rows)
+        self._y_coords.extend(doc["data"][self._y])
+
+        if not np.all(np.isnan(new_rows)):
+            self._vmin = min(self._vmin, float(np.nanmin(new_rows)))
+            self._vmax = max(self._vmax, float(np.nanmax(new_rows)))
+
+        self.update_plot()
+        return doc
+
+    def stop(self, doc: RunStop) -> RunStop | None:
+        """Redraw the heatmap if any rows have not been drawn yet.
+
+        :meta private:
+        """
+        if self._throttle.pending:
+            self.update_plot(force=True)
+        return super().stop(doc)
+
+    def _get_canvas(self) -> FigureCanvasBase:
+        return cast(Figure, self.ax.figure).canvas
+
+    def _grow(self) -> None:
+        # Double the capacity, so that the cost of copying is amortised over many rows.
+        # Unfilled rows are NaN, which are not drawn.
+        buffer = np.full((max(16, 2 * len(self._buffer)), len(self._x_coords)), np.nan)
+        buffer[: self._num_rows] = self._data
+        self._buffer = buffer
+        # The heatmap's shape depends on the buffer's capacity, so must be recreated.
+        self._mesh = None
+
+    def _create_mesh(self) -> QuadMesh:
         self.ax.clear()
         self.ax.set_xlabel(self._x_name)
         self.ax.set_ylabel(self._y)
-        self.ax.pcolormesh(
-            self._x_coords,
-            self._y_coords,
-            self._data,
-            vmin=float(np.min(self._data)),
-            vmax=float(np.max(self._data)),
+        return self.ax.pcolormesh(
+            self._x_edges,
+            np.zeros(len(self._buffer) + 1),
+            self._buffer,
+            shading="flat",
             **self.kwargs,
         )
+
+    def update_plot(self, force: bool = False) -> None:
+        """Redraw the heatmap.
+
+        Redraws are skipped if the previous redraw was too recent, unless ``force`` is set.
+
+        :meta private:
+        """
+        assert self._num_rows > 0
+        assert self.ax is not None
+
+        if not self._throttle.should_redraw(force):
+            return
+
+        if self._mesh is None:
+            self._mesh = self._create_mesh()
+
+        # Rows which have not been filled yet have zero height, at the edge of the last row.
+        y_edges = _centres_to_edges(np.asarray(self._y_coords, dtype=np.float64))
+        # get_coordinates returns the mesh's own coordinate array, which is modified in-place.
+        coordinates = cast(npt.NDArray[np.float64], self._mesh.get_coordinates())
+        coordinates[: len(y_edges), :, 1] = y_edges[:, np.newaxis]
+        coordinates[len(y_edges) :, :, 1] = y_edges[-1]
+
+        self._mesh.set_array(self._buffer)
+        if self._vmin <= self._vmax:
+            self._mesh.set_clim(self._vmin, self._vmax)
+
+        self.ax.set_xlim(float(np.min(self._x_edges)), float(np.max(self._x_edges)))
+        y_min, y_max = float(np.min(y_edges)), float(np.max(y_edges))
+        if y_min < y_max:
+            self.ax.set_ylim(y_min, y_max)
+
         self.ax.figure.canvas.draw_idle()  # type: ignore
         show_plot()
 
 
+@dataclass(frozen=True, kw_only=True)
+class _PNGExport:
+    filename: Path
+    rgba: npt.NDArray[np.uint8]
+    dpi: float
+
+
 class PlotPNGSaver(QtAwareCallback):
     """Save plots to PNG files on a run end."""
 
@@ -242,15 +537,25 @@ class PlotPNGSaver(QtAwareCallback):
         ax: Axes,
         postfix: str,
         output_dir: str | os.PathLike[str] | None = None,
+        *,
+        save_in_background: bool = False,
     ) -> None:
         """Save plots to PNG files on a run end.
 
+        By default, the PNG file is written before the run finishes. If ``save_in_background``
+        is set, the plot is instead copied into an uncompressed image when the run stops, and
+        that image is then encoded as a PNG and written to file by a background thread, which
+        exits once the file is written. This means that the next plan does not have to wait
+        for a slow write, for example to a network share. Use :py:obj:`flush` to wait for any
+        files still being written. Python also waits for them to be written before exiting.
+
         Args:
             x: The name of the signal for x.
             y: The name of the signal for y.
             ax: The subplot to save to a file.
             postfix: The file postfix.
             output_dir: The output directory for PNGs.
+            save_in_background: Whether to write PNG files on a background thread.
 
         """
         super().__init__()
@@ -260,14 +565,16 @@ class PlotPNGSaver(QtAwareCallback):
         self.postfix = postfix
         self.output_dir = Path(output_dir or get_default_output_path())
         self.filename = None
+        self.save_in_background = save_in_background
+
+        self.write_errors = 0
+        """Number of PNG files which could not be written in the background."""
+
+        self._threads: list[threading.Thread] = []
 
     def start(self, doc: RunStart) -> None:
-        rb_num = _get_rb_num(doc)
-        rb_num_str = rb_num if rb_num == "Unknown RB" else f"RB{rb_num}"
         self.filename = (
-            self.output_dir
-            / f"{rb_num_str}"
-            / "bluesky_scans"
+            get_scan_output_dir(self.output_dir, doc)
             / f"{get_instrument()}_{self.x}_{self.y}_{format_time(doc)}Z{self.postfix}.png"
         )
 
@@ -283,6 +590,52 @@ class PlotPNGSaver(QtAwareCallback):
         if self.filename is None:
             raise ValueError("No filename specified for plot PNG")
 
+        export = self._copy_figure(self.filename) if self.save_in_background else None
+        if export is not None:
+            thread = threading.Thread(target=self._write, args=(export,), name="PlotPNGSaver")
+            thread.start()
+            self._threads = [t for t in self._threads if t.is_alive()]
+            self._threads.append(thread)
+            return
+
         self.filename.parent.mkdir(parents=True, exist_ok=True)
         self.ax.figure.savefig(self.filename, format="png")  # pyright: ignore [reportAttributeAccessIssue]
         os.chmod(self.filename, S_IRUSR | S_IRGRP | S_IROTH)
+
+    def flush(self, timeout_s: float | None = None) -> bool:
+        """Wait for all PNG files being written in the background to be written.
+
+        Args:
+            timeout_s: the maximum time, in seconds, to wait. :py:obj:`None` to wait
+                indefinitely.
+
+        Returns:
+            :py:obj:`True` if all files were written, :py:obj:`False` on timeout.
+
+        """
+        deadline = None if timeout_s is None else time.monotonic() + timeout_s
+        for thread in self._threads:
+            thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        self._threads = [t for t in self._threads if t.is_alive()]
+        return not self._threads
+
+    def _copy_figure(self, filename: Path) -> _PNGExport | None:
+        # Render to raw RGBA, which is much faster than encoding a PNG. Only Agg-based
+        # canvases (which includes the Qt and Tk canvases) can render to a buffer.
+        figure = cast(Figure, self.ax.figure)
+        canvas = figure.canvas
+        if not isinstance(canvas, FigureCanvasAgg):
+            logger.debug("Cannot copy %s in the background, saving it directly", type(canvas))
+            return None
+        buffer, (width, height) = canvas.print_to_buffer()
+        rgba = np.frombuffer(buffer, dtype=np.uint8).reshape((height, width, 4))
+        return _PNGExport(filename=filename, rgba=rgba, dpi=figure.dpi)
+
+    def _write(self, export: _PNGExport) -> None:
+        try:
+            export.filename.parent.mkdir(parents=True, exist_ok=True)
+            matplotlib.image.imsave(export.filename, export.rgba, format="png", dpi=export.dpi)
+            os.chmod(export.filename, S_IRUSR | S_IRGRP | S_IROTH)
+        except Exception:
+            logger.exception("Failed to write plot PNG to %s", export.filename)
+            self.write_errors += 1
@@ -0,0 +1,132 @@
+"""Columns of scan data, shared between callbacks."""
+
+import logging
+from typing import Any
+
+import numpy as np
+from bluesky.callbacks import CallbackBase
+from event_model import Event, EventPage, RunStart
+
+from ibex_bluesky_core.callbacks._utils import DATA, FloatColumn, FloatColumnView, get_yerr_values
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["ScanColumns"]
+
+# Fields which may be plotted, which are not in the event's data.
+_EVENT_FIELDS = ("time", "seq_num")
+
+
+def _get_value(doc: Event | EventPage, field: str) -> Any:  # noqa: ANN401
+    # A value from an event, or a list of values from an event page.
+    if field in doc[DATA]:
+        return doc[DATA][field]
+    if field in _EVENT_FIELDS:
+        return doc[field]
+    return None
+
+
+class ScanColumns(CallbackBase):
+    """Columns of x, y and (optionally) y uncertainty data, shared between callbacks."""
+
+    def __init__(self, *, x: str, y: str, yerr: str | None = None) -> None:
+        """Columns of x, y and (optionally) y uncertainty data, shared between callbacks.
+
+        Each value is extracted from the event document, and stored, once. Callbacks which
+        are given this object, such as :py:obj:`~ibex_bluesky_core.callbacks.LiveFit`,
+        :py:obj:`~ibex_bluesky_core.callbacks.LiveFitLogger` and
+        :py:obj:`~ibex_bluesky_core.callbacks.LivePlot`, then read these columns through
+        views rather than storing their own copies of the data.
+
+        This callback must be subscribed before any callbacks which use it, so that each
+        event's values are stored before they are read. Events which do not contain both
+        ``x`` and ``y`` (for example, events from other streams) are ignored, as they are by
+        the callbacks which use these columns. If an event does not contain ``yerr``, its
+        uncertainty is stored as NaN, so that every column stays the same length. As for
+        :py:obj:`~ibex_bluesky_core.callbacks.LivePlot`, ``x`` may be ``"time"`` or
+        ``"seq_num"``, which are taken from the event itself.
+
+        Args:
+            x: The name of the independent variable.
+            y: The name of the dependent variable.
+            yerr: The name of the uncertainty on the dependent variable, if any.
+
+        """
+        super().__init__()
+        self.x = x
+        self.y = y
+        self.yerr = yerr
+        fields = [x, y] if yerr is None else [x, y, yerr]
+        self._columns = {field: FloatColumn() for field in fields}
+
+    def __getitem__(self, field: str) -> FloatColumn:
+        """Get the column for a field, containing all values collected so far in this run."""
+        return self._columns[field]
+
+    def check_fields(self, *, x: str, y: str, yerr: str | None) -> None:
+        """Check that a callback using these columns uses the same fields.
+
+        Raises:
+            ValueError: if any of the fields differ.
+
+        """
+        if (x, y, yerr) != (self.x, self.y, self.yerr):
+            raise ValueError(
+                f"Scan columns store x={self.x}, y={self.y}, yerr={self.yerr}, "
+                f"but callback uses x={x}, y={y}, yerr={yerr}"
+            )
+
+    def view(self, field: str) -> FloatColumnView:
+        """Make a view of the column for a field, to use in place of a callback's own column.
+
+        Args:
+            field: The name of the field, which must be one of this object's ``x``, ``y``
+                or ``yerr`` fields.
+
+        Raises:
+            ValueError: if this object does not store ``field``.
+
+        """
+        if field not in self._columns:
+            raise ValueError(f"{field} is not stored in these scan columns")
+        return FloatColumnView(self._columns[field])
+
+    def start(self, doc: RunStart) -> None:
+        """Clear the columns for this run.
+
+        Arrays previously returned by each column's ``values`` are unaffected. Views of the
+        columns must be cleared (or replaced) before they are used again.
+
+        :meta private:
+        """
+        for column in self._columns.values():
+            column.clear()
+        super().start(doc)
+
+    def event(self, doc: Event) -> Event:
+        """Append this event's values to the columns.
+
+        :meta private:
+        """
+        x, y = _get_value(doc, self.x), _get_value(doc, self.y)
+        if x is not None and y is not None:
+            self._columns[self.x].append(x)
+            self._columns[self.y].append(y)
+            if self.yerr is not None:
+                self._columns[self.yerr].append(doc[DATA].get(self.yerr, np.nan))
+        # Returning the event (rather than NotImplemented, from the base class) stops
+        # event_model from also passing it to event_page.
+        return doc
+
+    def event_page(self, doc: EventPage) -> EventPage:
+        """Append this event page's values to the columns, a whole array at a time.
+
+        :meta private:
+        """
+        x, y = _get_value(doc, self.x), _get_value(doc, self.y)
+        if x is not None and y is not None:
+            self._columns[self.x].extend(x)
+            self._columns[self.y].extend(y)
+            if self.yerr is not None:
+                self._columns[self.yerr].extend(get_yerr_values(doc, self.yerr, len(y)))
+        return doc
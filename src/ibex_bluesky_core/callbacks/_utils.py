@@ -1,11 +1,15 @@
 import logging
 import os
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 from platform import node
 from zoneinfo import ZoneInfo
 
-from event_model import Event, RunStart, RunStop
+import numpy as np
+import numpy.typing as npt
+from event_model import Event, EventPage, RunStart, RunStop
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +30,8 @@ PRECISION = "precision"
 MOTORS = "motors"
 UNKNOWN_RB = "Unknown RB"
 
+_MIN_COLUMN_CAPACITY = 16
+
 
 def get_instrument() -> str:
     return node()
@@ -46,3 +52,168 @@ def _get_rb_num(doc: Event | RunStart | RunStop) -> str:
     if rb_num == UNKNOWN_RB:
         logger.warning('No RB number found, saving to "%s"', UNKNOWN_RB)
     return rb_num
+
+
+def get_scan_output_dir(output_dir: Path, doc: RunStart) -> Path:
+    """Get the directory to write a run's scan files to, under ``RB<number>/bluesky_scans``."""
+    rb_num = _get_rb_num(doc)
+    rb_num_str = rb_num if rb_num == UNKNOWN_RB else f"RB{rb_num}"
+    return output_dir / rb_num_str / "bluesky_scans"
+
+
+def get_yerr_values(doc: EventPage, yerr: str, num_events: int) -> npt.NDArray[np.float64]:
+    """Get an event page's uncertainties, or NaN for each event if the page has none."""
+    if yerr not in doc[DATA]:
+        return np.full(num_events, np.nan)
+    return np.asarray(doc[DATA][yerr], dtype=np.float64)
+
+
+class _FloatColumnBase(ABC):
+    @property
+    @abstractmethod
+    def values(self) -> npt.NDArray[np.float64]:
+        """Read-only view of the values in the column."""
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> float:
+        return float(self.values[index])
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self.values.tolist())
+
+    def __array__(  # noqa: PLW3201 (NumPy array protocol)
+        self, dtype: npt.DTypeLike | None = None, copy: bool | None = None
+    ) -> npt.NDArray[np.float64]:
+        return np.array(self.values, dtype=dtype, copy=copy)
+
+
+class FloatColumn(_FloatColumnBase):
+    """Append-only column of float64 values.
+
+    Values are stored in a NumPy array, whose capacity is doubled when it is full, so that
+    appending is amortised O(1). :py:obj:`values` is a read-only view of the stored values,
+    and is not copied.
+    """
+
+    def __init__(self) -> None:
+        """Append-only column of float64 values."""
+        self._buffer: npt.NDArray[np.float64] = np.empty(_MIN_COLUMN_CAPACITY)
+        self._len = 0
+        self._generation = 0
+
+    def append(self, value: float) -> None:
+        """Append a value to the end of the column."""
+        if self._len == len(self._buffer):
+            buffer = np.empty(2 * len(self._buffer))
+            buffer[: self._len] = self._buffer
+            self._buffer = buffer
+        self._buffer[self._len] = value
+        self._len += 1
+
+    def extend(self, values: npt.ArrayLike) -> None:
+        """Append several values to the end of the column at once."""
+        values = np.asarray(values, dtype=np.float64).reshape(-1)
+        new_len = self._len + len(values)
+        if new_len > len(self._buffer):
+            buffer = np.empty(max(new_len, 2 * len(self._buffer)))
+            buffer[: self._len] = self._buffer[: self._len]
+            self._buffer = buffer
+        self._buffer[self._len : new_len] = values
+        self._len = new_len
+
+    def clear(self) -> None:
+        """Remove all values from the column.
+
+        A new buffer is used, so views previously returned by :py:obj:`values` are unchanged.
+        :py:obj:`generation` is incremented.
+        """
+        self._buffer = np.empty(_MIN_COLUMN_CAPACITY)
+        self._len = 0
+        self._generation += 1
+
+    @property
+    def generation(self) -> int:
+        """Number of times this column has been cleared.
+
+        A position in this column is only meaningful for the generation it was taken in, so
+        anything which keeps track of a position in this column should also record this.
+        """
+        return self._generation
+
+    @property
+    def values(self) -> npt.NDArray[np.float64]:
+        """Read-only view of the values in the column.
+
+        Values appended later do not appear in views which have already been returned.
+        """
+        view = self._buffer[: self._len]
+        view.flags.writeable = False
+        return view
+
+    def __len__(self) -> int:
+        return self._len
+
+
+class FloatColumnView(_FloatColumnBase):
+    """View of a :py:obj:`FloatColumn` which is filled by another callback.
+
+    This can be used in place of a :py:obj:`FloatColumn` by a callback which would otherwise
+    store the same values itself. :py:obj:`append` only counts values, which must already
+    have been appended to the shared column, so the view contains only the values which its
+    user has seen, even if more values have since been appended to the shared column.
+
+    The count is only valid for the :py:obj:`~FloatColumn.generation` of the shared column
+    in which it was taken. If the shared column is cleared, the view raises
+    :py:obj:`RuntimeError` until it is also cleared, rather than silently showing the wrong
+    values.
+    """
+
+    def __init__(self, column: FloatColumn) -> None:
+        """View of a :py:obj:`FloatColumn` which is filled by another callback.
+
+        Args:
+            column: the shared column.
+
+        """
+        self._column = column
+        self._generation = column.generation
+        self._len = 0
+
+    def _check(self, new_len: int) -> int:
+        if self._column.generation != self._generation:
+            raise RuntimeError(
+                "Shared column has been cleared since this view was last cleared. Callbacks "
+                "which share scan columns must be subscribed after the ScanColumns callback."
+            )
+        if new_len > len(self._column):
+            raise RuntimeError(
+                f"View counted {new_len} values, but the shared column only has "
+                f"{len(self._column)}. Callbacks which share scan columns must be subscribed "
+                "after the ScanColumns callback."
+            )
+        return new_len
+
+    def append(self, value: float) -> None:
+        """Count a value, which has already been appended to the shared column."""
+        self._len = self._check(self._len + 1)
+
+    def extend(self, values: npt.ArrayLike) -> None:
+        """Count several values, which have already been appended to the shared column."""
+        self._len = self._check(self._len + np.size(values))
+
+    def clear(self) -> None:
+        """Remove all values from the view, and follow the shared column's current generation."""
+        self._generation = self._column.generation
+        self._len = 0
+
+    @property
+    def values(self) -> npt.NDArray[np.float64]:
+        """Read-only view of the values in the shared column which have been counted.
+
+        Raises:
+            RuntimeError: if the shared column has been cleared since this view was cleared.
+
+        """
+        return self._column.values[: self._check(self._len)]
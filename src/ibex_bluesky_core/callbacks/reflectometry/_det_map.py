@@ -19,7 +19,6 @@ at once.
 """
 
 import logging
-import math
 import time
 from typing import Any
 
@@ -27,7 +26,8 @@ import numpy as np
 import numpy.typing as npt
 import scipp as sc
 from bluesky.callbacks.stream import LiveDispatcher
-from event_model import Event, EventDescriptor, RunStop
+from bluesky.utils import new_uid
+from event_model import DocumentNames, Event, EventDescriptor, EventPage, RunStop
 
 from ibex_bluesky_core.devices.simpledae import VARIANCE_ADDITION
 
@@ -36,11 +36,82 @@ logger = logging.getLogger(__name__)
 __all__ = ["DetMapAngleScanLiveDispatcher", "DetMapHeightScanLiveDispatcher"]
 
 
-class DetMapHeightScanLiveDispatcher(LiveDispatcher):
+def _weighted_sum(
+    data: npt.NDArray[np.float64], weights: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    # Sums over the last (pixel) axis, so data may be one event, or a page of events.
+    # Weights are either per-pixel, or a single (0-dimensional) weight for all pixels.
+    if weights.ndim == 0:
+        return data.sum(axis=-1) * weights
+    return data @ weights
+
+
+def _describe(values: npt.ArrayLike) -> dict[str, Any]:
+    # Describes one event's value, from a page's values for a field.
+    shape = list(np.shape(values)[1:])
+    return {"dtype": "array" if shape else "number", "shape": shape}
+
+
+class _EventPageLiveDispatcher(LiveDispatcher):
+    """LiveDispatcher which can also emit a whole page of processed events at once."""
+
+    def process_event_page(
+        self, descriptor_uid: str, data: dict[str, Any], stream_name: str = "primary"
+    ) -> None:
+        """Emit a page of processed events, equivalent to process_event for each event.
+
+        A new descriptor is emitted first, if one with these data keys has not already been
+        emitted for the raw descriptor.
+
+        Args:
+            descriptor_uid: the uid of the raw descriptor that the events came from.
+            data: for each field, the values of all of the page's events.
+            stream_name: the name of the stream to emit the events in.
+
+        """
+        descriptor_id = frozenset((tuple(data), stream_name, (descriptor_uid,)))
+        descriptors = self._descriptors.setdefault(stream_name, {})
+        descriptor = descriptors.get(descriptor_id)
+        if descriptor is None:
+            raw_data_keys = self.raw_descriptors.get(descriptor_uid, {}).get("data_keys", {})
+            data_keys = {
+                key: {**raw_data_keys.get(key, _describe(values)), "source": "Stream"}
+                for key, values in data.items()
+            }
+            descriptor = {
+                **self.raw_descriptors.get(descriptor_uid, {}),
+                "uid": new_uid(),
+                "time": time.time(),
+                "run_start": self._stream_start_uid,
+                "data_keys": data_keys,
+                "configuration": {},
+                "object_keys": {"stream": list(data_keys)},
+            }
+            descriptors[descriptor_id] = descriptor
+            self.emit(DocumentNames.descriptor, descriptor)  # pyright: ignore [reportArgumentType]
+
+        current_time = time.time()
+        num_events = len(next(iter(data.values())))
+        first_seq_num = self.seq_count + 1
+        self.seq_count += num_events
+        event_page = {
+            "descriptor": descriptor["uid"],
+            "uid": [new_uid() for _ in range(num_events)],
+            "seq_num": list(range(first_seq_num, self.seq_count + 1)),
+            "time": [current_time] * num_events,
+            "data": data,
+            "timestamps": {key: [current_time] * num_events for key in data},
+            "filled": {},
+        }
+        self.emit(DocumentNames.event_page, event_page)  # pyright: ignore [reportArgumentType]
+
+
+class DetMapHeightScanLiveDispatcher(_EventPageLiveDispatcher):
     """LiveDispatcher for reflectometry height scans.
 
     This sums a 1-D array of detector integrals, and synchronously emits events,
-    normalizing by the sum of a 1-D array of monitor integrals.
+    normalizing by the sum of a 1-D array of monitor integrals. Event pages are normalized
+    all at once, and emitted as a single event page.
 
     In the typical case, the array of monitor integrals will be of size 1 (i.e. a single
     monitor spectrum used for normalization).
@@ -63,45 +134,94 @@ class DetMapHeightScanLiveDispatcher(LiveDispatcher):
         self._out_name = out_name
         self._flood = flood if flood is not None else sc.scalar(value=1, dtype="float64")
 
+        # Each event's detector counts, d, have variances equal to d. Dividing by the flood, f,
+        # and summing gives sum(d / f), with variance sum(d / f**2 + d**2 * var(f) / f**4), as
+        # propagated by scipp. The per-pixel weights only depend on the flood, so are computed
+        # once here, leaving each event to be handled with a few dot products.
+        flood_values = np.asarray(self._flood.values, dtype=np.float64)
+        self._inverse_flood = 1.0 / flood_values
+        self._inverse_flood_squared = self._inverse_flood**2
+        self._flood_variance_weights = None
+        if self._flood.variances is not None:
+            if flood_values.ndim == 0:
+                raise ValueError("A scalar flood correction cannot have variances.")
+            self._flood_variance_weights = (
+                np.asarray(self._flood.variances, dtype=np.float64) * self._inverse_flood_squared**2
+            )
+
     def event(self, doc: Event, **kwargs: dict[str, Any]) -> Event:
         """Process an event.
 
         :meta private:
         """
         logger.debug("DetMapHeightScanLiveDispatcher processing event uid %s", doc.get("uid"))
-        det_data = doc["data"][self._det_name]
-        mon_data = doc["data"][self._mon_name]
+        normalized, normalized_err = self._normalize(
+            doc["data"][self._det_name], doc["data"][self._mon_name]
+        )
+        doc["data"][self._out_name] = float(normalized)
+        doc["data"][self._out_name + "_err"] = float(normalized_err)
+        return super().event(doc)
 
-        det = sc.Variable(dims=["spectrum"], values=det_data, variances=det_data, dtype="float64")
-        mon = sc.Variable(dims=["spectrum"], values=mon_data, variances=mon_data, dtype="float64")
+    def event_page(self, doc: EventPage) -> EventPage:
+        """Process an event page, normalizing all of its events at once.
 
-        det /= self._flood
+        :meta private:
+        """
+        logger.debug(
+            "DetMapHeightScanLiveDispatcher processing event page with %d events",
+            len(doc["seq_num"]),
+        )
+        normalized, normalized_err = self._normalize(
+            doc["data"][self._det_name], doc["data"][self._mon_name]
+        )
+        self.process_event_page(
+            doc["descriptor"],
+            {
+                **doc["data"],
+                self._out_name: normalized,
+                self._out_name + "_err": normalized_err,
+            },
+        )
+        return doc
 
-        det_sum = det.sum()
-        mon_sum = mon.sum()
+    def _normalize(
+        self, det_data: npt.ArrayLike, mon_data: npt.ArrayLike
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        # det_data and mon_data are either one event's arrays, or a page of events' arrays,
+        # with one row per event.
+        det = np.asarray(det_data, dtype=np.float64)
+        mon_sum = np.sum(mon_data, axis=-1, dtype=np.float64)
+
+        det_sum = _weighted_sum(det, self._inverse_flood)
+        det_variance = _weighted_sum(det, self._inverse_flood_squared)
+        if self._flood_variance_weights is not None:
+            det_variance += _weighted_sum(det * det, self._flood_variance_weights)
 
         # See doc\architectural_decisions\005-variance-addition.md
         # for justification of this addition to variances.
-        det_sum.variance += VARIANCE_ADDITION
+        det_variance += VARIANCE_ADDITION
 
-        if mon_sum.value == 0.0:
+        if np.any(mon_sum == 0.0):
             raise ValueError(
                 "No monitor counts. Check beamline setup & beam status. "
                 "I/I_0 normalization not possible."
             )
 
+        # The monitor counts have variances equal to their values, so var(mon_sum) = mon_sum.
         normalized = det_sum / mon_sum
+        normalized_variance = det_variance / mon_sum**2 + det_sum**2 / mon_sum**3
 
-        doc["data"][self._out_name] = normalized.value
-        doc["data"][self._out_name + "_err"] = math.sqrt(normalized.variance)
-        return super().event(doc)
+        return normalized, np.sqrt(normalized_variance)
 
 
-class DetMapAngleScanLiveDispatcher(LiveDispatcher):
+class DetMapAngleScanLiveDispatcher(_EventPageLiveDispatcher):
     """LiveDispatcher which accumulates an array of counts data, and emits data at the end.
 
     For an array with dimension N, N events will be emitted at the end, corresponding
-    to all input arrays summed together.
+    to all input arrays summed together. These are emitted as a single event page, so that
+    callbacks which handle event pages (such as :py:obj:`~ibex_bluesky_core.callbacks.LiveFit`
+    and :py:obj:`~ibex_bluesky_core.callbacks.LivePlot`) fit and redraw once, rather than
+    once per point.
     """
 
     def __init__(
@@ -114,8 +234,8 @@ class DetMapAngleScanLiveDispatcher(LiveDispatcher):
     ) -> None:
         """LiveDispatcher which accumulates an array of counts data, and emits data at the end.
 
-        For an array with dimension N, N events will be emitted at the end, corresponding
-        to all input arrays summed together.
+        For an array with dimension N, N events will be emitted at the end, as a single
+        event page, corresponding to all input arrays summed together.
         """
         super().__init__()
         self.x_data = x_data
@@ -161,6 +281,34 @@ class DetMapAngleScanLiveDispatcher(LiveDispatcher):
         self.y_data += scaled_data
         return doc
 
+    def event_page(self, doc: EventPage) -> EventPage:
+        """Process an event page, adding all of its events' counts at once.
+
+        :meta private:
+        """
+        logger.debug(
+            "DetMapAngleScanLiveDispatcher processing event page with %d events",
+            len(doc["seq_num"]),
+        )
+
+        data = np.asarray(doc["data"][self.y_in_name], dtype=np.float64)
+        if data.shape[1:] != self.x_data.shape:
+            raise ValueError(
+                f"Shape of data ({data.shape[1:]} does not match x_data.shape ({self.x_data.shape})"
+            )
+
+        # Equivalent to adding each event's counts, c, divided by the flood, f, in turn: the
+        # values are sum(c) / f, and the variances are sum(c) / f**2 + sum(c**2) var(f) / f**4.
+        inverse_flood = 1.0 / np.asarray(self._flood.values, dtype=np.float64)
+        counts = data.sum(axis=0)
+        variances = counts * inverse_flood**2
+        if self._flood.variances is not None:
+            variances += (data * data).sum(axis=0) * self._flood.variances * inverse_flood**4
+        self.y_data += sc.array(
+            dims=["spectrum"], values=counts * inverse_flood, variances=variances
+        )
+        return doc
+
     def stop(self, doc: RunStop, _md: dict[str, Any] | None = None) -> None:
         """Process a stop event.
 
@@ -170,21 +318,16 @@ class DetMapAngleScanLiveDispatcher(LiveDispatcher):
             # No data to emit... don't do anything.
             return super().stop(doc, _md)
 
-        current_time = time.time()
-        for x, y in zip(self.x_data, self.y_data, strict=True):  # type: ignore (pyright doesn't understand scipp)
-            logger.debug("DetMapAngleScanLiveDispatcher emitting event with x=%f, y=%f", x, y)
-            event = {
-                "data": {
-                    self.x_name: x,
-                    self.y_out_name: y.value,
-                    self.y_out_name + "_err": np.sqrt(y.variance + 0.5),
-                },
-                "timestamps": {
-                    self.x_name: current_time,
-                    self.y_out_name: current_time,
-                    self.y_out_name + "_err": current_time,
-                },
-                "descriptor": self._descriptor_uid,
-            }
-            self.process_event(event)
+        y_err = np.sqrt(self.y_data.variances + VARIANCE_ADDITION)  # type: ignore (pyright doesn't understand scipp)
+        logger.debug(
+            "DetMapAngleScanLiveDispatcher emitting event page with %d points", len(self.x_data)
+        )
+        self.process_event_page(
+            self._descriptor_uid,
+            {
+                self.x_name: np.asarray(self.x_data, dtype=np.float64),
+                self.y_out_name: np.asarray(self.y_data.values, dtype=np.float64),
+                self.y_out_name + "_err": y_err,
+            },
+        )
         return super().stop(doc, _md)
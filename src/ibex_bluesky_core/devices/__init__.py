@@ -11,9 +11,11 @@ from typing import TypeVar
 from ophyd_async.core import SignalDatatype, SignalRW, StrictEnum
 from ophyd_async.epics.core import epics_signal_rw
 
+from ibex_bluesky_core.devices._registry import DeviceRegistry, get_device_registry
+
 T = TypeVar("T", bound=SignalDatatype)
 
-__all__ = ["NoYesChoice", "isis_epics_signal_rw"]
+__all__ = ["DeviceRegistry", "NoYesChoice", "get_device_registry", "isis_epics_signal_rw"]
 
 
 def isis_epics_signal_rw(datatype: type[T], read_pv: str, name: str = "") -> SignalRW[T]:
@@ -0,0 +1,46 @@
+"""Helpers for devices which move a group of other devices together."""
+
+import asyncio
+from collections.abc import Awaitable, Sequence
+from typing import Any
+
+from ophyd_async.core import Device, DeviceMock
+
+
+async def connect_with_members(
+    connect_group: Awaitable[None],
+    members: Sequence[Device],
+    *,
+    mock: bool | DeviceMock[Any],
+    timeout: float,  # noqa: ASYNC109 - passed on to Device.connect
+    force_reconnect: bool,
+) -> None:
+    """Connect a group device, and each of the devices in that group, concurrently.
+
+    The members of a group are usually also used on their own, so they are not children of
+    the group, and connecting the group does not connect them. If the group is given a
+    :py:obj:`~ophyd_async.core.DeviceMock`, each member is connected with its own child of
+    that mock, named after the member, so that calls to the members can be inspected from
+    the group's mock.
+
+    Args:
+        connect_group: the group's own connection, from ``super().connect(...)``.
+        members: the devices in the group.
+        mock: the ``mock`` argument passed to the group's ``connect``.
+        timeout: the ``timeout`` argument passed to the group's ``connect``.
+        force_reconnect: the ``force_reconnect`` argument passed to the group's ``connect``.
+
+    """
+    await asyncio.gather(
+        connect_group,
+        *(
+            member.connect(
+                mock=DeviceMock(member.name or str(i), mock)
+                if isinstance(mock, DeviceMock)
+                else mock,
+                timeout=timeout,
+                force_reconnect=force_reconnect,
+            )
+            for i, member in enumerate(members)
+        ),
+    )
@@ -0,0 +1,162 @@
+"""Process-wide registry of devices, allowing device instances to be reused between plans."""
+
+import asyncio
+import logging
+from collections.abc import Callable, Hashable
+from functools import cache
+from typing import ParamSpec, TypeVar
+
+from ophyd_async.core import DEFAULT_TIMEOUT, AsyncReadable, Device
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["DeviceRegistry", "get_device_registry"]
+
+P = ParamSpec("P")
+DeviceT = TypeVar("DeviceT", bound=Device)
+
+
+class DeviceRegistry:
+    """Cache of device instances, keyed by the factory and arguments used to create them."""
+
+    def __init__(self) -> None:
+        """Cache of device instances, keyed by the factory and arguments used to create them.
+
+        ``ophyd_async`` devices remember a successful connection, so connecting an
+        already-connected device (for example using
+        :py:obj:`~ophyd_async.plan_stubs.ensure_connected` at the start of a plan) returns
+        almost immediately. Reusing device instances between plans, rather than creating new
+        devices in every plan, therefore avoids paying the cost of connecting to the underlying
+        PVs each time a plan is run.
+
+        Usually, the process-wide registry returned by
+        :py:obj:`~ibex_bluesky_core.devices.get_device_registry` should be used, rather than
+        creating a new registry.
+        """
+        self._devices: dict[Hashable, Device] = {}
+
+    def get(self, factory: Callable[P, DeviceT], /, *args: P.args, **kwargs: P.kwargs) -> DeviceT:
+        """Get a cached device, or create and cache a new device if none exists yet.
+
+        Devices are cached by the factory, and the arguments passed to that factory. For
+        example:
+
+        .. code-block:: python
+
+            from ibex_bluesky_core.devices import get_device_registry
+            from ibex_bluesky_core.devices.block import block_rw
+
+            registry = get_device_registry()
+            block = registry.get(block_rw, float, "my_block")
+
+            # Returns the same instance as above
+            same_block = registry.get(block_rw, float, "my_block")
+
+        Args:
+            factory: a function or class which creates a device.
+            *args: positional arguments passed to the factory.
+            **kwargs: keyword arguments passed to the factory.
+
+        Returns:
+            The cached device.
+
+        Raises:
+            TypeError: if any of the arguments are not hashable, and therefore cannot be used
+                to identify a cached device.
+
+        """
+        key = (factory, args, tuple(sorted(kwargs.items())))
+        try:
+            device = self._devices.get(key)
+        except TypeError as e:
+            raise TypeError(
+                f"Cannot cache device from {factory.__name__}, as its arguments are not hashable"
+            ) from e
+
+        if device is None:
+            device = factory(*args, **kwargs)
+            logger.info("Adding device %s to registry", device.name)
+            self._devices[key] = device
+        return device  # pyright: ignore [reportReturnType]
+
+    @property
+    def devices(self) -> list[Device]:
+        """All devices currently in this registry."""
+        return list(self._devices.values())
+
+    def __contains__(self, device: object) -> bool:
+        """Return whether a device is currently in this registry."""
+        return any(d is device for d in self._devices.values())
+
+    def __len__(self) -> int:
+        """Return the number of devices currently in this registry."""
+        return len(self._devices)
+
+    def evict(self, device: Device) -> None:
+        """Remove a device from this registry.
+
+        The next call to :py:obj:`get` with the same arguments will create a new device.
+        Evicting a device which is not in this registry does nothing.
+        """
+        for key in [k for k, d in self._devices.items() if d is device]:
+            logger.info("Evicting device %s from registry", device.name)
+            del self._devices[key]
+
+    def clear(self) -> None:
+        """Remove all devices from this registry."""
+        logger.info("Clearing device registry")
+        self._devices.clear()
+
+    async def check_health(
+        self, timeout_s: float = DEFAULT_TIMEOUT, *, evict: bool = True
+    ) -> list[Device]:
+        """Check that every device in this registry is connected and responsive.
+
+        Readable devices are read. Other devices are connected, which returns immediately for
+        devices which are already connected.
+
+        From a plan, check the health of the registry using:
+
+        .. code-block:: python
+
+            import bluesky.plan_stubs as bps
+
+            def my_plan():
+                [task] = yield from bps.wait_for([get_device_registry().check_health])
+                unhealthy_devices = task.result()
+
+        Args:
+            timeout_s: the time, in seconds, to allow each device to connect and be read.
+            evict: whether to evict unhealthy devices, so that they are recreated on next use.
+
+        Returns:
+            A list of unhealthy devices.
+
+        """
+        devices = self.devices
+        results = await asyncio.gather(
+            *(asyncio.wait_for(_check_device(device, timeout_s), timeout_s) for device in devices),
+            return_exceptions=True,
+        )
+
+        unhealthy = []
+        for device, result in zip(devices, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning("Device %s is unhealthy: %r", device.name, result)
+                unhealthy.append(device)
+                if evict:
+                    self.evict(device)
+        return unhealthy
+
+
+async def _check_device(device: Device, timeout_s: float) -> None:
+    if isinstance(device, AsyncReadable):
+        await device.read()
+    else:
+        await device.connect(timeout=timeout_s)
+
+
+@cache
+def get_device_registry() -> DeviceRegistry:
+    """Get the process-wide :py:obj:`~ibex_bluesky_core.devices.DeviceRegistry`."""
+    return DeviceRegistry()
@@ -2,22 +2,28 @@
 
 import asyncio
 import logging
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
-from typing import Generic, TypeVar
+from itertools import starmap
+from typing import Any, Generic, TypeVar
 
+import numpy as np
 from bluesky.protocols import (
     HasName,
     Locatable,
     Location,
     Movable,
     NamedMovable,
+    Reading,
     Triggerable,
 )
 from ophyd_async.core import (
     CALCULATE_TIMEOUT,
+    DEFAULT_TIMEOUT,
     AsyncStatus,
     CalculatableTimeout,
+    DeviceMock,
     SignalDatatype,
     SignalR,
     SignalRW,
@@ -30,6 +36,7 @@ from ophyd_async.core import (
 from ophyd_async.epics.core import epics_signal_r, epics_signal_rw
 from ophyd_async.epics.motor import Motor
 
+from ibex_bluesky_core.devices._group import connect_with_members
 from ibex_bluesky_core.utils import get_pv_prefix
 
 logger = logging.getLogger(__name__)
@@ -41,13 +48,16 @@ T = TypeVar("T", bound=SignalDatatype)
 __all__ = [
     "BlockMot",
     "BlockR",
+    "BlockReadConfig",
     "BlockRw",
+    "BlockRwGroup",
     "BlockRwRbv",
     "BlockWriteConfig",
     "RunControl",
     "block_mot",
     "block_r",
     "block_rw",
+    "block_rw_group",
     "block_rw_rbv",
     "block_w",
 ]
@@ -58,6 +68,18 @@ __all__ = [
 GLOBAL_MOVING_FLAG_PRE_WAIT = 0.1
 
 
+def _keep_monitor_alive(reading: dict[str, Reading[Any]]) -> None:
+    """Monitor callback which does nothing; subscribing keeps a signal's cache populated."""
+
+
+async def _wait_for_global_moving_flag(global_moving: SignalR[bool]) -> None:
+    # Paranoid sleep - ensure that the global flag has had a chance to go into moving,
+    # otherwise there could be a race condition where we check the flag before the move
+    # has even started.
+    await asyncio.sleep(GLOBAL_MOVING_FLAG_PRE_WAIT)
+    await wait_for_value(global_moving, False, timeout=None)
+
+
 @dataclass(kw_only=True, frozen=True)
 class BlockWriteConfig(Generic[T]):
     """Configuration settings for writing to blocks.
@@ -111,6 +133,32 @@ class BlockWriteConfig(Generic[T]):
     """
     A wait time, in seconds, which is unconditionally applied just before the set
     status is marked as complete. Defaults to zero.
+
+    If ``settle_tolerance`` is set, this is instead the *maximum* time to wait for the
+    readback to become stable.
+    """
+
+    settle_tolerance: float | None = None
+    """
+    If set, use stability-based settling rather than a fixed settle time. Settling completes
+    as soon as the readback has stayed within ``settle_tolerance`` of a reference value for
+    ``settle_dwell_s`` seconds. Any readback outside of this tolerance restarts the dwell
+    window, using the new readback as the reference value.
+
+    Settling never takes longer than ``settle_time_s``; if the readback has not become stable
+    within that time, the set completes anyway. ``settle_time_s`` must therefore be greater than
+    zero when ``settle_tolerance`` is set.
+
+    The time actually spent settling is logged, and is available as ``last_settle_time_s`` on
+    the block, which can be used to tune these parameters.
+
+    Defaults to :py:obj:`None`, which means always wait for exactly ``settle_time_s``.
+    """
+
+    settle_dwell_s: float = 0.0
+    """
+    The time, in seconds, for which the readback must stay within ``settle_tolerance`` for
+    the block to be considered settled. Only used if ``settle_tolerance`` is set.
     """
 
     use_global_moving_flag: bool = False
@@ -127,6 +175,49 @@ class BlockWriteConfig(Generic[T]):
     satisfied ``set_success_func`` within ``settle_time_s``.
     """
 
+    def __post_init__(self) -> None:
+        """Check that the settle settings are consistent."""
+        if self.settle_tolerance is not None and self.settle_time_s <= 0:
+            raise ValueError(
+                "settle_time_s is the maximum time to wait for a stable readback when "
+                f"settle_tolerance is set, so must be greater than zero (got {self.settle_time_s})"
+            )
+
+
+@dataclass(kw_only=True, frozen=True)
+class BlockReadConfig:
+    """Configuration settings for reading from blocks.
+
+    These settings control where the values returned when reading a block come from.
+    """
+
+    use_monitor_cache: bool = False
+    """
+    Whether to serve reads from the latest CA monitor update, rather than doing a fresh
+    read of the underlying PVs each time the block is read.
+
+    When enabled, the block subscribes to monitors on its read signals the first time it is
+    read, and keeps those subscriptions (including across different plans) until
+    :py:obj:`~ibex_bluesky_core.devices.block.BlockR.stop_monitoring` is called or the block is
+    connected with ``force_reconnect``. Subsequent reads then return immediately with the latest
+    monitored values, which avoids a round-trip to the IOC per block per scan point.
+
+    Defaults to :py:obj:`False`, which means every read is a fresh read from the PV, unless
+    the block is staged.
+    """
+
+    max_age_s: float | None = None
+    """
+    A staleness limit, in seconds, on cached readings. If ``use_monitor_cache`` is enabled and
+    the timestamp of the latest monitored reading is older than this, the PV is read directly
+    instead of using the cached reading.
+
+    Note that monitors only give updates when the underlying value changes, so the timestamp of
+    a reading of a slowly-changing value may be old even though that value is still current.
+
+    Defaults to :py:obj:`None`, which means cached readings are always used.
+    """
+
 
 class RunControl(StandardReadable):
     """Subdevice for common run-control signals."""
@@ -171,7 +262,14 @@ class RunControl(StandardReadable):
 class BlockR(StandardReadable, Triggerable, Generic[T]):
     """Read-only block."""
 
-    def __init__(self, datatype: type[T], prefix: str, block_name: str) -> None:
+    def __init__(
+        self,
+        datatype: type[T],
+        prefix: str,
+        block_name: str,
+        *,
+        read_config: BlockReadConfig | None = None,
+    ) -> None:
         """Device representing an IBEX readable block of arbitrary data type.
 
         Args:
@@ -179,12 +277,20 @@ class BlockR(StandardReadable, Triggerable, Generic[T]):
                 (e.g. :py:obj:`str`, :py:obj:`int`, :py:obj:`float`)
             prefix: the current instrument's PV prefix
             block_name: the name of the block
+            read_config: Settings which control how this device will read the underlying PVs
 
         """
+        self._read_config: BlockReadConfig = read_config or BlockReadConfig()
+
         with self.add_children_as_readables(StandardReadableFormat.HINTED_SIGNAL):
             self.readback: SignalR[T] = epics_signal_r(datatype, f"{prefix}CS:SB:{block_name}")
             """Readback value. This is the hinted signal for a block."""
 
+        # Signals which contribute to read(), which will be served from monitors if
+        # use_monitor_cache is set.
+        self._read_signals: list[SignalR[T]] = [self.readback]
+        self._monitored_signals: dict[str, SignalR[T]] = {}
+
         # Run control doesn't need to be read by default
         self.run_control: RunControl = RunControl(f"{prefix}CS:SB:{block_name}:RC:")
         """Run-control settings for this block."""
@@ -203,6 +309,66 @@ class BlockR(StandardReadable, Triggerable, Generic[T]):
         adaptive scans.
         """
 
+    async def connect(
+        self,
+        mock: bool | DeviceMock[Any] = False,
+        timeout: float = DEFAULT_TIMEOUT,  # noqa: ASYNC109 - signature inherited from Device
+        force_reconnect: bool = False,
+    ) -> None:
+        """Connect this block.
+
+        If ``force_reconnect`` is set, any monitors kept open by ``use_monitor_cache`` are
+        closed first, and are reopened on the next read.
+        """
+        if force_reconnect:
+            self.stop_monitoring()
+        await super().connect(mock=mock, timeout=timeout, force_reconnect=force_reconnect)
+
+    def stop_monitoring(self) -> None:
+        """Close any monitors kept open by ``use_monitor_cache``.
+
+        Monitors are reopened on the next read of this block.
+        """
+        for signal in self._monitored_signals.values():
+            logger.info("Stopping monitor-backed reads of %s", signal.source)
+            signal.clear_sub(_keep_monitor_alive)
+        self._monitored_signals.clear()
+
+    async def read(self) -> dict[str, Reading[Any]]:
+        """Read this block.
+
+        This method implements :py:obj:`bluesky.protocols.Readable`, and should not be
+        called directly.
+
+        If ``use_monitor_cache`` is set in this block's
+        :py:obj:`~ibex_bluesky_core.devices.block.BlockReadConfig`, readings are served from the
+        latest monitor updates rather than being read from the PVs directly.
+        """
+        if not self._read_config.use_monitor_cache:
+            return await super().read()
+
+        readings: dict[str, Reading[Any]] = {}
+        for reading in await asyncio.gather(
+            *(self._read_from_monitor(signal) for signal in self._read_signals)
+        ):
+            readings.update(reading)
+        return readings
+
+    async def _read_from_monitor(self, signal: SignalR[T]) -> dict[str, Reading[Any]]:
+        if signal.name not in self._monitored_signals:
+            logger.info("Starting monitor-backed reads of %s", signal.source)
+            # Keep a subscription open until stop_monitoring is called, so that the signal's
+            # cache stays populated even after the block is unstaged at the end of a plan.
+            signal.subscribe_reading(_keep_monitor_alive)
+            self._monitored_signals[signal.name] = signal
+
+        reading = await signal.read(cached=True)
+        max_age_s = self._read_config.max_age_s
+        if max_age_s is not None and time.time() - reading[signal.name]["timestamp"] > max_age_s:
+            logger.debug("Cached reading of %s is stale, reading directly", signal.source)
+            reading = await signal.read(cached=False)
+        return reading
+
     def __repr__(self) -> str:
         """Debug representation of this block."""
         return f"{self.__class__.__name__}(name={self.name})"
@@ -218,6 +384,7 @@ class BlockRw(BlockR[T], NamedMovable[T]):
         block_name: str,
         *,
         write_config: BlockWriteConfig[T] | None = None,
+        read_config: BlockReadConfig | None = None,
         sp_suffix: str = ":SP",
     ) -> None:
         """Device representing an IBEX read/write block of arbitrary data type.
@@ -245,12 +412,16 @@ class BlockRw(BlockR[T], NamedMovable[T]):
             prefix: the current instrument's PV prefix
             block_name: the name of the block
             write_config: Settings which control how this device will set the underlying PVs
+            read_config: Settings which control how this device will read the underlying PVs
             sp_suffix: Suffix to append to PV for the setpoint. Defaults to ":SP" but can
                 be set to empty string to read and write to exactly the same PV.
 
         """
         self._write_config: BlockWriteConfig[T] = write_config or BlockWriteConfig()
 
+        self.last_settle_time_s: float | None = None
+        """The time, in seconds, spent settling during the most recent set of this block."""
+
         self.setpoint: SignalRW[T] = epics_signal_rw(
             datatype,
             f"{prefix}CS:SB:{block_name}{sp_suffix}",
@@ -263,7 +434,9 @@ class BlockRw(BlockR[T], NamedMovable[T]):
             # Only link to this if we need to (i.e. if use_global_moving_flag was requested)
             self.global_moving = epics_signal_r(bool, f"{prefix}CS:MOT:MOVING:STR")
 
-        super().__init__(datatype=datatype, prefix=prefix, block_name=block_name)
+        super().__init__(
+            datatype=datatype, prefix=prefix, block_name=block_name, read_config=read_config
+        )
 
     @AsyncStatus.wrap
     async def set(self, value: T) -> None:
@@ -284,35 +457,20 @@ class BlockRw(BlockR[T], NamedMovable[T]):
         """
 
         async def do_set(setpoint: T) -> None:
-            logger.info("Setting Block %s to %s", self.name, setpoint)
-            await self.setpoint.set(setpoint, timeout=None)
-            logger.info("Got completion callback from setting block %s to %s", self.name, setpoint)
+            await self.write_setpoint(setpoint)
 
             if self._write_config.use_global_moving_flag:
                 logger.info(
                     "Waiting for global moving flag on setting block %s to %s", self.name, setpoint
                 )
-                # Paranoid sleep - ensure that the global flag has had a chance to go into moving,
-                # otherwise there could be a race condition where we check the flag before the move
-                # has even started.
-                await asyncio.sleep(GLOBAL_MOVING_FLAG_PRE_WAIT)
-                await wait_for_value(self.global_moving, False, timeout=None)
+                await _wait_for_global_moving_flag(self.global_moving)
                 logger.info(
                     "Done wait for global moving flag on setting block %s to %s",
                     self.name,
                     setpoint,
                 )
 
-            # Wait for the _set_success_func to return true.
-            # This uses an "async for" to loop over items from observe_value, which is an async
-            # generator. See documentation on "observe_value" or python "async for" for more details
-            if self._write_config.set_success_func is not None:
-                logger.info(
-                    "Waiting for set_success_func on setting block %s to %s", self.name, setpoint
-                )
-                async for actual_value in observe_value(self.readback):
-                    if self._write_config.set_success_func(setpoint, actual_value):
-                        break
+            await self.wait_for_set_success(setpoint)
 
         async def set_and_settle(setpoint: T) -> None:
             if self._write_config.set_timeout_s is not None:
@@ -320,12 +478,7 @@ class BlockRw(BlockR[T], NamedMovable[T]):
             else:
                 await do_set(setpoint)
 
-            logger.info(
-                "Waiting for configured settle time (%f seconds) on block %s",
-                self._write_config.settle_time_s,
-                self.name,
-            )
-            await asyncio.sleep(self._write_config.settle_time_s)
+            await self.settle()
 
         if self._write_config.timeout_is_error:
             await set_and_settle(value)
@@ -342,6 +495,101 @@ class BlockRw(BlockR[T], NamedMovable[T]):
                 )
         logger.info("block set complete %s value=%s", self.name, value)
 
+    @property
+    def write_config(self) -> BlockWriteConfig[T]:
+        """The settings which control how this block is written to."""
+        return self._write_config
+
+    async def write_setpoint(self, setpoint: T) -> None:
+        """Write a new setpoint to this block, without waiting for the move to finish.
+
+        This waits for an EPICS completion callback if ``use_completion_callback`` is set, but
+        does not wait for the global moving flag, ``set_success_func`` or settling.
+
+        Plans should move blocks using ``bps.mv``; this method is a building block for compound
+        moves, such as :py:obj:`~ibex_bluesky_core.devices.block.BlockRwGroup`.
+
+        Args:
+            setpoint: the new setpoint.
+
+        """
+        logger.info("Setting Block %s to %s", self.name, setpoint)
+        await self.setpoint.set(setpoint, timeout=None)
+        logger.info("Got completion callback from setting block %s to %s", self.name, setpoint)
+
+    async def wait_for_set_success(self, setpoint: T) -> None:
+        """Wait for the configured ``set_success_func`` (if any) to return :py:obj:`True`.
+
+        Args:
+            setpoint: the setpoint which was written to this block.
+
+        """
+        # This uses an "async for" to loop over items from observe_value, which is an async
+        # generator. See documentation on "observe_value" or python "async for" for more details
+        if self._write_config.set_success_func is not None:
+            logger.info(
+                "Waiting for set_success_func on setting block %s to %s", self.name, setpoint
+            )
+            async for actual_value in observe_value(self.readback):
+                if self._write_config.set_success_func(setpoint, actual_value):
+                    break
+
+    async def settle(self) -> None:
+        """Wait for this block to settle after a move, according to its write config.
+
+        Waits for either a fixed ``settle_time_s``, or for the readback to become stable if
+        ``settle_tolerance`` is set. The time spent settling is stored in
+        ``last_settle_time_s``.
+        """
+        start = time.monotonic()
+        if self._write_config.settle_tolerance is None:
+            logger.info(
+                "Waiting for configured settle time (%f seconds) on block %s",
+                self._write_config.settle_time_s,
+                self.name,
+            )
+            await asyncio.sleep(self._write_config.settle_time_s)
+        else:
+            logger.info(
+                "Waiting for readback to stay within %f for %f seconds (max %f s) on block %s",
+                self._write_config.settle_tolerance,
+                self._write_config.settle_dwell_s,
+                self._write_config.settle_time_s,
+                self.name,
+            )
+            try:
+                await asyncio.wait_for(
+                    self._wait_for_stable_readback(
+                        self._write_config.settle_tolerance, self._write_config.settle_dwell_s
+                    ),
+                    timeout=self._write_config.settle_time_s,
+                )
+            except TimeoutError:
+                logger.info(
+                    "Readback on block %s did not become stable within %f seconds, continuing",
+                    self.name,
+                    self._write_config.settle_time_s,
+                )
+
+        self.last_settle_time_s = time.monotonic() - start
+        logger.info("Settled block %s in %f seconds", self.name, self.last_settle_time_s)
+
+    async def _wait_for_stable_readback(self, tolerance: float, dwell_s: float) -> None:
+        """Wait until the readback has stayed within tolerance of a reference for dwell_s."""
+        updates = observe_value(self.readback)
+        # The first update from observe_value is always the current value.
+        reference = await anext(updates)
+        window_start = time.monotonic()
+        while True:
+            remaining = dwell_s - (time.monotonic() - window_start)
+            try:
+                actual = await asyncio.wait_for(anext(updates), timeout=remaining)
+            except TimeoutError:
+                return
+            if not np.all(np.abs(np.asarray(actual) - np.asarray(reference)) <= tolerance):
+                reference = actual
+                window_start = time.monotonic()
+
 
 class BlockRwRbv(BlockRw[T], Locatable[T]):
     """Device representing an IBEX read/write/setpoint readback block of arbitrary data type."""
@@ -353,6 +601,7 @@ class BlockRwRbv(BlockRw[T], Locatable[T]):
         block_name: str,
         *,
         write_config: BlockWriteConfig[T] | None = None,
+        read_config: BlockReadConfig | None = None,
     ) -> None:
         """Device representing an IBEX read/write/setpoint readback block of arbitrary data type.
 
@@ -364,6 +613,7 @@ class BlockRwRbv(BlockRw[T], Locatable[T]):
             prefix: the current instrument's PV prefix
             block_name: the name of the block
             write_config: Settings which control how this device will set the underlying PVs
+            read_config: Settings which control how this device will read the underlying PVs
 
         """
         with self.add_children_as_readables():
@@ -373,8 +623,13 @@ class BlockRwRbv(BlockRw[T], Locatable[T]):
             """The setpoint-readback for this block."""
 
         super().__init__(
-            datatype=datatype, prefix=prefix, block_name=block_name, write_config=write_config
+            datatype=datatype,
+            prefix=prefix,
+            block_name=block_name,
+            write_config=write_config,
+            read_config=read_config,
         )
+        self._read_signals.append(self.setpoint_readback)
 
     async def locate(self) -> Location[T]:
         """Get the current :py:obj:`~bluesky.protocols.Location` of this block.
@@ -414,6 +669,163 @@ class BlockRwRbv(BlockRw[T], Locatable[T]):
         }
 
 
+class BlockRwGroup(StandardReadable, Movable[Sequence[Any]]):
+    """Device representing a group of IBEX read/write blocks which are moved together."""
+
+    def __init__(
+        self,
+        prefix: str,
+        blocks: Sequence[BlockRw[Any]],
+        *,
+        name: str = "",
+        set_timeout_s: float | None = None,
+    ) -> None:
+        """Group of read/write blocks, which are moved together as a single compound move.
+
+        Setting this group sets each block in the group. Compared to moving each block
+        separately, this:
+
+        - Writes all of the setpoints concurrently.
+        - Waits just once for the IBEX global moving indicator, after all setpoints have been
+          written, for the blocks in the group configured with ``use_global_moving_flag``.
+        - Then waits for each block's ``set_success_func`` and settle time concurrently.
+
+        Reading this group reads each block in the group.
+
+        The ``set_timeout_s`` and ``timeout_is_error`` options in each block's
+        :py:obj:`~ibex_bluesky_core.devices.block.BlockWriteConfig` apply to that block's part
+        of the group move. A block which times out with ``timeout_is_error=False`` is not
+        settled, but does not stop the rest of the group from moving. The group's own
+        ``set_timeout_s`` additionally applies to the group move as a whole.
+
+        From a plan, set a group of blocks using:
+
+        .. code-block:: python
+
+            import bluesky.plan_stubs as bps
+
+            def my_plan():
+                group = BlockRwGroup(...)
+                yield from bps.mv(group, [value_for_first_block, value_for_second_block])
+
+        Args:
+            prefix: the current instrument's PV prefix
+            blocks: the blocks to move together
+            name: ophyd device name
+            set_timeout_s: A timeout, in seconds, on all blocks in the group being set
+                successfully. Excludes any configured settle times. Defaults to :py:obj:`None`,
+                which means no timeout.
+
+        """
+        self._blocks: tuple[BlockRw[Any], ...] = tuple(blocks)
+        self._set_timeout_s = set_timeout_s
+
+        # Misleading PV name... says it's a str but it's really a bi record.
+        self.global_moving: SignalR[bool] = epics_signal_r(bool, f"{prefix}CS:MOT:MOVING:STR")
+        self.add_readables(self._blocks)
+
+        super().__init__(name=name)
+
+    async def connect(
+        self,
+        mock: bool | DeviceMock[Any] = False,
+        timeout: float = DEFAULT_TIMEOUT,  # noqa: ASYNC109 - signature inherited from Device
+        force_reconnect: bool = False,
+    ) -> None:
+        """Connect this group, and each block within it."""
+        await connect_with_members(
+            super().connect(mock=mock, timeout=timeout, force_reconnect=force_reconnect),
+            self._blocks,
+            mock=mock,
+            timeout=timeout,
+            force_reconnect=force_reconnect,
+        )
+
+    @AsyncStatus.wrap
+    async def set(self, value: Sequence[Any]) -> None:
+        """Set the setpoints of all blocks in this group.
+
+        This method implements :py:obj:`bluesky.protocols.Movable`, and should not be
+        called directly.
+
+        Args:
+            value: a sequence of setpoints, in the same order as the blocks in this group.
+
+        """
+        if len(value) != len(self._blocks):
+            raise ValueError(
+                f"Expected {len(self._blocks)} values to set on {self.name}, got {len(value)}"
+            )
+        # Each block's event is set once its setpoint has been written (or failed to write).
+        moves = [
+            (block, setpoint, asyncio.Event())
+            for block, setpoint in zip(self._blocks, value, strict=True)
+        ]
+
+        async def wait_for_global_moving() -> None:
+            await asyncio.gather(*(written.wait() for _, _, written in moves))
+            logger.info("Waiting for global moving flag on setting group %s", self.name)
+            await _wait_for_global_moving_flag(self.global_moving)
+            logger.info("Done wait for global moving flag on setting group %s", self.name)
+
+        # Shared by all blocks using the global moving flag, so that it is only waited on once,
+        # after every setpoint has been written.
+        global_moving = (
+            asyncio.ensure_future(wait_for_global_moving())
+            if any(block.write_config.use_global_moving_flag for block in self._blocks)
+            else None
+        )
+
+        async def do_set(block: BlockRw[Any], setpoint: object, written: asyncio.Event) -> None:
+            try:
+                await block.write_setpoint(setpoint)
+            finally:
+                written.set()
+
+            if global_moving is not None and block.write_config.use_global_moving_flag:
+                await asyncio.shield(global_moving)
+
+            await block.wait_for_set_success(setpoint)
+
+        async def set_block(block: BlockRw[Any], setpoint: object, written: asyncio.Event) -> bool:
+            try:
+                await asyncio.wait_for(
+                    do_set(block, setpoint, written), timeout=block.write_config.set_timeout_s
+                )
+            except TimeoutError as e:
+                if block.write_config.timeout_is_error:
+                    raise
+                logger.info(
+                    "block set %s value=%s failed with %s, but continuing anyway because "
+                    "timeout_is_error is not set.",
+                    block.name,
+                    setpoint,
+                    e,
+                )
+                return False
+            return True
+
+        logger.info("Setting group %s to %s", self.name, value)
+        try:
+            succeeded = await asyncio.wait_for(
+                asyncio.gather(*starmap(set_block, moves)),
+                timeout=self._set_timeout_s,
+            )
+        finally:
+            if global_moving is not None:
+                global_moving.cancel()
+
+        # As for a single block, blocks which timed out are not settled.
+        await asyncio.gather(
+            *(block.settle() for block, ok in zip(self._blocks, succeeded, strict=True) if ok)
+        )
+        logger.info("group set complete %s value=%s", self.name, value)
+
+    def __repr__(self) -> str:
+        """Debug representation of this group."""
+        return f"{self.__class__.__name__}(name={self.name}, blocks={list(self._blocks)})"
+
+
 class BlockMot(Motor, Movable[float], HasName):
     """Device representing an IBEX block pointing at a motor."""
 
@@ -490,12 +902,16 @@ class BlockMot(Motor, Movable[float], HasName):
         return super().set(value, timeout)
 
 
-def block_r(datatype: type[T], block_name: str) -> BlockR[T]:
+def block_r(
+    datatype: type[T], block_name: str, *, read_config: BlockReadConfig | None = None
+) -> BlockR[T]:
     """Get a local read-only block for the current instrument.
 
     See documentation of :py:obj:`~ibex_bluesky_core.devices.block.BlockR` for more information.
     """
-    return BlockR(datatype=datatype, prefix=get_pv_prefix(), block_name=block_name)
+    return BlockR(
+        datatype=datatype, prefix=get_pv_prefix(), block_name=block_name, read_config=read_config
+    )
 
 
 def block_rw(
@@ -503,6 +919,7 @@ def block_rw(
     block_name: str,
     *,
     write_config: BlockWriteConfig[T] | None = None,
+    read_config: BlockReadConfig | None = None,
     sp_suffix: str = ":SP",
 ) -> BlockRw[T]:
     """Get a local read-write block for the current instrument.
@@ -514,12 +931,17 @@ def block_rw(
         prefix=get_pv_prefix(),
         block_name=block_name,
         write_config=write_config,
+        read_config=read_config,
         sp_suffix=sp_suffix,
     )
 
 
 def block_w(
-    datatype: type[T], block_name: str, *, write_config: BlockWriteConfig[T] | None = None
+    datatype: type[T],
+    block_name: str,
+    *,
+    write_config: BlockWriteConfig[T] | None = None,
+    read_config: BlockReadConfig | None = None,
 ) -> BlockRw[T]:
     """Get a write-only block for the current instrument.
 
@@ -530,19 +952,41 @@ def block_w(
         prefix=get_pv_prefix(),
         block_name=block_name,
         write_config=write_config,
+        read_config=read_config,
         sp_suffix="",
     )
 
 
 def block_rw_rbv(
-    datatype: type[T], block_name: str, *, write_config: BlockWriteConfig[T] | None = None
+    datatype: type[T],
+    block_name: str,
+    *,
+    write_config: BlockWriteConfig[T] | None = None,
+    read_config: BlockReadConfig | None = None,
 ) -> BlockRwRbv[T]:
     """Get a local read/write/setpoint readback block for the current instrument.
 
     See documentation of :py:obj:`~ibex_bluesky_core.devices.block.BlockRwRbv` for more information.
     """
     return BlockRwRbv(
-        datatype=datatype, prefix=get_pv_prefix(), block_name=block_name, write_config=write_config
+        datatype=datatype,
+        prefix=get_pv_prefix(),
+        block_name=block_name,
+        write_config=write_config,
+        read_config=read_config,
+    )
+
+
+def block_rw_group(
+    blocks: Sequence[BlockRw[Any]], *, name: str = "", set_timeout_s: float | None = None
+) -> BlockRwGroup:
+    """Get a group of read/write blocks, to be moved together, for the current instrument.
+
+    See documentation of :py:obj:`~ibex_bluesky_core.devices.block.BlockRwGroup` for more
+    information.
+    """
+    return BlockRwGroup(
+        prefix=get_pv_prefix(), blocks=blocks, name=name, set_timeout_s=set_timeout_s
     )
 
 
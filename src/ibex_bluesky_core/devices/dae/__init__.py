@@ -44,6 +44,7 @@ from ibex_bluesky_core.devices.dae._tcb_settings import (
     TimeRegime,
     TimeRegimeMode,
     TimeRegimeRow,
+    calculate_tcb_edges,
 )
 
 __all__ = [
@@ -72,6 +73,7 @@ __all__ = [
     "TimeRegime",
     "TimeRegimeMode",
     "TimeRegimeRow",
+    "calculate_tcb_edges",
 ]
 
 T = TypeVar("T", bound=SignalDatatype)
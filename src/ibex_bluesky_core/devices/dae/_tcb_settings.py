@@ -1,11 +1,15 @@
 """ophyd-async devices and utilities for the DAE time channel settings."""
 
 import logging
+import math
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass
 from enum import Enum
 from xml.etree.ElementTree import tostring
 
+import numpy as np
+import numpy.typing as npt
+import scipp as sc
 from bluesky.protocols import Locatable, Location, Movable
 from ibex_non_ca_helpers.compress_hex import compress_and_hex, dehex_and_decompress
 from ophyd_async.core import AsyncStatus, SignalRW, StandardReadable
@@ -125,6 +129,138 @@ class DaeTCBSettingsData:
     """TCB source (file or explicit tables)."""
 
 
+_TCB_UNITS = {
+    TCBTimeUnit.MICROSECONDS: sc.units.us,
+    TCBTimeUnit.NANOSECONDS: sc.units.ns,
+}
+
+
+# The maximum number of boundaries calculated for a single row. This is far more than the DAE
+# supports, and stops settings with tiny steps from taking an unbounded time to calculate.
+_MAX_ROW_EDGES = 1_000_000
+
+
+def _check_num_edges(row: TimeRegimeRow, num_edges: int) -> None:
+    if num_edges > _MAX_ROW_EDGES:
+        raise ValueError(
+            f"Time regime row {row} gives more than {_MAX_ROW_EDGES} time channel boundaries."
+        )
+
+
+def _num_steps(span: float) -> int:
+    """Get the number of whole steps needed to cover a span, ignoring float rounding noise."""
+    return math.ceil(round(span, 9))
+
+
+def _calculate_row_edges(start: float, row: TimeRegimeRow) -> npt.NDArray[np.float64]:
+    """Calculate the bin edges for a single time regime row, starting at ``start``."""
+    if row.to is None or row.steps is None:
+        raise ValueError(f"Time regime row {row} must specify 'to' and 'steps'.")
+    if row.steps <= 0:
+        raise ValueError(f"Time regime row {row} must have positive 'steps'.")
+    if row.to <= start:
+        raise ValueError(f"Time regime row {row} must end after it starts (start={start}).")
+
+    if row.mode == TimeRegimeMode.DT:
+        # dT = C: constant-width bins.
+        n = _num_steps((row.to - start) / row.steps)
+        _check_num_edges(row, n + 1)
+        return start + row.steps * np.arange(n + 1, dtype=np.float64)
+
+    if start <= 0:
+        raise ValueError(f"Time regime row {row} must start at a positive time for log binning.")
+
+    if row.mode == TimeRegimeMode.DTDIVT:
+        # dT/T = C: each edge is a constant multiple of the previous edge.
+        n = _num_steps(math.log(row.to / start) / math.log1p(row.steps))
+        _check_num_edges(row, n + 1)
+        return start * np.power(1.0 + row.steps, np.arange(n + 1, dtype=np.float64))
+
+    if row.mode == TimeRegimeMode.DTDIVT2:
+        # dT/T**2 = C: no closed form for the discrete recurrence, so step through it.
+        edges = [start]
+        while edges[-1] < row.to and not math.isclose(edges[-1], row.to):
+            _check_num_edges(row, len(edges) + 1)
+            edges.append(edges[-1] + row.steps * edges[-1] ** 2)
+        return np.array(edges, dtype=np.float64)
+
+    raise ValueError(f"Time regime mode {row.mode} cannot be calculated locally.")
+
+
+def calculate_tcb_edges(settings: DaeTCBSettingsData, time_regime: int = 1) -> sc.Variable:
+    """Calculate time channel boundaries locally from DAE TCB settings.
+
+    This applies the DAE's time regime rules to a set of TCB settings, without needing to
+    read the resulting boundaries back from the DAE. This allows TCB-dependent quantities
+    (for example d-spacing or wavelength bins) to be calculated before any data has been
+    counted, and allows TCB settings to be validated offline.
+
+    Blank rows are skipped. Each non-blank row covers its range using whole steps, so the
+    final edge of a row may lie slightly beyond that row's ``to`` value. A row whose ``from_``
+    is the previous row's ``to`` (or final edge) continues from the previous row's final edge.
+    A row which starts after the previous row ends is not joined to it, so the gap between
+    them is a single time channel. Rows which overlap are rejected.
+
+    The DAE additionally quantises boundaries to its clock resolution, so edges read back from
+    the DAE may differ by less than one clock tick.
+
+    Args:
+        settings: the TCB settings, for example as returned by
+            :py:obj:`~ibex_bluesky_core.devices.dae.DaeTCBSettings.locate`.
+        time_regime: the time regime number to calculate boundaries for.
+
+    Returns:
+        A scipp :external+scipp:py:obj:`Variable <scipp.Variable>` of bin edges, along
+        dimension "tof", in units of the TCB time unit.
+
+    Raises:
+        ValueError: if the settings do not describe a valid, locally-calculable, time regime.
+
+    """
+    if settings.tcb_calculation_method == TCBCalculationMethod.USE_TCB_FILE:
+        raise ValueError("Cannot calculate time channel boundaries from a TCB file.")
+    if settings.time_unit is None:
+        raise ValueError("TCB settings must specify a time unit.")
+    if settings.tcb_tables is None or time_regime not in settings.tcb_tables:
+        raise ValueError(f"TCB settings do not contain time regime {time_regime}.")
+
+    row_edges: list[npt.NDArray[np.float64]] = []
+    previous_to = 0.0
+    for _, row in sorted(settings.tcb_tables[time_regime].rows.items()):
+        if row.mode is None or row.mode == TimeRegimeMode.BLANK:
+            continue
+        if row.from_ is None:
+            raise ValueError(f"Time regime row {row} must specify 'from_'.")
+        if not row_edges:
+            edges = _calculate_row_edges(row.from_, row)
+        else:
+            previous_end = float(row_edges[-1][-1])
+            if math.isclose(row.from_, previous_to) or math.isclose(row.from_, previous_end):
+                # Contiguous with the previous row, so continue from its final edge, dropping
+                # the shared edge.
+                edges = _calculate_row_edges(previous_end, row)[1:]
+            elif row.from_ > previous_end:
+                edges = _calculate_row_edges(row.from_, row)
+            else:
+                raise ValueError(
+                    f"Time regime row {row} overlaps the previous row, which ends at "
+                    f"{previous_end}."
+                )
+        row_edges.append(edges)
+        assert row.to is not None  # Checked when calculating the row's edges.
+        previous_to = row.to
+
+    if not row_edges:
+        raise ValueError(f"Time regime {time_regime} does not contain any non-blank rows.")
+
+    return sc.array(
+        dims=["tof"],
+        values=np.concatenate(row_edges),
+        unit=_TCB_UNITS[settings.time_unit],
+        dtype="float64",
+    )
+
+
 def _convert_xml_to_tcb_settings(value: str) -> DaeTCBSettingsData:
     root = ET.fromstring(value)
     settings_from_xml = _convert_xml_to_names_and_values(root)
@@ -2,24 +2,30 @@
 
 import asyncio
 import logging
+import math
+from collections.abc import Awaitable, Sequence
+from typing import Any
 
 import numpy as np
 import numpy.typing as npt
 import scipp as sc
-from bluesky.protocols import NamedMovable
+from bluesky.protocols import Movable, NamedMovable, Reading
 from ophyd_async.core import (
+    DEFAULT_TIMEOUT,
     AsyncStatus,
     Device,
+    DeviceMock,
     SignalR,
     SignalW,
     StandardReadable,
     StandardReadableFormat,
-    observe_value,
     soft_signal_r_and_setter,
+    wait_for_value,
 )
 from ophyd_async.epics.core import epics_signal_r, epics_signal_rw, epics_signal_w
 
 from ibex_bluesky_core.devices import NoYesChoice
+from ibex_bluesky_core.devices._group import connect_with_members
 from ibex_bluesky_core.devices.dae import Dae
 from ibex_bluesky_core.devices.simpledae import Reducer
 from ibex_bluesky_core.fitting import Gaussian
@@ -27,14 +33,69 @@ from ibex_bluesky_core.utils import get_pv_prefix
 
 logger = logging.getLogger(__name__)
 
-__all__ = ["AngleMappingReducer", "ReflParameter", "ReflParameterRedefine", "refl_parameter"]
+__all__ = [
+    "AngleMappingReducer",
+    "ReflParameter",
+    "ReflParameterGroup",
+    "ReflParameterRedefine",
+    "refl_parameter",
+    "refl_parameter_group",
+]
+
+DEFAULT_CHANGING_RACE_GUARD_S = 0.1
+"""Time to wait for a CHANGING signal to go :py:obj:`True`, after writing a setpoint."""
+
+DEFAULT_REDEFINE_TOLERANCE = 1e-3
+"""Tolerance for a redefined parameter's readback, if the parameter has no precision."""
+
+
+async def _write_and_wait_for_changing(
+    changing: SignalR[bool], write: Awaitable[None], race_guard_s: float, timeout_s: float
+) -> None:
+    """Perform a write, then wait for a CHANGING signal to go True and then back to False.
+
+    The CHANGING signal is monitored from before the write is performed, so that a transition
+    to :py:obj:`True` and back to :py:obj:`False` is not missed, even if it is very quick. If
+    CHANGING does not go :py:obj:`True` within ``race_guard_s`` of the write completing, the
+    write is assumed not to have caused any motion (for example, a move to the current
+    position), and this returns immediately.
+    """
+    started = asyncio.Event()
+    finished = asyncio.Event()
+
+    def _on_update(reading: dict[str, Reading[bool]]) -> None:
+        value = reading[changing.name]["value"]
+        logger.debug("%s: %s", changing.source, value)
+        if value:
+            started.set()
+        elif started.is_set():
+            finished.set()
+
+    changing.subscribe_reading(_on_update)
+    try:
+        await write
+        logger.info("waiting for %s", changing.source)
+        try:
+            await asyncio.wait_for(started.wait(), timeout=race_guard_s)
+        except TimeoutError:
+            logger.info("%s did not start changing after %ss", changing.source, race_guard_s)
+            return
+        await asyncio.wait_for(finished.wait(), timeout=timeout_s)
+    finally:
+        changing.clear_sub(_on_update)
 
 
 class ReflParameter(StandardReadable, NamedMovable[float]):
     """Utility device for a reflectometry server parameter."""
 
     def __init__(
-        self, prefix: str, name: str, changing_timeout_s: float, *, has_redefine: bool = True
+        self,
+        prefix: str,
+        name: str,
+        changing_timeout_s: float,
+        *,
+        has_redefine: bool = True,
+        changing_race_guard_s: float = DEFAULT_CHANGING_RACE_GUARD_S,
     ) -> None:
         """Reflectometry server parameter.
 
@@ -43,6 +104,8 @@ class ReflParameter(StandardReadable, NamedMovable[float]):
             name: the name of the parameter.
             changing_timeout_s: seconds to wait for the CHANGING signal to go to False after a set.
             has_redefine: whether this parameter can be redefined.
+            changing_race_guard_s: seconds to wait for the CHANGING signal to go to True after a
+                set. If it does not, the set is assumed to have caused no motion.
 
         """
         with self.add_children_as_readables(StandardReadableFormat.HINTED_SIGNAL):
@@ -50,6 +113,14 @@ class ReflParameter(StandardReadable, NamedMovable[float]):
             """Readback value. This is the hinted parameter for this class."""
         self.setpoint: SignalW[float] = epics_signal_w(float, f"{prefix}REFL_01:PARAM:{name}:SP")
         """Reflectometry parameter setpoint signal."""
+        self.setpoint_no_action: SignalW[float] = epics_signal_w(
+            float, f"{prefix}REFL_01:PARAM:{name}:SP_NO_ACTION"
+        )
+        """Reflectometry parameter setpoint signal, which does not move the parameter.
+
+        Setpoints written to this signal are applied by a subsequent beamline move, for example
+        using a :py:obj:`ReflParameterGroup`.
+        """
         self.changing: SignalR[bool] = epics_signal_r(
             bool, f"{prefix}REFL_01:PARAM:{name}:CHANGING"
         )
@@ -67,6 +138,7 @@ class ReflParameter(StandardReadable, NamedMovable[float]):
         else:
             self.redefine = None
         self.changing_timeout = changing_timeout_s
+        self.changing_race_guard = changing_race_guard_s
         super().__init__(name=name)
         self.readback.set_name(name)
 
@@ -74,36 +146,153 @@ class ReflParameter(StandardReadable, NamedMovable[float]):
     async def set(self, value: float) -> None:
         """Set the setpoint.
 
-        This waits for the :py:obj:`ReflParameter.changing` signal to go :py:obj:`False` to
-        indicate it has finished.
+        This waits for the :py:obj:`ReflParameter.changing` signal to go :py:obj:`True` and
+        then back to :py:obj:`False`, to indicate it has finished. If the
+        :py:obj:`ReflParameter.changing` signal does not go :py:obj:`True` shortly after the
+        setpoint is written, the move is assumed to have caused no motion.
         """
         logger.info("setting %s to %s", self.setpoint.source, value)
-        await self.setpoint.set(value, timeout=None)
-        await asyncio.sleep(0.1)
-        logger.info("waiting for %s", self.changing.source)
-        async for chg in observe_value(self.changing, done_timeout=self.changing_timeout):
-            logger.debug("%s: %s", self.changing.source, chg)
-            if not chg:
-                break
+        await _write_and_wait_for_changing(
+            self.changing,
+            self.setpoint.set(value, timeout=None),
+            race_guard_s=self.changing_race_guard,
+            timeout_s=self.changing_timeout,
+        )
 
     def __repr__(self) -> str:
         """Debug representation."""
         return f"{self.__class__.__name__}(name={self.name})"
 
 
+class ReflParameterGroup(StandardReadable, Movable[Sequence[float]]):
+    """Utility device for moving a group of reflectometry server parameters together."""
+
+    def __init__(
+        self,
+        prefix: str,
+        parameters: Sequence[ReflParameter],
+        *,
+        name: str = "",
+        changing_timeout_s: float = 60.0,
+        changing_race_guard_s: float = DEFAULT_CHANGING_RACE_GUARD_S,
+    ) -> None:
+        """Group of reflectometry server parameters, which are moved together as a single move.
+
+        Setting this group writes the setpoints of all parameters in the group without moving
+        them, then asks the reflectometry server to move the whole beamline once, and waits
+        for the beamline's CHANGING signal to go :py:obj:`False`. Compared to moving each
+        parameter separately, this avoids waiting for the reflectometry server to recalculate
+        and move the beamline once for each parameter.
+
+        Reading this group reads each parameter in the group.
+
+        From a plan, set a group of parameters using:
+
+        .. code-block:: python
+
+            import bluesky.plan_stubs as bps
+
+            def my_plan():
+                group = ReflParameterGroup(...)
+                yield from bps.mv(group, [value_for_first_param, value_for_second_param])
+
+        Args:
+            prefix: the PV prefix.
+            parameters: the reflectometry parameters to move together.
+            name: the name of the group.
+            changing_timeout_s: seconds to wait for the beamline's CHANGING signal to go to
+                False after a set.
+            changing_race_guard_s: seconds to wait for the beamline's CHANGING signal to go to
+                True after a set. If it does not, the set is assumed to have caused no motion.
+
+        """
+        self._parameters: tuple[ReflParameter, ...] = tuple(parameters)
+        self.move: SignalW[int] = epics_signal_w(int, f"{prefix}REFL_01:BL:MOVE")
+        """Signal which moves the whole beamline to the current setpoints."""
+        self.changing: SignalR[bool] = epics_signal_r(bool, f"{prefix}REFL_01:BL:CHANGING")
+        """Whether any parameter on the beamline is currently changing."""
+        self.changing_timeout = changing_timeout_s
+        self.changing_race_guard = changing_race_guard_s
+        self.add_readables(self._parameters)
+        super().__init__(name=name)
+
+    async def connect(
+        self,
+        mock: bool | DeviceMock[Any] = False,
+        timeout: float = DEFAULT_TIMEOUT,  # noqa: ASYNC109 - signature inherited from Device
+        force_reconnect: bool = False,
+    ) -> None:
+        """Connect this group, and each parameter within it."""
+        await connect_with_members(
+            super().connect(mock=mock, timeout=timeout, force_reconnect=force_reconnect),
+            self._parameters,
+            mock=mock,
+            timeout=timeout,
+            force_reconnect=force_reconnect,
+        )
+
+    @AsyncStatus.wrap
+    async def set(self, value: Sequence[float]) -> None:
+        """Set the setpoints of all parameters in this group, and move them together.
+
+        This method implements :py:obj:`bluesky.protocols.Movable`, and should not be
+        called directly.
+
+        Args:
+            value: a sequence of setpoints, in the same order as the parameters in this group.
+
+        """
+        if len(value) != len(self._parameters):
+            raise ValueError(
+                f"Expected {len(self._parameters)} values to set on {self.name}, got {len(value)}"
+            )
+
+        logger.info("setting group %s to %s", self.name, value)
+        await asyncio.gather(
+            *(
+                param.setpoint_no_action.set(sp, timeout=None)
+                for param, sp in zip(self._parameters, value, strict=True)
+            )
+        )
+        await _write_and_wait_for_changing(
+            self.changing,
+            self.move.set(1, timeout=None),
+            race_guard_s=self.changing_race_guard,
+            timeout_s=self.changing_timeout,
+        )
+        logger.info("group set complete %s value=%s", self.name, value)
+
+    def __repr__(self) -> str:
+        """Debug representation."""
+        return f"{self.__class__.__name__}(name={self.name}, parameters={list(self._parameters)})"
+
+
 class ReflParameterRedefine(StandardReadable):
     """Utility device for redefining a reflectometry server parameter."""
 
-    def __init__(self, prefix: str, name: str) -> None:
+    def __init__(
+        self, prefix: str, name: str, *, timeout_s: float = 10.0, tolerance: float | None = None
+    ) -> None:
         """Reflectometry server parameter redefinition.
 
         Args:
             prefix: the reflectometry parameter full address.
             name: the name of the parameter redefinition.
+            timeout_s: seconds to wait for the parameter's readback to show the redefined
+                position. If it does not do so in time, a warning is logged and the
+                redefinition completes anyway.
+            tolerance: the absolute tolerance within which the parameter's readback must match
+                the redefined position. Defaults to :py:obj:`None`, which means one unit in the
+                last decimal place of the parameter's precision, or
+                :py:obj:`DEFAULT_REDEFINE_TOLERANCE` if the parameter has no precision.
 
         """
         self.define_pos_sp = epics_signal_w(float, f"{prefix}REFL_01:PARAM:{name}:DEFINE_POS_SP")
         self.manager_mode = epics_signal_rw(NoYesChoice, f"{prefix}CS:MANAGER")
+        self.readback: SignalR[float] = epics_signal_r(float, f"{prefix}REFL_01:PARAM:{name}")
+        """Readback of the parameter being redefined."""
+        self._timeout_s = timeout_s
+        self._tolerance = tolerance
         super().__init__(name)
 
     @AsyncStatus.wrap
@@ -111,18 +300,45 @@ class ReflParameterRedefine(StandardReadable):
         """Set the setpoint.
 
         This redefines the position of a reflectometry parameter as the given value, and
-        waits for the reflectometry parameter redefinition's 'CHANGED' PV
-        to go True to indicate it has finished redefining the position.
+        waits for the parameter's readback to show the redefined position, to indicate it
+        has finished redefining the position.
         """
         in_manager_mode = await self.manager_mode.get_value()
         if in_manager_mode != NoYesChoice.YES:
             raise ValueError(f"Cannot redefine {self.define_pos_sp.source} as not in manager mode.")
         logger.info("setting %s to %s", self.define_pos_sp.source, value)
         await self.define_pos_sp.set(value, timeout=None)
-        logger.info("waiting for 1s for redefine to finish")
         # The Reflectometry server has a CHANGED PV for a redefine, but it doesn't actually
-        # give a monitor update, so just wait an arbitrary length of time for it to be done.
-        await asyncio.sleep(1.0)
+        # give a monitor update, so instead wait for the readback to show the new position.
+        tolerance = await self._get_tolerance()
+        logger.info(
+            "waiting for %s to be redefined to %s (tolerance %s)",
+            self.readback.source,
+            value,
+            tolerance,
+        )
+        try:
+            await wait_for_value(
+                self.readback,
+                lambda v: math.isclose(v, value, abs_tol=tolerance),
+                timeout=self._timeout_s,
+            )
+        except TimeoutError:
+            logger.warning(
+                "%s did not show redefined position %s within %s seconds, continuing anyway",
+                self.readback.source,
+                value,
+                self._timeout_s,
+            )
+
+    async def _get_tolerance(self) -> float:
+        if self._tolerance is not None:
+            return self._tolerance
+        description = await self.readback.describe()
+        precision = description[self.readback.name].get("precision")
+        if precision is None:
+            return DEFAULT_REDEFINE_TOLERANCE
+        return 10.0**-precision
 
 
 def refl_parameter(
@@ -146,6 +362,30 @@ def refl_parameter(
     )
 
 
+def refl_parameter_group(
+    parameters: Sequence[ReflParameter], *, name: str = "", changing_timeout_s: float = 60.0
+) -> ReflParameterGroup:
+    """Small wrapper around a group of reflectometry parameters, which are moved together.
+
+    This automatically applies the current instrument's PV prefix.
+
+    Args:
+        parameters: the reflectometry parameters to move together.
+        name: the name of the group.
+        changing_timeout_s: time to wait (seconds) for the beamline's CHANGING signal to go
+            False after a set.
+
+    Returns a device which moves the given reflectometry parameters together.
+
+    """
+    return ReflParameterGroup(
+        prefix=get_pv_prefix(),
+        parameters=parameters,
+        name=name,
+        changing_timeout_s=changing_timeout_s,
+    )
+
+
 class AngleMappingReducer(Reducer, StandardReadable):
     """Reflectometry angle-mapping reducer."""
 
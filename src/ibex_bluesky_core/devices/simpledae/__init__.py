@@ -36,6 +36,9 @@ from ibex_bluesky_core.devices.simpledae._strategies import (
 from ibex_bluesky_core.devices.simpledae._waiters import (
     GoodUahWaiter,
     MEventsWaiter,
+    MotorIntervalWaiter,
+    MotorPositionWaiter,
+    MotorTimeWaiter,
     PeriodGoodFramesWaiter,
     SimpleWaiter,
     TimeWaiter,
@@ -59,6 +62,9 @@ __all__ = [
     "GoodUahWaiter",
     "MEventsWaiter",
     "MonitorNormalizer",
+    "MotorIntervalWaiter",
+    "MotorPositionWaiter",
+    "MotorTimeWaiter",
     "PeriodGoodFramesNormalizer",
     "PeriodGoodFramesWaiter",
     "PeriodPerPointController",
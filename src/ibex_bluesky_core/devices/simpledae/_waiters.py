@@ -2,15 +2,19 @@
 
 import asyncio
 import logging
+import math
 from abc import ABC, abstractmethod
 from typing import Generic, TypeVar
 
 from ophyd_async.core import (
     Device,
     SignalR,
+    observe_signals_value,
+    soft_signal_r_and_setter,
     soft_signal_rw,
     wait_for_value,
 )
+from ophyd_async.epics.motor import Motor
 
 from ibex_bluesky_core.devices.dae import Dae
 from ibex_bluesky_core.devices.simpledae._strategies import Waiter
@@ -146,3 +150,165 @@ class TimeWaiter(Waiter):
         logger.info("starting wait for %f seconds", self._secs)
         await asyncio.sleep(self._secs)
         logger.info("completed wait")
+
+
+class MotorIntervalWaiter(Waiter, ABC):
+    """Wait while a moving motor covers an interval, recording the positions it covered.
+
+    This is intended for fly scans, where a motor moves continuously while the DAE counts
+    into a new period for each interval. The motor positions at the start and end of
+    each wait are published alongside the DAE data, so that each period is labelled with
+    the range of positions it was counting over.
+
+    Only the wait itself is counted. The motor keeps moving while the DAE changes period
+    before each wait, and while the data is read and reduced after it, so there is a small
+    uncounted gap between consecutive intervals.
+    """
+
+    def __init__(self, motor: Motor) -> None:
+        """Wait while a moving motor covers an interval, recording the positions it covered.
+
+        .. note::
+
+            This is an abstract base class. Implementations such as :py:obj:`MotorTimeWaiter`
+            or :py:obj:`MotorPositionWaiter` should be used rather than this class directly.
+
+        Args:
+            motor: the motor which is moving while the DAE is counting.
+
+        """
+        self._motor = motor
+        self.start_position, self._start_position_setter = soft_signal_r_and_setter(
+            float, name=f"{motor.name}_start"
+        )
+        """Motor position at the start of the most recent interval."""
+        self.end_position, self._end_position_setter = soft_signal_r_and_setter(
+            float, name=f"{motor.name}_end"
+        )
+        """Motor position at the end of the most recent interval."""
+        self.centre_position, self._centre_position_setter = soft_signal_r_and_setter(
+            float, name=f"{motor.name}_centre"
+        )
+        """Motor position at the centre of the most recent interval."""
+
+    async def wait(self, dae: Dae) -> None:
+        """Wait for the interval to complete, recording the start and end motor positions.
+
+        :meta private:
+        """
+        start = await self._motor.user_readback.get_value()
+        logger.info("starting wait for motor interval from %f", start)
+        await self.wait_for_interval(start)
+        end = await self._motor.user_readback.get_value()
+        logger.info("completed wait for motor interval from %f to %f", start, end)
+
+        self._start_position_setter(start)
+        self._end_position_setter(end)
+        self._centre_position_setter((start + end) / 2)
+
+    def additional_readable_signals(self, dae: Dae) -> list[Device]:
+        """Publish the interval covered by the motor as interesting signals.
+
+        :meta private:
+        """
+        return [self.start_position, self.end_position, self.centre_position]
+
+    @abstractmethod
+    async def wait_for_interval(self, start_position: float) -> None:
+        """Wait until the current interval is complete.
+
+        Args:
+            start_position: the motor position at the start of the interval.
+
+        """
+
+    @abstractmethod
+    def expected_intervals(self, distance: float, time_for_move: float) -> int:
+        """Get the number of intervals needed to cover a constant-velocity move.
+
+        Args:
+            distance: the distance which the motor moves at constant velocity.
+            time_for_move: the time, in seconds, which that move takes.
+
+        """
+
+
+def _num_intervals(total: float, interval: float) -> int:
+    # Round before taking the ceiling, so that e.g. 0.3 / 0.1 gives 3 intervals rather than 4.
+    return math.ceil(round(abs(total) / interval, 6))
+
+
+class MotorTimeWaiter(MotorIntervalWaiter):
+    """Wait for a user-specified time, recording the motor positions covered in that time."""
+
+    def __init__(self, motor: Motor, *, seconds: float) -> None:
+        """Wait for a user-specified time, recording the motor positions covered in that time.
+
+        Args:
+            motor: the motor which is moving while the DAE is counting.
+            seconds: number of seconds to wait for.
+
+        """
+        super().__init__(motor)
+        if seconds <= 0:
+            raise ValueError(f"Interval time must be positive, got {seconds}")
+        self._secs = seconds
+
+    async def wait_for_interval(self, start_position: float) -> None:
+        """Wait for the specified time duration.
+
+        :meta private:
+        """
+        await asyncio.sleep(self._secs)
+
+    def expected_intervals(self, distance: float, time_for_move: float) -> int:
+        """Get the number of fixed-time intervals needed to cover a move.
+
+        :meta private:
+        """
+        return _num_intervals(time_for_move, self._secs)
+
+
+class MotorPositionWaiter(MotorIntervalWaiter):
+    """Wait for a motor to move a user-specified distance, recording the positions covered."""
+
+    def __init__(self, motor: Motor, *, distance: float) -> None:
+        """Wait for a motor to move a user-specified distance, recording the positions covered.
+
+        The wait also finishes early if the motor stops moving, so that the final interval
+        of a fly scan does not wait forever if the motor stops just short of a full interval.
+
+        Args:
+            motor: the motor which is moving while the DAE is counting.
+            distance: the distance, in motor units, which the motor must move.
+
+        """
+        super().__init__(motor)
+        if distance == 0:
+            raise ValueError("Interval distance must not be zero")
+        self._distance = abs(distance)
+
+    async def wait_for_interval(self, start_position: float) -> None:
+        """Wait for the motor to move the specified distance, or to stop moving.
+
+        :meta private:
+        """
+        readback = self._motor.user_readback
+        done_move = self._motor.motor_done_move
+        async for signal, value in observe_signals_value(  # pragma: no branch (never exhausted)
+            readback,
+            done_move,  # pyright: ignore [reportArgumentType]
+            timeout=None,
+        ):
+            if signal is readback and abs(value - start_position) >= self._distance:
+                return
+            if signal is done_move and value:
+                logger.info("motor stopped moving before covering %f", self._distance)
+                return
+
+    def expected_intervals(self, distance: float, time_for_move: float) -> int:
+        """Get the number of fixed-distance intervals needed to cover a move.
+
+        :meta private:
+        """
+        return _num_intervals(distance, self._distance)
@@ -1,30 +1,40 @@
 """Core plans."""
 
 from collections.abc import Generator
-from typing import TYPE_CHECKING, Any
+from typing import Any
 
 import bluesky.plans as bp
+import bluesky.preprocessors as bpp
 import matplotlib.pyplot as plt
 from bluesky import plan_stubs as bps
 from bluesky.protocols import NamedMovable
 from bluesky.utils import Msg
 from matplotlib.axes import Axes
+from ophyd_async.core import FlyMotorInfo
 from ophyd_async.plan_stubs import ensure_connected
 
 from ibex_bluesky_core.callbacks import ISISCallbacks
-from ibex_bluesky_core.devices.block import BlockWriteConfig, block_rw
-from ibex_bluesky_core.devices.simpledae import monitor_normalising_dae
+from ibex_bluesky_core.devices.block import BlockMot, BlockWriteConfig, block_mot, block_rw
+from ibex_bluesky_core.devices.simpledae import (
+    MonitorNormalizer,
+    MotorIntervalWaiter,
+    MotorPositionWaiter,
+    MotorTimeWaiter,
+    PeriodPerPointController,
+    SimpleDae,
+    check_dae_strategies,
+    monitor_normalising_dae,
+)
 from ibex_bluesky_core.fitting import FitMethod
 from ibex_bluesky_core.plan_stubs import call_qt_aware, polling_plan
-from ibex_bluesky_core.utils import NamedReadableAndMovable, centred_pixel
-
-if TYPE_CHECKING:
-    from ibex_bluesky_core.devices.simpledae import SimpleDae
+from ibex_bluesky_core.utils import NamedReadableAndMovable, centred_pixel, get_pv_prefix
 
 __all__ = [
     "NamedReadableAndMovable",
     "adaptive_scan",
+    "fly_scan",
     "motor_adaptive_scan",
+    "motor_fly_scan",
     "motor_scan",
     "polling_plan",
     "scan",
@@ -329,3 +339,208 @@ def motor_adaptive_scan(  # noqa: PLR0913
             md=md,
         )
     )
+
+
+def fly_scan(  # noqa: PLR0913
+    dae: SimpleDae[PeriodPerPointController, MotorIntervalWaiter],
+    block: BlockMot,
+    start: float,
+    stop: float,
+    *,
+    time_for_move: float,
+    model: FitMethod | None = None,
+    save_run: bool = False,
+    md: dict[Any, Any] | None = None,
+) -> Generator[Msg, None, ISISCallbacks]:
+    """Fly scan the DAE against a motor block, moving the motor at a constant velocity.
+
+    Rather than stopping at each point, the motor moves continuously from ``start`` to
+    ``stop``, and the DAE counts into a new period for each interval of that motion. Each
+    period is labelled with the range of motor positions it covered, and reduced using the
+    DAE's reducer in the same way as each point of a step scan.
+
+    The DAE must use a :py:obj:`~ibex_bluesky_core.devices.simpledae.PeriodPerPointController`,
+    and a :py:obj:`~ibex_bluesky_core.devices.simpledae.MotorIntervalWaiter` for the same motor
+    block, which defines how long each period lasts:
+
+    - :py:obj:`~ibex_bluesky_core.devices.simpledae.MotorTimeWaiter` to count each period for a
+      fixed time.
+    - :py:obj:`~ibex_bluesky_core.devices.simpledae.MotorPositionWaiter` to count each period
+      while the motor moves a fixed distance.
+
+    Periods are counted until the motion is complete. The motor's velocity is restored to its
+    original value once the scan finishes.
+
+    Each period is only counted while the waiter is waiting. Changing period before each
+    wait, and reading and reducing the data after it, take time during which the motor keeps
+    moving but nothing is counted. This leaves a small gap in the motor positions between
+    consecutive periods; each period's start and end positions show the range it actually
+    counted over.
+
+    The scan raises :py:obj:`ValueError` if it needs more periods than the DAE's maximum
+    number of periods. This is checked before the motor moves, using the number of
+    intervals the waiter needs to cover the move from ``start`` to ``stop``, and again
+    before each period, in case acceleration and deceleration need more periods than that.
+
+    Args:
+        dae: the simple DAE object to use.
+        block: the motor block to move during the scan.
+        start: the position at which the motor reaches a constant velocity.
+        stop: the position at which the motor starts to decelerate.
+        time_for_move: the time, in seconds, to move from ``start`` to ``stop``.
+        model: the fit method to use.
+        save_run: whether or not to save run.
+        md: Arbitrary metadata to include in this scan.
+
+    Returns:
+        an :obj:`ibex_bluesky_core.callbacks.ISISCallbacks` instance.
+
+    """
+    check_dae_strategies(
+        dae, expected_controller=PeriodPerPointController, expected_waiter=MotorIntervalWaiter
+    )
+    yield from ensure_connected(dae, block)  # type: ignore
+
+    waiter = dae.waiter
+    max_periods = yield from bps.rd(dae.max_periods)
+    expected_periods = waiter.expected_intervals(stop - start, time_for_move)
+    if expected_periods > max_periods:
+        raise ValueError(
+            f"Fly scan needs at least {expected_periods} periods, but the DAE has a maximum "
+            f"of {max_periods} periods"
+        )
+    yield from bps.mv(dae.number_of_periods, max_periods)
+
+    yield from call_qt_aware(plt.close, "all")
+    _, ax = yield from call_qt_aware(plt.subplots)
+
+    icc = ISISCallbacks(
+        y=dae.reducer.intensity.name,  # type: ignore
+        yerr=dae.reducer.intensity_stddev.name,  # type: ignore
+        x=waiter.centre_position.name,
+        measured_fields=[
+            waiter.start_position.name,
+            waiter.end_position.name,
+            dae.period_num.name,
+        ],
+        fit=model,
+        ax=ax,
+    )
+
+    additional_md = yield from _get_additional_md(dae, periods=True, save_run=save_run)
+    initial_velocity = yield from bps.rd(block.velocity)
+    fly_info = FlyMotorInfo(start_position=start, end_position=stop, time_for_move=time_for_move)
+
+    def _fly() -> Generator[Msg, None, None]:
+        yield from bps.prepare(block, fly_info, wait=True)
+        yield from bps.kickoff(block, wait=True)
+        status = yield from bps.complete(block, group="fly_scan_complete", wait=False)
+        periods = 0
+        while not status.done:
+            if periods >= max_periods:
+                yield from bps.stop(block)
+                raise ValueError(
+                    f"Fly scan used all {max_periods} DAE periods before the motion completed"
+                )
+            yield from bps.trigger_and_read([dae])
+            periods += 1
+        yield from bps.wait(group="fly_scan_complete")
+
+    @icc
+    def _inner() -> Generator[Msg, None, None]:
+        yield from bpp.finalize_wrapper(
+            bpp.stage_wrapper(
+                bpp.run_wrapper(
+                    _fly(),
+                    md={
+                        "plan_name": "fly_scan",
+                        "detectors": [dae.name],
+                        "motors": [block.name],
+                    }
+                    | additional_md
+                    | (md or {}),
+                ),
+                [dae],
+            ),
+            bps.mv(block.velocity, initial_velocity),
+        )
+
+    yield from _inner()
+
+    return icc
+
+
+def motor_fly_scan(  # noqa: PLR0913
+    block_name: str,
+    start: float,
+    stop: float,
+    num: int,
+    *,
+    time_for_move: float,
+    det: int,
+    mon: int,
+    model: FitMethod | None = None,
+    pixel_range: int = 0,
+    bin_by_position: bool = False,
+    save_run: bool = False,
+    md: dict[Any, Any] | None = None,
+) -> Generator[Msg, None, ISISCallbacks]:
+    """Wrap ``fly_scan()`` plan and create a ``block_mot`` and a DAE object.
+
+    This is really just a wrapper around :func:`ibex_bluesky_core.plans.fly_scan`, which
+    creates a monitor-normalising DAE counting a period for each of ``num`` equal intervals
+    of the motion.
+
+    Args:
+        block_name: the name of the motor block to scan.
+        start: the position at which the motor reaches a constant velocity.
+        stop: the position at which the motor starts to decelerate.
+        num: the number of intervals to split the motion between ``start`` and ``stop`` into.
+        time_for_move: the time, in seconds, to move from ``start`` to ``stop``.
+        det: the detector number.
+        mon: the monitor number.
+        model: the fit method to use.
+        pixel_range: the range of pixels to scan over, using `det` as a centred pixel.
+        bin_by_position: :py:obj:`True` to count each period while the motor moves an equal
+            distance, :py:obj:`False` to count each period for an equal time.
+        save_run: whether or not to save run.
+        md: Arbitrary metadata to include in this scan.
+
+    Returns:
+        an :obj:`ibex_bluesky_core.callbacks.ISISCallbacks` instance.
+
+    """
+    block = block_mot(block_name)
+    prefix = get_pv_prefix()
+
+    if bin_by_position:
+        waiter = MotorPositionWaiter(block, distance=(stop - start) / num)
+    else:
+        waiter = MotorTimeWaiter(block, seconds=time_for_move / num)
+
+    reducer = MonitorNormalizer(
+        prefix=prefix,
+        detector_spectra=centred_pixel(det, pixel_range),
+        monitor_spectra=[mon],
+    )
+    dae = SimpleDae(
+        prefix=prefix,
+        controller=PeriodPerPointController(save_run=save_run),
+        waiter=waiter,
+        reducer=reducer,
+    )
+    dae.reducer.intensity.set_name("intensity")
+    dae.reducer.intensity_stddev.set_name("intensity_stddev")
+
+    return (
+        yield from fly_scan(
+            dae=dae,
+            block=block,
+            start=start,
+            stop=stop,
+            time_for_move=time_for_move,
+            model=model,
+            save_run=save_run,
+            md=md,
+        )
+    )
@@ -0,0 +1,388 @@
+"""Find and replay saved bluesky documents.
+
+Documents are saved by :py:obj:`~ibex_bluesky_core.callbacks.DocLoggingCallback`.
+
+Uncompressed files are memory-mapped, and documents are parsed using ``orjson``, which is
+considerably faster than reading files line-by-line using the standard library :py:obj:`json`
+module.
+"""
+
+import gzip
+import logging
+import mmap
+import os
+from collections.abc import Callable, Collection, Generator, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, cast
+
+import orjson
+from event_model import Event, pack_event_page
+
+from ibex_bluesky_core.callbacks._document_logger import log_location
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "ReplayIndex",
+    "ScanIndex",
+    "index_file",
+    "iter_documents",
+    "read_document_at",
+    "replay",
+]
+
+_LOG_FILE_PATTERNS = ("*.log", "*.log.gz")
+
+# Documents are written as {"type": name, "document": document}. Recognising the type from the
+# start of each line avoids fully parsing every event while indexing.
+_TYPE_PREFIXES = (b'{"type":"', b'{"type": "')
+
+
+@dataclass(frozen=True, kw_only=True)
+class ScanIndex:
+    """Summary of a single scan's document file, used to find scans without reading them fully."""
+
+    path: Path
+    """The document file."""
+    uid: str
+    """Unique identifier of the scan (the ``uid`` of its start document)."""
+    plan_name: str | None
+    """Name of the plan which produced the scan, if recorded."""
+    motors: tuple[str, ...]
+    """Names of the motors scanned, if recorded."""
+    time_start: float
+    """Time at which the scan started, as a unix timestamp."""
+    time_stop: float | None
+    """Time at which the scan stopped, as a unix timestamp, or :py:obj:`None` if incomplete."""
+    exit_status: str | None
+    """Exit status of the scan, or :py:obj:`None` if incomplete."""
+    num_events: int
+    """Number of event documents in the scan."""
+    descriptor_offset: int | None
+    """Byte offset of the first descriptor document, or :py:obj:`None` if there is none."""
+    first_event_offset: int | None
+    """Byte offset of the first event document, or :py:obj:`None` if there are no events."""
+    mtime_ns: int
+    """Modification time of the file when it was indexed, in nanoseconds."""
+    size: int
+    """Size of the file when it was indexed, in bytes."""
+
+
+@contextmanager
+def _open_buffer(path: Path) -> Generator[bytes | mmap.mmap, None, None]:
+    if path.suffix == ".gz":
+        yield gzip.decompress(path.read_bytes())
+        return
+    if path.stat().st_size == 0:
+        yield b""
+        return
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        yield buf
+
+
+def _iter_lines(buf: bytes | mmap.mmap, start: int = 0) -> Iterator[tuple[int, bytes]]:
+    pos = start
+    size = len(buf)
+    while pos < size:
+        end = buf.find(b"\n", pos)
+        if end == -1:
+            end = size
+        line = buf[pos:end]
+        if line.strip():
+            yield pos, line
+        pos = end + 1
+
+
+def _doc_type(line: bytes) -> str:
+    for prefix in _TYPE_PREFIXES:
+        if line.startswith(prefix):
+            end = line.find(b'"', len(prefix))
+            return line[len(prefix) : end].decode()
+    return orjson.loads(line)["type"]
+
+
+def _parse(line: bytes) -> tuple[str, dict[str, Any]]:
+    document = orjson.loads(line)
+    return document["type"], document["document"]
+
+
+def index_file(path: str | os.PathLike[str]) -> ScanIndex:
+    """Build a :py:obj:`ScanIndex` for a single document file.
+
+    Only the start, stop, first descriptor and first event documents are fully parsed.
+
+    Args:
+        path: the document file to index.
+
+    Returns:
+        A summary of the scan in the file.
+
+    Raises:
+        ValueError: if the file does not begin with a start document.
+
+    """
+    path = Path(path)
+    stat = path.stat()
+    start: dict[str, Any] | None = None
+    stop: dict[str, Any] | None = None
+    descriptor_offset: int | None = None
+    first_event_offset: int | None = None
+    num_events = 0
+
+    with _open_buffer(path) as buf:
+        for offset, line in _iter_lines(buf):
+            doc_type = _doc_type(line)
+            if doc_type == "event":
+                num_events += 1
+                if first_event_offset is None:
+                    first_event_offset = offset
+            elif doc_type == "start" and start is None:
+                start = _parse(line)[1]
+            elif doc_type == "descriptor" and descriptor_offset is None:
+                descriptor_offset = offset
+            elif doc_type == "stop":
+                stop = _parse(line)[1]
+
+    if start is None:
+        raise ValueError(f"{path} does not contain a start document")
+
+    return ScanIndex(
+        path=path,
+        uid=start["uid"],
+        plan_name=start.get("plan_name"),
+        motors=tuple(start.get("motors", ())),
+        time_start=start["time"],
+        time_stop=None if stop is None else stop["time"],
+        exit_status=None if stop is None else stop.get("exit_status"),
+        num_events=num_events,
+        descriptor_offset=descriptor_offset,
+        first_event_offset=first_event_offset,
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+    )
+
+
+def read_document_at(path: str | os.PathLike[str], offset: int) -> tuple[str, dict[str, Any]]:
+    """Read a single document from a document file.
+
+    For example, to read the first descriptor of a scan without reading the rest of the file:
+
+    .. code-block:: python
+
+        name, descriptor = read_document_at(scan.path, scan.descriptor_offset)
+
+    Args:
+        path: the document file.
+        offset: byte offset of the document in the (uncompressed) file, for example
+            :py:obj:`ScanIndex.descriptor_offset`.
+
+    Returns:
+        A tuple of (name, document).
+
+    """
+    with _open_buffer(Path(path)) as buf:
+        _, line = next(_iter_lines(buf, offset))
+        return _parse(line)
+
+
+def iter_documents(
+    path: str | os.PathLike[str], *, streams: Collection[str] | None = None
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Iterate over the documents in a document file.
+
+    Args:
+        path: the document file.
+        streams: names of the event streams (for example ``"primary"``) to include. Descriptors,
+            events and event pages from other streams are skipped. :py:obj:`None` to include all
+            streams.
+
+    Yields:
+        Tuples of (name, document), in the order they were saved.
+
+    """
+    wanted_descriptors: set[str] = set()
+    with _open_buffer(Path(path)) as buf:
+        for _, line in _iter_lines(buf):
+            name, doc = _parse(line)
+            if streams is not None:
+                if name == "descriptor":
+                    if doc.get("name") not in streams:
+                        continue
+                    wanted_descriptors.add(doc["uid"])
+                elif (
+                    name in {"event", "event_page"} and doc["descriptor"] not in wanted_descriptors
+                ):
+                    continue
+            yield name, doc
+
+
+def _pack(events: list[dict[str, Any]]) -> dict[str, Any]:
+    return dict(pack_event_page(*cast(list[Event], events)))
+
+
+def _batch_events(
+    documents: Iterator[tuple[str, dict[str, Any]]], batch_size: int
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    pending: list[dict[str, Any]] = []
+    for name, doc in documents:
+        if pending and (name != "event" or doc["descriptor"] != pending[0]["descriptor"]):
+            yield "event_page", _pack(pending)
+            pending = []
+        if name != "event":
+            yield name, doc
+            continue
+        pending.append(doc)
+        if len(pending) >= batch_size:
+            yield "event_page", _pack(pending)
+            pending = []
+    if pending:
+        yield "event_page", _pack(pending)
+
+
+def replay(
+    source: "str | os.PathLike[str] | ScanIndex",
+    callbacks: Callable[[str, dict[str, Any]], Any]
+    | Sequence[Callable[[str, dict[str, Any]], Any]],
+    *,
+    streams: Collection[str] | None = None,
+    batch_size: int = 1,
+) -> None:
+    """Replay the documents in a document file into one or more callbacks.
+
+    For example, to replot a scan:
+
+    .. code-block:: python
+
+        from ibex_bluesky_core.callbacks import LivePlot
+        from ibex_bluesky_core.replay import replay
+
+        replay(path_to_save_file, LivePlot(y="y_name", x="x_name"), streams=["primary"])
+
+    Args:
+        source: the document file, or a :py:obj:`ScanIndex` describing it.
+        callbacks: a callback, or sequence of callbacks, to pass each document to.
+        streams: names of the event streams to replay. :py:obj:`None` to replay all streams.
+        batch_size: maximum number of consecutive events to combine into one ``event_page``
+            document. Callbacks which handle event pages efficiently can process large scans
+            faster using a larger batch size. The default, 1, replays individual events.
+
+    """
+    path = source.path if isinstance(source, ScanIndex) else source
+    if callable(callbacks):
+        callbacks = [callbacks]
+
+    documents = iter_documents(path, streams=streams)
+    if batch_size > 1:
+        documents = _batch_events(documents, batch_size)
+
+    for name, doc in documents:
+        for callback in callbacks:
+            callback(name, doc)
+
+
+class ReplayIndex:
+    """Index of all of the document files in a directory."""
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str] = log_location,
+        *,
+        cache_path: str | os.PathLike[str] | None = None,
+    ) -> None:
+        """Index of all of the document files in a directory.
+
+        Files are only re-indexed if they have changed since they were last indexed. If
+        ``cache_path`` is given, the index is saved to that file, so that it can be reused by
+        later sessions.
+
+        Args:
+            directory: the directory containing document files. Defaults to the directory used
+                by :py:obj:`~ibex_bluesky_core.callbacks.DocLoggingCallback`.
+            cache_path: optional file in which to save the index between sessions.
+
+        """
+        self.directory = Path(directory)
+        self.cache_path = None if cache_path is None else Path(cache_path)
+        self._scans: dict[Path, ScanIndex] = {}
+        if self.cache_path is not None and self.cache_path.exists():
+            self._load_cache(self.cache_path)
+
+    def _load_cache(self, cache_path: Path) -> None:
+        try:
+            entries = orjson.loads(cache_path.read_bytes())
+            for entry in entries:
+                scan = ScanIndex(
+                    **{**entry, "path": Path(entry["path"]), "motors": tuple(entry["motors"])}
+                )
+                self._scans[scan.path] = scan
+        except (OSError, ValueError, TypeError, KeyError):
+            logger.warning("Ignoring invalid replay index cache %s", cache_path, exc_info=True)
+            self._scans = {}
+
+    def _save_cache(self, cache_path: Path) -> None:
+        entries = [{**asdict(scan), "path": str(scan.path)} for scan in self._scans.values()]
+        cache_path.write_bytes(orjson.dumps(entries))
+
+    def refresh(self) -> list[ScanIndex]:
+        """Index any new or changed document files, and forget any deleted files.
+
+        Returns:
+            All indexed scans, in the order they started.
+
+        """
+        scans: dict[Path, ScanIndex] = {}
+        for pattern in _LOG_FILE_PATTERNS:
+            for path in self.directory.glob(pattern):
+                stat = path.stat()
+                scan = self._scans.get(path)
+                if scan is None or scan.mtime_ns != stat.st_mtime_ns or scan.size != stat.st_size:
+                    try:
+                        scan = index_file(path)
+                    except (OSError, ValueError):
+                        logger.warning("Could not index %s", path, exc_info=True)
+                        continue
+                scans[path] = scan
+
+        self._scans = scans
+        if self.cache_path is not None:
+            self._save_cache(self.cache_path)
+        return self.scans
+
+    @property
+    def scans(self) -> list[ScanIndex]:
+        """All indexed scans, in the order they started, as of the last :py:obj:`refresh`."""
+        return sorted(self._scans.values(), key=lambda scan: scan.time_start)
+
+    def find(
+        self,
+        *,
+        uid: str | None = None,
+        plan_name: str | None = None,
+        motor: str | None = None,
+        since: float | None = None,
+        until: float | None = None,
+    ) -> list[ScanIndex]:
+        """Find indexed scans matching all of the given criteria.
+
+        Args:
+            uid: the start of the scan's unique identifier.
+            plan_name: the name of the plan which produced the scan.
+            motor: the name of a motor which was scanned.
+            since: only include scans which started at or after this unix timestamp.
+            until: only include scans which started at or before this unix timestamp.
+
+        Returns:
+            The matching scans, in the order they started.
+
+        """
+        return [
+            scan
+            for scan in self.scans
+            if (uid is None or scan.uid.startswith(uid))
+            and (plan_name is None or scan.plan_name == plan_name)
+            and (motor is None or motor in scan.motors)
+            and (since is None or scan.time_start >= since)
+            and (until is None or scan.time_start <= until)
+        ]
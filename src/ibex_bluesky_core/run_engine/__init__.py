@@ -16,10 +16,11 @@ from ibex_bluesky_core.callbacks import DocLoggingCallback, KafkaCallback
 from ibex_bluesky_core.plan_stubs import CALL_QT_AWARE_MSG_KEY, CALL_SYNC_MSG_KEY
 from ibex_bluesky_core.preprocessors import add_rb_number_processor
 from ibex_bluesky_core.run_engine._msg_handlers import call_qt_aware_handler, call_sync_handler
+from ibex_bluesky_core.run_engine._profiling import CallbackProfiler
 from ibex_bluesky_core.utils import is_matplotlib_backend_qt
 from ibex_bluesky_core.version import version
 
-__all__ = ["get_run_engine", "run_plan"]
+__all__ = ["CallbackProfiler", "get_run_engine", "run_plan"]
 
 logger = logging.getLogger(__name__)
 
@@ -0,0 +1,268 @@
+"""Measure how long each callback subscribed to a run engine takes to process documents."""
+
+import bisect
+import inspect
+import logging
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from bluesky.run_engine import RunEngine
+from bluesky.utils import CallbackRegistry
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["CallbackProfiler"]
+
+
+@dataclass(kw_only=True)
+class _Timings:
+    count: int = 0
+    total_s: float = 0.0
+    max_s: float = 0.0
+    slow: int = 0
+    histogram: list[int] = field(default_factory=list)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_s": self.total_s,
+            "mean_s": self.total_s / self.count,
+            "max_s": self.max_s,
+            "slow": self.slow,
+            "histogram": list(self.histogram),
+        }
+
+
+class _TimedCallback:
+    """Registry entry which times a subscribed callback, in place of its bluesky proxy."""
+
+    def __init__(
+        self,
+        call: Callable[..., None],
+        sig: Any,  # noqa: ANN401
+        cid: int,
+        proxy: Any,  # noqa: ANN401
+    ) -> None:
+        self.call = call
+        self.sig = sig
+        self.cid = cid
+        self.proxy = proxy
+
+    def __call__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        self.call(self, *args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        # Look like the proxy, so the registry can still find and remove dead callbacks.
+        return getattr(self.proxy, name)
+
+    def __hash__(self) -> int:
+        return hash(self.proxy)
+
+
+def _callback_name(func: Any) -> str:  # noqa: ANN401
+    # Callbacks are wrapped in a bluesky _BoundMethodProxy.
+    target = getattr(func, "func", func)
+    klass = getattr(func, "klass", None)
+    if klass is not None:
+        return f"{klass.__name__}.{target.__name__}"
+    if inspect.isfunction(target) or inspect.ismethod(target):
+        return target.__qualname__
+    return type(target).__name__
+
+
+class CallbackProfiler:
+    """Measure how long each callback subscribed to a run engine takes to process documents."""
+
+    def __init__(
+        self,
+        *,
+        warn_threshold_s: float | None = 0.1,
+        histogram_edges_s: Sequence[float] = (0.0001, 0.001, 0.01, 0.1, 1.0),
+    ) -> None:
+        """Measure how long each callback subscribed to a run engine takes to process documents.
+
+        The bluesky :py:obj:`~bluesky.run_engine.RunEngine` passes each document to every
+        subscribed callback in turn, on the run engine's thread, so a slow callback slows
+        down the whole scan. Once installed using :py:obj:`install`, this profiler times
+        every callback, for each type of document, and keeps a histogram of these times.
+
+        When each run stops, once every callback has processed the stop document, a summary
+        of the run is logged and stored in :py:obj:`last_run_summary`.
+
+        .. note::
+
+            Callbacks which use :py:obj:`~bluesky.callbacks.mpl_plotting.QtAwareCallback`,
+            such as :py:obj:`~ibex_bluesky_core.callbacks.LivePlot`, may pass documents to
+            another thread when using the Qt matplotlib backend. In that case, only the time
+            taken to pass on each document is measured.
+
+        Args:
+            warn_threshold_s: Log a warning, once per run for each callback and document
+                type, if a callback takes longer than this to process a document.
+                :py:obj:`None` to never warn.
+            histogram_edges_s: Upper edges, in seconds, of the histogram bins. A final bin
+                counts any longer times.
+
+        """
+        self.warn_threshold_s = warn_threshold_s
+        self.histogram_edges_s = list(histogram_edges_s)
+
+        self.last_run_summary: dict[str, Any] | None = None
+        """Summary of the last run to stop, including the time taken to process its stop
+        document, or :py:obj:`None` if no run has stopped yet."""
+
+        self._timings: dict[str, dict[str, _Timings]] = {}
+        self._names: dict[Any, str] = {}
+        self._warned: set[tuple[str, str]] = set()
+        self._run_uid: str | None = None
+        self._registry: CallbackRegistry | None = None
+
+    def install(self, RE: RunEngine) -> None:
+        """Start timing the callbacks subscribed to a run engine.
+
+        This includes callbacks which are already subscribed, and any which are subscribed
+        later, for example by :py:obj:`~bluesky.preprocessors.subs_decorator`.
+
+        Args:
+            RE: The run engine, for example from
+                :py:obj:`~ibex_bluesky_core.run_engine.get_run_engine`.
+
+        """
+        if self._registry is not None:
+            raise RuntimeError("CallbackProfiler is already installed")
+        registry = self._registry = RE.dispatcher.cb_registry
+        for sig, callbacks in registry.callbacks.items():
+            for cid in callbacks:
+                self._wrap(sig, cid)
+        # Wraps callbacks as they are subscribed, for this registry instance only.
+        registry.connect = self._connect
+
+    def uninstall(self) -> None:
+        """Stop timing callbacks."""
+        registry = self._registry
+        if registry is not None:
+            del registry.connect
+            for callbacks in registry.callbacks.values():
+                callbacks.update(
+                    {
+                        cid: func.proxy
+                        for cid, func in callbacks.items()
+                        if isinstance(func, _TimedCallback)
+                    }
+                )
+            self._registry = None
+
+    def summary(self) -> dict[str, Any]:
+        """Summarise the times taken by each callback in the current (or last) run.
+
+        Returns:
+            A dictionary containing the histogram bin edges, under ``histogram_edges_s``, and
+            the timings, under ``callbacks``. For each callback and document type, this
+            contains the number of documents, the total, mean and maximum times taken, the
+            number of documents which took longer than the warning threshold, and the
+            histogram counts.
+
+        """
+        return {
+            "histogram_edges_s": list(self.histogram_edges_s),
+            "callbacks": {
+                name: {doc_name: timings.as_dict() for doc_name, timings in by_doc.items()}
+                for name, by_doc in self._timings.items()
+            },
+        }
+
+    def _connect(self, sig: Any, func: Any) -> int:  # noqa: ANN401
+        registry = self._registry
+        assert registry is not None
+        cid = CallbackRegistry.connect(registry, sig, func)
+        self._wrap(sig, cid)
+        return cid
+
+    def _wrap(self, sig: Any, cid: int) -> None:  # noqa: ANN401
+        assert self._registry is not None
+        callbacks = self._registry.callbacks[sig]
+        if not isinstance(callbacks[cid], _TimedCallback):
+            callbacks[cid] = _TimedCallback(self._call, sig, cid, callbacks[cid])
+
+    def _call(self, timed: _TimedCallback, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        doc_name = timed.sig.name
+        if doc_name == "start" and args[1].get("uid") != self._run_uid:
+            self._run_uid = args[1].get("uid")
+            self._timings = {}
+            self._warned = set()
+
+        start = time.perf_counter()
+        try:
+            timed.proxy(*args, **kwargs)
+        except ReferenceError:
+            # The callback's instance has been garbage-collected; the registry removes it.
+            raise
+        except Exception:
+            self._record(timed.proxy, doc_name, time.perf_counter() - start)
+            raise
+        else:
+            self._record(timed.proxy, doc_name, time.perf_counter() - start)
+        finally:
+            if doc_name == "stop" and self._is_last(timed):
+                self.last_run_summary = self.summary()
+                self._log_summary(self.last_run_summary)
+
+    def _is_last(self, timed: _TimedCallback) -> bool:
+        assert self._registry is not None
+        callbacks = self._registry.callbacks.get(timed.sig, {})
+        return next(reversed(callbacks), timed.cid) == timed.cid
+
+    def _name(self, func: Any) -> str:  # noqa: ANN401
+        name = self._names.get(func)
+        if name is None:
+            name = _callback_name(func)
+            others = sum(1 for other in self._names.values() if other.split("#")[0] == name)
+            if others:
+                name = f"{name}#{others + 1}"
+            self._names[func] = name
+        return name
+
+    def _record(self, func: Any, doc_name: str, elapsed_s: float) -> None:  # noqa: ANN401
+        name = self._name(func)
+        timings = self._timings.setdefault(name, {}).get(doc_name)
+        if timings is None:
+            timings = _Timings(histogram=[0] * (len(self.histogram_edges_s) + 1))
+            self._timings[name][doc_name] = timings
+
+        timings.count += 1
+        timings.total_s += elapsed_s
+        timings.max_s = max(timings.max_s, elapsed_s)
+        timings.histogram[bisect.bisect_left(self.histogram_edges_s, elapsed_s)] += 1
+
+        if self.warn_threshold_s is not None and elapsed_s > self.warn_threshold_s:
+            timings.slow += 1
+            if (name, doc_name) not in self._warned:
+                self._warned.add((name, doc_name))
+                logger.warning(
+                    "Callback %s took %.3fs to process a %s document (threshold %.3fs)",
+                    name,
+                    elapsed_s,
+                    doc_name,
+                    self.warn_threshold_s,
+                )
+
+    def _log_summary(self, summary: dict[str, Any]) -> None:
+        rows = sorted(
+            (
+                (name, doc_name, timings)
+                for name, by_doc in summary["callbacks"].items()
+                for doc_name, timings in by_doc.items()
+            ),
+            key=lambda row: row[2]["total_s"],
+            reverse=True,
+        )
+        logger.info(
+            "Callback timings for run:\n%s",
+            "\n".join(
+                f"  {name} ({doc_name}): count={t['count']} total={t['total_s']:.4f}s "
+                f"mean={t['mean_s']:.4f}s max={t['max_s']:.4f}s slow={t['slow']}"
+                for name, doc_name, t in rows
+            ),
+        )
@@ -1,7 +1,9 @@
 # pyright: reportMissingParameterType=false
+import numpy as np
 import pytest
 
 from ibex_bluesky_core.callbacks import CentreOfMass
+from ibex_bluesky_core.utils import center_of_mass_of_area_under_curve
 
 
 @pytest.mark.parametrize(
@@ -79,34 +81,90 @@ def test_compute_com(data: list[tuple[float, float]], expected_area_under_curve_
     for x, y in data:
         com.event({"data": {"x": x, "y": y}})  # type: ignore
 
+    # Live result, calculated incrementally
+    assert com.result == pytest.approx(expected_area_under_curve_com)
+
     com.stop({})  # type: ignore
 
     assert com.result == pytest.approx(expected_area_under_curve_com)
 
 
-def test_error_thrown_if_no_x_data_in_event():
-    com = CentreOfMass(x="motor", y="invariant")
-    com.event(
-        {
-            "data": {  # type: ignore
-                "invariant": 2,
-            }
-        }
-    )
+def test_live_result_matches_full_calculation_after_every_point():
+    rng = np.random.default_rng(seed=1234)
+    xs = rng.uniform(-10, 10, size=50)
+    ys = rng.normal(loc=5, scale=3, size=50)
+
+    com = CentreOfMass("x", "y")
+    com.start({})  # type: ignore
+    for i, (x, y) in enumerate(zip(xs, ys, strict=True)):
+        com.event({"data": {"x": x, "y": y}})  # type: ignore
+        expected, _ = center_of_mass_of_area_under_curve(xs[: i + 1], ys[: i + 1])
+        assert com.result == pytest.approx(expected)
+
 
-    with pytest.raises(ValueError, match=r"motor is not in event document."):
-        com.compute()
+def test_result_cleared_on_start():
+    com = CentreOfMass("x", "y")
+    com.start({})  # type: ignore
+    com.event({"data": {"x": 1, "y": 1}})  # type: ignore
+    com.stop({})  # type: ignore
+    assert com.result == 1
+
+    com.start({})  # type: ignore
+    assert com.result is None
+    com.event({"data": {"x": 3, "y": 1}})  # type: ignore
+    assert com.result == 3
 
 
-def test_error_thrown_if_no_y_data_in_event():
+@pytest.mark.parametrize(
+    ("data", "message"),
+    [
+        ({"invariant": 2}, r"motor is not in event document."),
+        ({"motor": 2}, r"invariant is not in event document."),
+    ],
+)
+def test_error_thrown_at_stop_if_field_not_in_event(data, message):
     com = CentreOfMass(x="motor", y="invariant")
-    com.event(
-        {
-            "data": {  # type: ignore
-                "motor": 2,
-            }
-        }
-    )
-
-    with pytest.raises(ValueError, match=r"invariant is not in event document."):
-        com.compute()
+    com.start({})  # type: ignore
+    com.event({"data": {"motor": 1, "invariant": 1}})  # type: ignore
+    com.event({"data": data})  # type: ignore
+    # The bad event is skipped, rather than stopping the scan.
+    assert com.result == 1
+
+    with pytest.raises(ValueError, match=message):
+        com.stop({})  # type: ignore
+
+    com.start({})  # type: ignore
+    com.event({"data": {"motor": 3, "invariant": 1}})  # type: ignore
+    com.stop({})  # type: ignore
+    assert com.result == 3
+
+
+def test_event_pages_give_same_result_as_events():
+    rng = np.random.default_rng(seed=1234)
+    xs = rng.uniform(-10, 10, size=50)
+    ys = rng.normal(loc=5, scale=3, size=50)
+    # Include equal x values, which are kept in the order they arrived.
+    xs[10:15] = xs[3]
+
+    com = CentreOfMass("x", "y")
+    com.start({})  # type: ignore
+    com.event_page({"data": {"x": [], "y": []}})  # type: ignore
+    assert com.result is None
+
+    com.event({"data": {"x": xs[0], "y": ys[0]}})  # type: ignore
+    for page in np.array_split(np.arange(1, 50), 4):
+        com.event_page({"data": {"x": xs[page], "y": ys[page]}})  # type: ignore
+        expected, _ = center_of_mass_of_area_under_curve(xs[: page[-1] + 1], ys[: page[-1] + 1])
+        assert com.result == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(("data", "missing"), [({"y": [2]}, "x"), ({"x": [2]}, "y")])
+def test_error_thrown_at_stop_if_field_not_in_event_page(data, missing):
+    com = CentreOfMass(x="x", y="y")
+    com.start({})  # type: ignore
+    com.event_page({"data": data})  # type: ignore
+    com.event_page({"data": {"x": [1]}})  # type: ignore
+    assert com.result is None
+
+    with pytest.raises(ValueError, match=rf"{missing} is not in event page document."):
+        com.stop({})  # type: ignore
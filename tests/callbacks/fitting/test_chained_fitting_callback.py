@@ -6,6 +6,7 @@ from _pytest.fixtures import FixtureRequest
 from bluesky.callbacks import LiveFitPlot
 from event_model import Event
 from lmfit import Parameter
+from matplotlib import pyplot as plt
 from matplotlib.axes import Axes
 
 from ibex_bluesky_core.callbacks import ChainedLiveFit
@@ -201,3 +202,25 @@ def test_axes_length_mismatch_raises_error(method: FitMethod, mock_axes: list[Ax
 
     with pytest.raises(ValueError, match="ax must be the same length as y"):
         ChainedLiveFit(method=method, y=y_vars, x=X_VAR, ax=mock_axes)
+
+
+@pytest.mark.parametrize("plot", [False, True])
+def test_event_page_fits_each_livefit_once(method: FitMethod, plot: bool):
+    ax = list(plt.subplots(nrows=2)[1]) if plot else None
+    clf = ChainedLiveFit(method=method, y=Y_VARS, x=X_VAR, ax=ax)
+    clf.start({"uid": "1", "time": 0})  # pyright: ignore
+
+    page = {"data": {"x": [0, 1, 2, 3], "y1": [1, 3, 5, 7], "y2": [2, 3, 4, 5]}}
+    with (
+        patch.object(clf._livefits[0], "update_fit", wraps=clf._livefits[0].update_fit) as fit1,
+        patch.object(clf._livefits[1], "update_fit", wraps=clf._livefits[1].update_fit) as fit2,
+    ):
+        assert clf.event_page(page) == page  # pyright: ignore
+    fit1.assert_called_once()
+    fit2.assert_called_once()
+
+    result1, result2 = clf._livefits[0].result, clf._livefits[1].result
+    assert result1 is not None
+    assert result2 is not None
+    assert result1.values["c1"] == pytest.approx(2)
+    assert result2.values["c1"] == pytest.approx(1)
@@ -250,3 +250,34 @@ def test_file_set_readonly_after_written(
         / f"{node()}_motor_invariant_2024-10-04_13-43-43Z{postfix}.txt"
     )
     mock_chmod.assert_called_with(fit_filepath, S_IRUSR | S_IRGRP | S_IROTH)
+
+
+def test_event_page_data_collected():
+    lf = LiveFit(Linear.fit(), y="y", x="x", yerr="yerr")
+    lfl = LiveFitLogger(lf, y="y", x="x", yerr="yerr", postfix="", output_dir=None)
+
+    lfl.event_page({"data": {"x": [1, 2], "y": [3, 4], "yerr": [0.5, 1]}})  # type: ignore
+
+    assert list(lfl.x_data) == [1, 2]
+    assert list(lfl.y_data) == [3, 4]
+    assert list(lfl.yerr_data) == [0.5, 1]
+
+    lfl_no_yerr = LiveFitLogger(lf, y="y", x="x", postfix="", output_dir=None)
+    lfl_no_yerr.event_page({"data": {"x": [1, 2], "y": [3, 4]}})  # type: ignore
+    assert list(lfl_no_yerr.yerr_data) == []
+
+
+@pytest.mark.parametrize(
+    ("data", "missing"),
+    [
+        ({"y": [1], "yerr": [1]}, "x"),
+        ({"x": [1], "yerr": [1]}, "y"),
+        ({"x": [1], "y": [1]}, "yerr"),
+    ],
+)
+def test_error_thrown_if_field_not_in_event_page(data, missing):
+    lf = LiveFit(Linear.fit(), y="y", x="x", yerr="yerr")
+    lfl = LiveFitLogger(lf, y="y", x="x", yerr="yerr", postfix="", output_dir=None)
+
+    with pytest.raises(IOError, match=rf"{missing} is not in event page document."):
+        lfl.event_page({"data": data})  # type: ignore
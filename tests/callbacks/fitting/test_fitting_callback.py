@@ -1,3 +1,7 @@
+# pyright: reportMissingParameterType=false
+import logging
+import threading
+import time
 import warnings
 from unittest import mock
 from unittest.mock import MagicMock
@@ -5,8 +9,10 @@ from unittest.mock import MagicMock
 import lmfit
 import numpy as np
 import numpy.typing as npt
+import pytest
 
 from ibex_bluesky_core.callbacks import LiveFit
+from ibex_bluesky_core.callbacks._fitting import _page_needs_fit
 from ibex_bluesky_core.fitting import FitMethod, Linear
 
 
@@ -162,3 +168,223 @@ def test_warning_if_no_y_data():
 
         assert len(w) == 1
         assert "LiveFitPlot cannot update fit until there are at least" in str(w[-1].message)
+
+
+def _linear_event(lf: LiveFit, x: float) -> None:
+    lf.event({"data": {"y": 2 * x + 1, "x": x}})  # type: ignore
+
+
+def _wait_for(condition, timeout_s: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout_s
+    while not condition():
+        assert time.monotonic() < deadline, "Timed out waiting for condition"
+        time.sleep(0.001)
+
+
+def test_background_fit_result_and_final_fit_at_stop():
+    lf = LiveFit(Linear.fit(), y="y", x="x", fit_in_background=True)
+    lf.start({"uid": "1", "time": 0})
+
+    _linear_event(lf, 0)
+    _linear_event(lf, 1)
+    _wait_for(lambda: lf.result is not None)
+    assert lf.result is not None
+    assert lf.result.values["c1"] == pytest.approx(2)
+
+    _linear_event(lf, 2)
+    fit_thread = lf._fit_thread
+    assert fit_thread is not None
+    lf.stop({"uid": "2", "run_start": "1", "time": 1, "exit_status": "success"})
+
+    # The final fit is always performed synchronously, using all of the data.
+    assert lf.result.ndata == 3
+    # The background thread is stopped when the run stops.
+    assert not fit_thread.is_alive()
+    assert lf.result.values["c0"] == pytest.approx(1)
+    assert lf.result.values["c1"] == pytest.approx(2)
+
+
+def test_background_fits_skip_stale_requests_and_warm_start():
+    method = Linear.fit()
+    fit_started = threading.Event()
+    release_fit = threading.Event()
+    guessed_data = []
+
+    def guess(x, y):
+        guessed_data.append(len(y))
+        if len(guessed_data) == 1:
+            fit_started.set()
+            release_fit.wait(5)
+        return {"c0": 100.0, "c1": lmfit.Parameter("c1", value=5, min=-10, max=10)}
+
+    method.guess = guess
+    lf = LiveFit(method, y="y", x="x", fit_in_background=True)
+    lf.start({"uid": "1", "time": 0})
+
+    with mock.patch.object(lf, "_fit", wraps=lf._fit) as fit:
+        _linear_event(lf, 0)
+        _linear_event(lf, 1)
+        assert fit_started.wait(5)
+        # Fits requested while the first fit is running; only the latest should run.
+        _linear_event(lf, 2)
+        _linear_event(lf, 3)
+        _linear_event(lf, 4)
+        release_fit.set()
+        _wait_for(lambda: fit.call_count == 2)
+
+    assert guessed_data == [2, 5]
+    # The second fit starts from the values of the first fit, keeping guessed bounds.
+    second_init_guess = fit.call_args_list[1].args[1]
+    assert second_init_guess["c0"] == pytest.approx(1)
+    assert second_init_guess["c1"].value == pytest.approx(2)
+    assert second_init_guess["c1"].min == -10
+
+
+def test_background_fit_from_previous_run_is_discarded():
+    method = Linear.fit()
+    fit_started = threading.Event()
+    release_fit = threading.Event()
+    original_guess = method.guess
+
+    def guess(x, y):
+        fit_started.set()
+        release_fit.wait(5)
+        return original_guess(x, y)
+
+    method.guess = guess
+    lf = LiveFit(method, y="y", x="x", fit_in_background=True)
+    lf.start({"uid": "1", "time": 0})
+
+    with mock.patch.object(lf, "_fit", wraps=lf._fit) as fit:
+        _linear_event(lf, 0)
+        _linear_event(lf, 1)
+        assert fit_started.wait(5)
+        lf.start({"uid": "2", "time": 0})
+        release_fit.set()
+        _wait_for(lambda: fit.call_count == 1)
+        # Allow the background thread time to (not) store the result.
+        time.sleep(0.05)
+
+    assert lf.result is None
+
+
+def test_background_fit_failure_is_logged(caplog):
+    method = Linear.fit()
+    method.guess = MagicMock(side_effect=ValueError("bad guess"))
+    lf = LiveFit(method, y="y", x="x", fit_in_background=True)
+    lf.start({"uid": "1", "time": 0})
+
+    with caplog.at_level(logging.ERROR, logger="ibex_bluesky_core.callbacks._fitting"):
+        _linear_event(lf, 0)
+        _linear_event(lf, 1)
+        _wait_for(lambda: "Background fit" in caplog.text)
+
+    assert lf.result is None
+
+
+def test_background_fit_thread_stopped_after_each_run():
+    lf = LiveFit(Linear.fit(), y="y", x="x", fit_in_background=True)
+    for uid in ("1", "2"):
+        lf.start({"uid": uid, "time": 0})
+        _linear_event(lf, 0)
+        _linear_event(lf, 1)
+        fit_thread = lf._fit_thread
+        assert fit_thread is not None
+        lf.stop({"uid": "stop", "run_start": uid, "time": 1, "exit_status": "success"})
+        assert not fit_thread.is_alive()
+        assert lf._fit_thread is None
+
+    # Stopping a run which never started a background fit does nothing.
+    lf.start({"uid": "3", "time": 0})
+    lf.stop({"uid": "stop", "run_start": "3", "time": 1, "exit_status": "success"})
+    assert lf.result is None
+
+
+def _linear_page(lf: LiveFit, xs: list[float]) -> None:
+    lf.event_page(
+        {"data": {"x": xs, "y": [2 * x + 1 for x in xs], "yerr": [1.0] * len(xs)}}  # type: ignore
+    )
+
+
+@pytest.mark.parametrize("update_every", [1, 3])
+def test_event_page_fits_once_with_same_result_as_events(update_every):
+    paged = LiveFit(Linear.fit(), y="y", x="x", yerr="yerr", update_every=update_every)
+    evented = LiveFit(Linear.fit(), y="y", x="x", yerr="yerr", update_every=update_every)
+    paged.start({"uid": "1", "time": 0})
+    evented.start({"uid": "1", "time": 0})
+
+    with mock.patch.object(paged, "update_fit", wraps=paged.update_fit) as update_fit:
+        _linear_page(paged, [0, 1, 2, 3, 4])
+    update_fit.assert_called_once()
+
+    for x in [0, 1, 2, 3, 4]:
+        _linear_page(evented, [x])
+
+    assert paged.result is not None
+    assert evented.result is not None
+    assert paged.result.values == pytest.approx(evented.result.values)
+    np.testing.assert_array_equal(paged.weight_data, [1.0] * 5)
+
+
+@pytest.mark.parametrize(
+    ("update_every", "fits_at_stop"),
+    [
+        # The last page was already fitted, so the fit is up to date.
+        (1, 0),
+        # The last page was not fitted, so the fit is updated at stop.
+        (None, 1),
+    ],
+)
+def test_stop_updates_fit_only_if_data_arrived_since_last_fit(update_every, fits_at_stop):
+    lf = LiveFit(Linear.fit(), y="y", x="x", update_every=update_every)
+    lf.start({"uid": "1", "time": 0})
+    _linear_event(lf, 0)
+    _linear_page(lf, [1, 2])
+    lf.event_page({"data": {"other": [0]}})  # type: ignore
+
+    with mock.patch.object(lf, "update_fit", wraps=lf.update_fit) as update_fit:
+        lf.stop({"uid": "2", "run_start": "1", "time": 1, "exit_status": "success"})
+
+    assert update_fit.call_count == fits_at_stop
+    assert lf.result is not None
+    assert lf.result.ndata == 3
+
+
+def test_event_page_without_enough_points_or_update_every_does_not_fit():
+    lf = LiveFit(Linear.fit(), y="y", x="x", update_every=None)
+    lf.start({"uid": "1", "time": 0})
+
+    with mock.patch.object(lf, "update_fit") as update_fit:
+        lf.event_page({"data": {"x": [0, 1, 2], "y": [1, 2, 3]}})  # type: ignore
+        lf.event_page({"data": {"other": [0]}})  # type: ignore
+    update_fit.assert_not_called()
+    assert list(lf.ydata) == [1, 2, 3]
+
+
+@pytest.mark.parametrize(
+    ("num_before", "num_after", "update_every"),
+    [
+        (before, after, every)
+        for every in (1, 2, 3)
+        for before in range(6)
+        for after in range(before, 9)
+    ],
+)
+def test_page_needs_fit_matches_per_event_updates(num_before, num_after, update_every):
+    # As in LiveFit.event, for each point i arriving one at a time.
+    num_params = 2
+    expected = any(
+        i == num_params or (i > num_params and (i - 1) % update_every == 0)
+        for i in range(num_before + 1, num_after + 1)
+    )
+    assert _page_needs_fit(num_before, num_after, num_params, update_every) == expected
+
+
+def test_event_page_with_zero_yerr_warns_and_gives_zero_weight():
+    lf = LiveFit(Linear.fit(), y="y", x="x", yerr="yerr", update_every=None)
+    lf.start({"uid": "1", "time": 0})
+
+    with pytest.warns(UserWarning, match=r"standard deviation for y is 0"):
+        lf.event_page({"data": {"x": [0, 1], "y": [1, 2], "yerr": [0, 0.5]}})  # type: ignore
+
+    np.testing.assert_array_equal(lf.weight_data, [0, 2])
@@ -1,8 +1,11 @@
 # pyright: reportMissingParameterType=false
 # pyright: reportArgumentType=false
+from unittest.mock import patch
+
 import numpy as np
 import pytest
-from event_model import EventDescriptor, RunStart, RunStop
+import scipp as sc
+from event_model import EventDescriptor, RunStart, RunStop, unpack_event_page
 from matplotlib import pyplot as plt
 
 from ibex_bluesky_core.callbacks import LivePColorMesh
@@ -10,6 +13,7 @@ from ibex_bluesky_core.callbacks.reflectometry import (
     DetMapAngleScanLiveDispatcher,
     DetMapHeightScanLiveDispatcher,
 )
+from ibex_bluesky_core.devices.simpledae import VARIANCE_ADDITION
 
 FAKE_START_DOC: RunStart = {"uid": "1"}  # type: ignore
 FAKE_DESCRIPTOR: EventDescriptor = {"uid": "2", "data_keys": {}}  # type: ignore
@@ -24,11 +28,10 @@ def test_angle_scan_livedispatcher():
         y_out_name="summed_counts",
     )
 
-    captured_events = []
+    captured_docs = []
 
     def sub(doc_typ, doc):
-        if doc_typ == "event":
-            captured_events.append(doc)
+        captured_docs.append((doc_typ, doc))
 
     dispatcher.subscribe(sub)
 
@@ -36,7 +39,8 @@ def test_angle_scan_livedispatcher():
     dispatcher.stop(FAKE_STOP_DOC)
 
     # No events should be emitted if no descriptor emitted
-    assert captured_events == []
+    assert [doc_typ for doc_typ, _ in captured_docs] == ["start", "stop"]
+    captured_docs.clear()
 
     dispatcher.start(FAKE_START_DOC)
     dispatcher.descriptor(FAKE_DESCRIPTOR)
@@ -69,6 +73,20 @@ def test_angle_scan_livedispatcher():
 
     dispatcher.stop(FAKE_STOP_DOC)
 
+    # All points are emitted together, as one event page, under a new descriptor.
+    assert [doc_typ for doc_typ, _ in captured_docs] == [
+        "start",
+        "descriptor",
+        "event_page",
+        "stop",
+    ]
+    descriptor = captured_docs[1][1]
+    event_page = captured_docs[2][1]
+    assert set(descriptor["data_keys"]) == {"angle", "summed_counts", "summed_counts_err"}
+    assert event_page["descriptor"] == descriptor["uid"]
+    assert event_page["seq_num"] == [1, 2, 3, 4]
+
+    captured_events = list(unpack_event_page(event_page))
     assert len(captured_events) == 4
 
     assert captured_events[0]["data"]["angle"] == pytest.approx(-1)
@@ -149,6 +167,164 @@ def test_height_scan_livedispatcher_zero_monitor():
         )
 
 
+def _scipp_height_scan_reference(
+    det_data, mon_data, flood: sc.Variable | None
+) -> tuple[float, float]:
+    det = sc.Variable(dims=["spectrum"], values=det_data, variances=det_data, dtype="float64")
+    mon = sc.Variable(dims=["spectrum"], values=mon_data, variances=mon_data, dtype="float64")
+    if flood is not None:
+        det /= flood
+    det_sum = det.sum()
+    det_sum.variance += VARIANCE_ADDITION
+    normalized = det_sum / mon.sum()
+    return normalized.value, np.sqrt(normalized.variance)
+
+
+FLOODS = [
+    None,
+    sc.scalar(value=2.5, dtype="float64"),
+    sc.array(dims=["spectrum"], values=np.linspace(0.5, 1.5, 50)),
+    sc.array(
+        dims=["spectrum"],
+        values=np.linspace(0.5, 1.5, 50),
+        variances=np.linspace(0.01, 0.1, 50),
+    ),
+]
+
+
+@pytest.mark.parametrize("flood", FLOODS)
+def test_height_scan_livedispatcher_matches_scipp(flood):
+    rng = np.random.default_rng(seed=1)
+    dispatcher = DetMapHeightScanLiveDispatcher(
+        mon_name="mon", det_name="det", out_name="normalized_counts", flood=flood
+    )
+
+    captured_events = []
+    dispatcher.subscribe(lambda name, doc: captured_events.append(doc) if name == "event" else None)
+    dispatcher.start(FAKE_START_DOC)
+    dispatcher.descriptor(FAKE_DESCRIPTOR)
+
+    for _ in range(3):
+        det_data = rng.integers(0, 1000, size=50)
+        mon_data = rng.integers(1, 1000, size=2)
+        dispatcher.event({"data": {"mon": mon_data, "det": det_data}, "descriptor": "2"})
+
+        value, error = _scipp_height_scan_reference(det_data, mon_data, flood)
+        assert captured_events[-1]["data"]["normalized_counts"] == pytest.approx(value, rel=1e-12)
+        assert captured_events[-1]["data"]["normalized_counts_err"] == pytest.approx(
+            error, rel=1e-12
+        )
+
+
+@pytest.mark.parametrize("flood", FLOODS)
+def test_height_scan_livedispatcher_event_pages_match_scipp(flood):
+    rng = np.random.default_rng(seed=1)
+    dispatcher = DetMapHeightScanLiveDispatcher(
+        mon_name="mon", det_name="det", out_name="normalized_counts", flood=flood
+    )
+
+    captured_docs = []
+    dispatcher.subscribe(lambda name, doc: captured_docs.append((name, doc)))
+    dispatcher.start(FAKE_START_DOC)
+    dispatcher.descriptor(FAKE_DESCRIPTOR)
+
+    det_data = rng.integers(0, 1000, size=(5, 50))
+    mon_data = rng.integers(1, 1000, size=(5, 2))
+    page = {"data": {"mon": mon_data[:3], "det": det_data[:3]}, "descriptor": "2"}
+    dispatcher.event_page({**page, "seq_num": [1, 2, 3]})
+    dispatcher.event_page(
+        {"data": {"mon": mon_data[3:], "det": det_data[3:]}, "descriptor": "2", "seq_num": [4, 5]}
+    )
+
+    # One descriptor, shared by both pages.
+    assert [name for name, _ in captured_docs] == [
+        "start",
+        "descriptor",
+        "event_page",
+        "event_page",
+    ]
+    descriptor = captured_docs[1][1]
+    assert descriptor["data_keys"]["det"]["shape"] == [50]
+    assert descriptor["data_keys"]["normalized_counts"]["dtype"] == "number"
+
+    events = [event for _, page in captured_docs[2:] for event in unpack_event_page(page)]
+    assert [event["seq_num"] for event in events] == [1, 2, 3, 4, 5]
+    for event, det, mon in zip(events, det_data, mon_data, strict=True):
+        value, error = _scipp_height_scan_reference(det, mon, flood)
+        assert event["descriptor"] == descriptor["uid"]
+        assert event["data"]["normalized_counts"] == pytest.approx(value, rel=1e-12)
+        assert event["data"]["normalized_counts_err"] == pytest.approx(error, rel=1e-12)
+
+
+def test_height_scan_livedispatcher_event_page_zero_monitor():
+    dispatcher = DetMapHeightScanLiveDispatcher(
+        mon_name="mon", det_name="det", out_name="normalized_counts"
+    )
+    dispatcher.start(FAKE_START_DOC)
+    dispatcher.descriptor(FAKE_DESCRIPTOR)
+
+    with pytest.raises(ValueError, match=r"No monitor counts"):
+        dispatcher.event_page(
+            {
+                "data": {"mon": np.array([[1], [0]]), "det": np.array([[1, 2], [3, 4]])},
+                "descriptor": "2",
+                "seq_num": [1, 2],
+            }
+        )
+
+
+@pytest.mark.parametrize("flood", FLOODS)
+def test_angle_scan_livedispatcher_event_pages_match_events(flood):
+    rng = np.random.default_rng(seed=1)
+    counts = rng.integers(0, 1000, size=(5, 50))
+
+    results = []
+    for use_pages in (False, True):
+        dispatcher = DetMapAngleScanLiveDispatcher(
+            x_name="angle",
+            x_data=np.linspace(-1, 2, num=50),
+            y_in_name="det",
+            y_out_name="summed_counts",
+            flood=flood,
+        )
+        dispatcher.start(FAKE_START_DOC)
+        dispatcher.descriptor(FAKE_DESCRIPTOR)
+        if use_pages:
+            for rows in (counts[:2], counts[2:]):
+                dispatcher.event_page(
+                    {"data": {"det": rows}, "descriptor": "2", "seq_num": list(range(len(rows)))}
+                )
+        else:
+            for row in counts:
+                dispatcher.event({"data": {"det": row}, "descriptor": "2"})
+        results.append(dispatcher.y_data)
+
+    from_events, from_pages = results
+    np.testing.assert_allclose(from_pages.values, from_events.values, rtol=1e-12)
+    np.testing.assert_allclose(from_pages.variances, from_events.variances, rtol=1e-12)
+
+
+def test_angle_scan_livedispatcher_event_page_wrong_shape():
+    dispatcher = DetMapAngleScanLiveDispatcher(
+        x_name="angle", x_data=np.linspace(-1, 2, num=4), y_in_name="det", y_out_name="counts"
+    )
+
+    with pytest.raises(ValueError, match=r"Shape of data .* does not match .*"):
+        dispatcher.event_page(
+            {"data": {"det": np.zeros((2, 3))}, "descriptor": "2", "seq_num": [1, 2]}
+        )
+
+
+def test_height_scan_livedispatcher_rejects_scalar_flood_with_variance():
+    with pytest.raises(ValueError, match=r"scalar flood correction cannot have variances"):
+        DetMapHeightScanLiveDispatcher(
+            mon_name="mon",
+            det_name="det",
+            out_name="normalized_counts",
+            flood=sc.scalar(value=2.0, variance=0.1),
+        )
+
+
 def test_live_pcolormap():
     _, ax = plt.subplots()
     cb = LivePColorMesh(y="y", x="x", x_name="angle", x_coord=np.array([1, 2, 3]), ax=ax)
@@ -177,3 +353,110 @@ def test_live_pcolormap():
     np.testing.assert_equal(cb._data, np.array([[11, 12, 13], [33, 44, 55]]))
 
     cb.stop(FAKE_STOP_DOC)
+
+
+def _mesh_event(cb: LivePColorMesh, y: float, x) -> None:
+    cb.event({"data": {"y": y, "x": np.asarray(x)}, "descriptor": "2"})  # type: ignore
+
+
+def test_live_pcolormap_grows_buffer_and_updates_mesh_in_place():
+    _, ax = plt.subplots()
+    cb = LivePColorMesh(
+        y="y", x="x", x_coord=np.array([1, 2, 3]), ax=ax, max_redraw_rate_hz=None, shading="auto"
+    )
+    cb.start(FAKE_START_DOC)
+
+    _mesh_event(cb, 0, [np.nan, np.nan, np.nan])
+    first_mesh = cb._mesh
+    for i in range(1, 16):
+        _mesh_event(cb, i, [i, i + 1, i + 2])
+    # Buffer is not full yet, so the existing mesh is reused.
+    assert cb._mesh is first_mesh
+
+    _mesh_event(cb, 16, [np.nan, np.nan, np.nan])
+    _mesh_event(cb, 17, [-5, 100, np.nan])
+    assert cb._mesh is not first_mesh
+    assert len(ax.collections) == 1
+    assert cb._buffer.shape == (32, 3)
+    np.testing.assert_equal(cb._data[-1], [-5, 100, np.nan])
+
+    assert cb._mesh is not None
+    assert cb._mesh.get_clim() == (-5, 100)
+    assert ax.get_xlim() == (0.5, 3.5)
+    assert ax.get_ylim() == (-0.5, 17.5)
+
+    # Edges match those calculated by pcolormesh for the same data, and unused rows have no height.
+    expected = ax.pcolormesh([1, 2, 3], np.arange(18), cb._data, shading="nearest")
+    coordinates = np.asarray(cb._mesh.get_coordinates())
+    np.testing.assert_allclose(coordinates[:19], np.asarray(expected.get_coordinates()))
+    np.testing.assert_allclose(coordinates[19:, :, 1], 17.5)
+
+
+def test_live_pcolormap_redraws_are_throttled():
+    _, ax = plt.subplots()
+    cb = LivePColorMesh(y="y", x="x", x_coord=np.array([1, 2, 3]), ax=ax, max_redraw_rate_hz=5)
+    cb.start(FAKE_START_DOC)
+
+    with (
+        patch("ibex_bluesky_core.callbacks._plotting.time.monotonic", return_value=100.0),
+        patch.object(ax.figure.canvas, "draw_idle") as draw_idle,
+    ):
+        _mesh_event(cb, 0, [1, 2, 3])
+        _mesh_event(cb, 1, [1, 2, 3])
+        _mesh_event(cb, 2, [1, 2, 3])
+        assert draw_idle.call_count == 1
+
+        cb.stop(FAKE_STOP_DOC)
+        assert draw_idle.call_count == 2
+
+        # Nothing pending, so no further redraw.
+        cb.stop(FAKE_STOP_DOC)
+        assert draw_idle.call_count == 2
+
+
+def test_live_pcolormap_held_back_redraw_drawn_by_timer():
+    _, ax = plt.subplots()
+    cb = LivePColorMesh(y="y", x="x", x_coord=np.array([1, 2, 3]), ax=ax, max_redraw_rate_hz=5)
+    cb.start(FAKE_START_DOC)
+
+    with (
+        patch("ibex_bluesky_core.callbacks._plotting.time.monotonic", return_value=100.0),
+        patch.object(ax.figure.canvas, "draw_idle") as draw_idle,
+        patch.object(ax.figure.canvas, "new_timer") as new_timer,
+    ):
+        _mesh_event(cb, 0, [1, 2, 3])
+        _mesh_event(cb, 1, [1, 2, 3])
+        new_timer.assert_called_once_with(interval=200)
+        (on_timer,), _ = new_timer.return_value.add_callback.call_args
+        assert draw_idle.call_count == 1
+
+        on_timer()
+        assert draw_idle.call_count == 2
+        cb.stop(FAKE_STOP_DOC)
+        assert draw_idle.call_count == 2
+
+
+def test_live_pcolormap_unsupported_shading():
+    _, ax = plt.subplots()
+    with pytest.raises(ValueError, match="does not support 'gouraud' shading"):
+        LivePColorMesh(y="y", x="x", x_coord=np.array([1, 2, 3]), ax=ax, shading="gouraud")
+
+
+def test_live_pcolormap_event_pages():
+    _, ax = plt.subplots()
+    cb = LivePColorMesh(y="y", x="x", x_coord=np.array([1, 2, 3]), ax=ax, max_redraw_rate_hz=None)
+    cb.start(FAKE_START_DOC)
+
+    with patch.object(cb, "update_plot", wraps=cb.update_plot) as update_plot:
+        cb.event_page({"data": {"y": [], "x": np.empty((0, 3))}})  # type: ignore
+        cb.event_page({"data": {"y": [0], "x": np.full((1, 3), np.nan)}})  # type: ignore
+        cb.event_page(
+            {"data": {"y": list(range(1, 21)), "x": np.arange(60).reshape(20, 3)}}  # type: ignore
+        )
+    assert update_plot.call_count == 2
+
+    assert cb._buffer.shape == (32, 3)
+    np.testing.assert_equal(cb._data[0], [np.nan, np.nan, np.nan])
+    np.testing.assert_equal(cb._data[1:], np.arange(60).reshape(20, 3))
+    assert cb._y_coords == list(range(21))
+    assert (cb._vmin, cb._vmax) == (0, 59)
@@ -0,0 +1,188 @@
+# pyright: reportMissingParameterType=false
+import logging
+import threading
+from typing import Any
+
+import pytest
+
+from ibex_bluesky_core.callbacks import BackgroundCallback
+
+
+class _Recorder:
+    def __init__(self, release: threading.Event | None = None) -> None:
+        self.documents: list[tuple[str, Any]] = []
+        self.threads: set[str] = set()
+        self.release = release
+
+    def __call__(self, name: str, doc: dict[str, Any]) -> None:
+        if self.release is not None:
+            self.release.wait(5)
+        self.documents.append((name, doc))
+        self.threads.add(threading.current_thread().name)
+
+
+def _run(callback: BackgroundCallback, num_events: int) -> None:
+    callback("start", {"uid": "0"})
+    callback("descriptor", {"uid": "1"})
+    for seq_num in range(1, num_events + 1):
+        callback("event", {"seq_num": seq_num})
+    callback("stop", {"run_start": "0"})
+
+
+def test_documents_passed_on_in_order_on_worker_thread():
+    recorder = _Recorder()
+    callback = BackgroundCallback(recorder, maxsize=2)
+
+    _run(callback, 10)
+
+    assert [name for name, _ in recorder.documents] == [
+        "start",
+        "descriptor",
+        *["event"] * 10,
+        "stop",
+    ]
+    assert [doc["seq_num"] for name, doc in recorder.documents if name == "event"] == list(
+        range(1, 11)
+    )
+    assert recorder.threads == {"BackgroundCallback-_Recorder"}
+    assert callback.dropped == 0
+
+
+def test_drop_overflow_drops_only_events(caplog):
+    release = threading.Event()
+    recorder = _Recorder(release)
+    callback = BackgroundCallback(recorder, maxsize=3, overflow="drop")
+
+    callback("start", {"uid": "0"})
+    callback("descriptor", {"uid": "1"})
+    for seq_num in range(1, 11):
+        callback("event", {"seq_num": seq_num})
+    release.set()
+    callback("stop", {"run_start": "0"})
+
+    names = [name for name, _ in recorder.documents]
+    assert names[:2] == ["start", "descriptor"]
+    assert names[-1] == "stop"
+    assert 0 < names.count("event") < 10
+    assert callback.dropped == 10 - names.count("event")
+    assert "dropped" in caplog.text
+
+
+def test_without_drain_on_stop_run_can_finish_first():
+    release = threading.Event()
+    recorder = _Recorder(release)
+    callback = BackgroundCallback(recorder, drain_on_stop=False)
+
+    _run(callback, 1)
+    assert not callback.flush(0.01)
+
+    release.set()
+    assert callback.flush(5)
+    assert len(recorder.documents) == 4
+
+
+def test_callback_errors_are_logged_and_counted(caplog):
+    def failing(name: str, doc: dict[str, Any]) -> None:
+        if name == "event":
+            raise ValueError("bad event")
+
+    callback = BackgroundCallback(failing)
+    with caplog.at_level(logging.ERROR):
+        _run(callback, 2)
+
+    assert callback.errors == 2
+    assert "failed to process event document" in caplog.text
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"maxsize": 0}, "maxsize must be at least 1"),
+        ({"overflow": "other"}, "overflow must be 'block' or 'drop'"),
+    ],
+)
+def test_invalid_arguments(kwargs, message):
+    with pytest.raises(ValueError, match=message):
+        BackgroundCallback(_Recorder(), **kwargs)
+
+
+def test_repr_includes_wrapped_callback():
+    def wrapped(name: str, doc: dict[str, Any]) -> None:
+        pass
+
+    assert repr(BackgroundCallback(wrapped)).startswith("BackgroundCallback(<function")
+
+
+def _background_threads() -> list[threading.Thread]:
+    return [t for t in threading.enumerate() if t.name == "BackgroundCallback-_Recorder"]
+
+
+def test_worker_thread_exits_after_each_run():
+    recorder = _Recorder()
+    callback = BackgroundCallback(recorder)
+
+    for _ in range(3):
+        _run(callback, 2)
+        assert _background_threads() == []
+
+    assert [name for name, _ in recorder.documents].count("start") == 3
+
+
+def test_next_run_waits_for_previous_worker():
+    release = threading.Event()
+    recorder = _Recorder(release)
+    callback = BackgroundCallback(recorder, drain_on_stop=False)
+
+    _run(callback, 1)
+    _run(callback, 1)
+    release.set()
+    assert callback.flush(5)
+
+    assert [name for name, _ in recorder.documents] == ["start", "descriptor", "event", "stop"] * 2
+    assert _background_threads() == []
+
+
+def test_close_stops_worker_part_way_through_run():
+    recorder = _Recorder()
+    callback = BackgroundCallback(recorder)
+
+    assert callback.close()
+    callback("start", {"uid": "0"})
+    assert callback.flush(5)
+    assert len(_background_threads()) == 1
+    assert callback.close(5)
+    assert callback.close()
+    assert _background_threads() == []
+    assert recorder.documents == [("start", {"uid": "0"})]
+
+    callback("stop", {"run_start": "0"})
+    assert [name for name, _ in recorder.documents] == ["start", "stop"]
+
+
+def test_blocked_puts_and_queue_depth_are_counted(caplog):
+    release = threading.Event()
+    recorder = _Recorder(release)
+    callback = BackgroundCallback(recorder, maxsize=1)
+    threading.Timer(0.05, release.set).start()
+
+    with caplog.at_level(logging.WARNING):
+        _run(callback, 2)
+
+    assert len(recorder.documents) == 5
+    assert callback.blocked_puts > 0
+    assert callback.max_queue_depth == 1
+    assert "queue full, blocked for" in caplog.text
+
+
+def test_stop_timeout_is_logged(caplog):
+    release = threading.Event()
+    recorder = _Recorder(release)
+    callback = BackgroundCallback(recorder, stop_timeout_s=0.01)
+
+    with caplog.at_level(logging.ERROR):
+        _run(callback, 1)
+    release.set()
+
+    assert "Timed out after 0.01s waiting for" in caplog.text
+    assert callback.flush(5)
+    assert len(recorder.documents) == 4
@@ -0,0 +1,171 @@
+# pyright: reportMissingParameterType=false
+# pyright: reportArgumentType=false
+import json
+import logging
+import os
+from pathlib import Path
+from platform import node
+from stat import S_IWUSR
+from typing import Any
+
+import numpy as np
+import pytest
+from event_model import compose_run
+
+from ibex_bluesky_core.callbacks import BinaryFileCallback, load_binary_scan
+from ibex_bluesky_core.callbacks._binary_file_writer import HEADER_FILE
+
+DATA_KEYS: dict[str, Any] = {
+    "block": {"dtype": "number", "shape": [], "source": "pv:block", "units": "mm", "precision": 3},
+    "spectra": {"dtype": "array", "shape": [3], "source": "pv:spectra"},
+}
+
+
+def _run(callback: BinaryFileCallback, pages: bool = False, **start_kwargs: Any) -> None:
+    bundle = compose_run(
+        metadata={"rb_number": "1234", "motors": ("block",), **start_kwargs},
+    )
+    callback("start", bundle.start_doc)
+    primary = bundle.compose_descriptor(name="primary", data_keys=DATA_KEYS)
+    callback("descriptor", primary.descriptor_doc)
+    baseline = bundle.compose_descriptor(name="baseline", data_keys={"other": DATA_KEYS["block"]})
+    callback("descriptor", baseline.descriptor_doc)
+    callback(
+        "event_page",
+        baseline.compose_event_page(
+            data={"other": [5.0]}, timestamps={"other": [0.0]}, seq_num=[1], time=[0.0]
+        ),
+    )
+
+    values = [{"block": float(i), "spectra": np.arange(3) * i} for i in range(4)]
+    for i in range(2):
+        callback(
+            "event", primary.compose_event(data=values[i], timestamps=dict.fromkeys(values[i], 0.0))
+        )
+    if pages:
+        callback(
+            "event_page",
+            primary.compose_event_page(
+                data={
+                    "block": [v["block"] for v in values[2:]],
+                    "spectra": [v["spectra"] for v in values[2:]],
+                },
+                timestamps={"block": [0.0, 0.0], "spectra": [0.0, 0.0]},
+                seq_num=[3, 4],
+                time=[10.0, 11.0],
+            ),
+        )
+    # Missing a field, so not written.
+    callback(
+        "event",
+        primary.compose_event(data={"block": 9.0}, timestamps={"block": 0.0}, validate=False),
+    )
+    callback("stop", bundle.compose_stop())
+
+
+@pytest.mark.parametrize("fields", [None, ["block", "spectra"]])
+def test_events_and_pages_are_written_as_columns(tmp_path, fields):
+    callback = BinaryFileCallback(fields, output_dir=tmp_path, postfix="_test")
+    _run(callback, pages=True)
+
+    assert callback.filename is not None
+    assert callback.filename.parent == tmp_path / "RB1234" / "bluesky_scans"
+    assert callback.filename.name.startswith(f"{node()}_block_")
+    assert callback.filename.name.endswith("Z_test")
+
+    header, columns = load_binary_scan(callback.filename)
+    assert header["num_events"] == 4
+    assert header["start"]["rb_number"] == "1234"
+    assert header["stop"]["exit_status"] == "success"
+    assert set(columns) == {"block", "spectra", "seq_num", "time"}
+    np.testing.assert_array_equal(columns["block"], [0.0, 1.0, 2.0, 3.0])
+    np.testing.assert_array_equal(columns["spectra"], np.outer(np.arange(4), np.arange(3)))
+    np.testing.assert_array_equal(columns["seq_num"], [1, 2, 3, 4])
+    assert isinstance(columns["block"], np.memmap)
+
+    assert header["columns"]["block"]["units"] == "mm"
+    assert header["columns"]["block"]["precision"] == 3
+    assert header["columns"]["spectra"]["numpy_shape"] == [4, 3]
+    assert header["columns"]["seq_num"]["file"] == "seq_num.npy"
+
+
+def test_files_are_read_only(tmp_path):
+    callback = BinaryFileCallback(output_dir=tmp_path)
+    _run(callback)
+
+    assert callback.filename is not None
+    files = list(callback.filename.iterdir())
+    assert {f.name for f in files} == {
+        HEADER_FILE,
+        "block.npy",
+        "spectra.npy",
+        "seq_num.npy",
+        "time.npy",
+    }
+    for f in files:
+        assert not os.stat(f).st_mode & S_IWUSR
+
+
+def test_load_into_memory(tmp_path):
+    callback = BinaryFileCallback(["block"], output_dir=tmp_path)
+    _run(callback)
+
+    assert callback.filename is not None
+    _, columns = load_binary_scan(callback.filename, mmap_mode=None)
+    assert not isinstance(columns["block"], np.memmap)
+    np.testing.assert_array_equal(columns["block"], [0.0, 1.0, 9.0])
+
+
+def test_numpy_metadata_written_to_header(tmp_path):
+    callback = BinaryFileCallback(["block"], output_dir=tmp_path)
+    _run(callback, positions=np.array([1.0, 2.0]), step=np.int32(5), path=Path("a"))
+
+    assert callback.filename is not None
+    header, _ = load_binary_scan(callback.filename)
+    assert header["start"]["positions"] == [1.0, 2.0]
+    assert header["start"]["step"] == 5
+    assert header["start"]["path"] == "a"
+
+
+def test_ragged_and_object_columns_are_skipped(tmp_path, caplog):
+    callback = BinaryFileCallback(["ragged", "objects", "ok"], output_dir=tmp_path)
+    bundle = compose_run()
+    callback("start", bundle.start_doc)
+    descriptor = bundle.compose_descriptor(
+        name="primary",
+        data_keys={
+            "ragged": {"dtype": "array", "shape": [None], "source": "a"},
+            "objects": {"dtype": "number", "shape": [], "source": "b"},
+            "ok": {"dtype": "number", "shape": [], "source": "c"},
+        },
+    )
+    callback("descriptor", descriptor.descriptor_doc)
+    for data in (
+        {"ragged": [1, 2], "objects": None, "ok": 1},
+        {"ragged": [1, 2, 3], "objects": 1, "ok": 2},
+    ):
+        callback("event", descriptor.compose_event(data=data, timestamps=dict.fromkeys(data, 0.0)))
+    with caplog.at_level(logging.WARNING):
+        callback("stop", bundle.compose_stop())
+
+    assert "Cannot write ragged as a binary column" in caplog.text
+    assert "Cannot write objects as a binary column" in caplog.text
+    assert callback.filename is not None
+    header, columns = load_binary_scan(callback.filename)
+    assert set(header["columns"]) == {"ok", "seq_num", "time"}
+    np.testing.assert_array_equal(columns["ok"], [1, 2])
+
+
+def test_stop_without_start_does_nothing(tmp_path, caplog):
+    callback = BinaryFileCallback(output_dir=tmp_path)
+    with caplog.at_level(logging.ERROR):
+        callback.stop(compose_run().compose_stop())
+
+    assert "Run has not been started yet" in caplog.text
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_load_rejects_other_directories(tmp_path):
+    (tmp_path / HEADER_FILE).write_text(json.dumps({"format": "something else"}))
+    with pytest.raises(ValueError, match="does not contain a binary scan"):
+        load_binary_scan(tmp_path)
@@ -1,33 +1,246 @@
 # pyright: reportMissingParameterType=false
 
+import gzip
 import json
+import logging
+import threading
 from collections.abc import Generator
 from pathlib import Path
 from unittest.mock import mock_open, patch
 
 import bluesky.plan_stubs as bps
+import pytest
 from bluesky.run_engine import RunEngineResult
 from bluesky.utils import Msg
 
+from ibex_bluesky_core.callbacks import DocLoggingCallback
+
+
+def basic_plan() -> Generator[Msg, None, None]:
+    yield from bps.open_run()
+    yield from bps.close_run()
+
 
 def test_run_engine_logs_all_documents(RE):
     m = mock_open()
     log_location = Path("C:\\") / "instrument" / "var" / "logs" / "bluesky" / "raw_documents"
 
-    def basic_plan() -> Generator[Msg, None, None]:
-        yield from bps.open_run()
-        yield from bps.close_run()
-
-    with patch("ibex_bluesky_core.callbacks._document_logger.open", m):
+    with (
+        patch("ibex_bluesky_core.callbacks._document_logger.open", m),
+        patch("ibex_bluesky_core.callbacks._document_logger.Path.mkdir"),
+    ):
         result: RunEngineResult = RE(basic_plan())
         filepath = log_location / f"{result.run_start_uids[0]}.log"
 
-    for i in range(2):
-        assert m.call_args_list[i].args == (filepath, "ab")
-        # Checks that the file is opened 2 times, for open and then stop
+    # The file is opened once per run, and kept open until the run stops.
+    m.assert_called_once_with(filepath, "ab")
 
     handle = m()
-    document = json.loads(handle.write.mock_calls[-1].args[0])
+    lines = b"".join(c.args[0] for c in handle.write.mock_calls).splitlines()
+    document = json.loads(lines[-1])
 
     # In the stop document to be written, check that the run is successful
     assert document["document"]["exit_status"] == "success"
+    handle.close.assert_called_once()
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_documents_written_to_file(tmp_path, compress):
+    cb = DocLoggingCallback(compress=compress)
+    uid = "abc"
+    with patch("ibex_bluesky_core.callbacks._document_logger.log_location", tmp_path):
+        cb("start", {"uid": uid})
+        cb("stop", {"run_start": uid, "exit_status": "success"})
+
+    if compress:
+        with gzip.open(tmp_path / f"{uid}.log.gz", "rb") as f:
+            content = f.read()
+    else:
+        content = (tmp_path / f"{uid}.log").read_bytes()
+
+    documents = [json.loads(line) for line in content.splitlines()]
+    assert [d["type"] for d in documents] == ["start", "stop"]
+    assert documents[0]["document"]["uid"] == uid
+    assert cb.documents_queued == 2
+    assert cb.documents_written == 2
+    assert cb.write_errors == 0
+
+
+def test_fsync_on_stop(tmp_path):
+    cb = DocLoggingCallback(fsync_on_stop=True)
+    with (
+        patch("ibex_bluesky_core.callbacks._document_logger.log_location", tmp_path),
+        patch("ibex_bluesky_core.callbacks._document_logger.os.fsync") as fsync,
+    ):
+        cb("start", {"uid": "abc"})
+        cb("stop", {"run_start": "abc"})
+
+    fsync.assert_called_once()
+
+
+def test_new_start_without_stop_switches_file(tmp_path):
+    cb = DocLoggingCallback()
+    with patch("ibex_bluesky_core.callbacks._document_logger.log_location", tmp_path):
+        cb("start", {"uid": "first"})
+        cb("start", {"uid": "second"})
+        cb("stop", {"run_start": "second"})
+
+    assert len((tmp_path / "first.log").read_bytes().splitlines()) == 1
+    assert len((tmp_path / "second.log").read_bytes().splitlines()) == 2
+
+
+def test_write_errors_are_counted_and_logged(tmp_path, caplog):
+    cb = DocLoggingCallback()
+    with (
+        patch("ibex_bluesky_core.callbacks._document_logger.log_location", tmp_path),
+        patch(
+            "ibex_bluesky_core.callbacks._document_logger.open", side_effect=OSError("disk full")
+        ),
+        caplog.at_level(logging.ERROR, logger="ibex_bluesky_core.callbacks._document_logger"),
+    ):
+        cb("start", {"uid": "abc"})
+        cb("stop", {"run_start": "abc"})
+
+    assert cb.write_errors == 2
+    assert cb.documents_written == 0
+    assert "Failed to write" in caplog.text
+
+
+def test_stop_timeout_is_logged(tmp_path, caplog):
+    cb = DocLoggingCallback(stop_timeout_s=0.01)
+    with (
+        patch("ibex_bluesky_core.callbacks._document_logger.log_location", tmp_path),
+        patch.object(cb._background, "flush", return_value=False),
+        caplog.at_level(logging.ERROR, logger="ibex_bluesky_core.callbacks._background"),
+    ):
+        cb("start", {"uid": "abc"})
+        cb("stop", {"run_start": "abc"})
+
+    assert "Timed out" in caplog.text
+
+
+def test_flush_waits_for_documents_to_be_written(tmp_path):
+    cb = DocLoggingCallback()
+    assert cb.flush() is True
+    with patch("ibex_bluesky_core.callbacks._document_logger.log_location", tmp_path):
+        cb("start", {"uid": "abc"})
+        assert cb.flush(5) is True
+        assert (tmp_path / "abc.log").exists()
+        assert cb.documents_written == 1
+
+
+def test_writer_thread_exits_after_each_run(tmp_path):
+    cb = DocLoggingCallback()
+    with patch("ibex_bluesky_core.callbacks._document_logger.log_location", tmp_path):
+        for uid in ("first", "second"):
+            cb("start", {"uid": uid})
+            thread = cb._background._thread
+            assert thread is not None
+            assert thread.is_alive()
+            cb("stop", {"run_start": uid})
+            assert not thread.is_alive()
+
+    assert len((tmp_path / "second.log").read_bytes().splitlines()) == 2
+
+
+def test_next_run_waits_for_previous_writer(tmp_path):
+    cb = DocLoggingCallback(stop_timeout_s=0.01)
+    release = threading.Event()
+    open_file = cb._writer._open
+
+    def slow_open(filename):
+        release.wait(5)
+        return open_file(filename)
+
+    with (
+        patch("ibex_bluesky_core.callbacks._document_logger.log_location", tmp_path),
+        patch.object(cb._writer, "_open", side_effect=slow_open),
+    ):
+        cb("start", {"uid": "first"})
+        cb("stop", {"run_start": "first"})
+        first_thread = cb._background._thread
+        cb("start", {"uid": "second"})
+        release.set()
+        cb("stop", {"run_start": "second"})
+        assert cb.flush(5)
+
+    assert cb.documents_written == 4
+    assert first_thread is not None
+    assert not first_thread.is_alive()
+
+
+@pytest.mark.parametrize("close_error", [None, OSError("close failed")])
+def test_file_closed_after_write_error(tmp_path, caplog, close_error):
+    m = mock_open()
+    m().write.side_effect = OSError("disk full")
+    m().close.side_effect = close_error
+    cb = DocLoggingCallback()
+    with (
+        patch("ibex_bluesky_core.callbacks._document_logger.log_location", tmp_path),
+        patch("ibex_bluesky_core.callbacks._document_logger.open", m),
+        caplog.at_level(logging.ERROR, logger="ibex_bluesky_core.callbacks._document_logger"),
+    ):
+        cb("start", {"uid": "abc"})
+        cb("stop", {"run_start": "abc"})
+
+    # The file is closed after each failed write (the documents may be written together).
+    assert m().close.call_count >= 1
+    assert cb._writer._handle is None
+    assert cb.write_errors == 2
+    assert ("Failed to close" in caplog.text) == (close_error is not None)
+
+
+def test_file_closed_if_flush_fails(tmp_path):
+    m = mock_open()
+    m().flush.side_effect = OSError("disk full")
+    cb = DocLoggingCallback()
+    with (
+        patch("ibex_bluesky_core.callbacks._document_logger.log_location", tmp_path),
+        patch("ibex_bluesky_core.callbacks._document_logger.open", m),
+    ):
+        cb("start", {"uid": "abc"})
+        cb("stop", {"run_start": "abc"})
+
+    m().close.assert_called_once()
+    assert cb._writer._handle is None
+    assert cb.write_errors > 0
+
+
+def test_back_pressure_is_counted(tmp_path):
+    cb = DocLoggingCallback(max_queue_size=1)
+    release = threading.Event()
+    open_file = cb._writer._open
+
+    def slow_open(filename):
+        release.wait(5)
+        return open_file(filename)
+
+    threading.Timer(0.05, release.set).start()
+    with (
+        patch("ibex_bluesky_core.callbacks._document_logger.log_location", tmp_path),
+        patch.object(cb._writer, "_open", side_effect=slow_open),
+    ):
+        cb("start", {"uid": "abc"})
+        for i in range(3):
+            cb("event", {"seq_num": i})
+        cb("stop", {"run_start": "abc"})
+
+    assert cb.documents_written == 5
+    assert cb.blocked_puts > 0
+    assert cb.max_queue_depth == 1
+
+
+def test_unencodable_document_counted_as_write_error(tmp_path, caplog):
+    cb = DocLoggingCallback()
+    with (
+        patch("ibex_bluesky_core.callbacks._document_logger.log_location", tmp_path),
+        caplog.at_level(logging.ERROR, logger="ibex_bluesky_core.callbacks._document_logger"),
+    ):
+        cb("start", {"uid": "abc"})
+        cb("event", {"data": object()})
+        cb("stop", {"run_start": "abc"})
+
+    assert cb.documents_written == 2
+    assert cb.write_errors == 1
+    assert "Failed to write event document" in caplog.text
+    assert len((tmp_path / "abc.log").read_bytes().splitlines()) == 2
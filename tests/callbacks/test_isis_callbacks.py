@@ -1,18 +1,22 @@
 # pyright: reportMissingParameterType=false
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import bluesky.plan_stubs as bps
 import pytest
 from bluesky.callbacks import LiveFitPlot, LiveTable
 from bluesky.callbacks.fitting import LiveFit, PeakStats
+from matplotlib.axes import Axes
 
 from ibex_bluesky_core.callbacks import (
+    BackgroundCallback,
+    BinaryFileCallback,
     CentreOfMass,
     HumanReadableFileCallback,
     ISISCallbacks,
     LiveFitLogger,
     LivePlot,
     PlotPNGSaver,
+    ScanColumns,
 )
 from ibex_bluesky_core.fitting import Linear
 
@@ -118,6 +122,23 @@ def test_add_livefit_then_get_livefit_property_returns_livefit():
     )
 
     assert icc.live_fit.method == fit_method  # pyright: ignore reportOptionalMemberAccess
+    assert not icc.live_fit.fit_in_background
+
+
+def test_add_livefit_in_background():
+    icc = ISISCallbacks(
+        x="X_signal",
+        y="Y_signal",
+        fit=Linear().fit(),
+        add_table_cb=False,
+        add_plot_cb=False,
+        show_fit_on_plot=False,
+        add_peak_stats=False,
+        add_human_readable_file_cb=False,
+        live_fit_in_background=True,
+    )
+
+    assert icc.live_fit.fit_in_background
 
 
 def test_add_peakstats_then_get_peakstats_property_returns_peakstats():
@@ -210,6 +231,92 @@ def test_do_not_add_png_saver_then_not_added():
     assert not any(isinstance(i, PlotPNGSaver) for i in icc.subs)
 
 
+def test_scan_columns_subscribed_first_and_shared():
+    icc = ISISCallbacks(
+        x="X_signal",
+        y="Y_signal",
+        yerr="Yerr_signal",
+        fit=Linear().fit(),
+        add_table_cb=False,
+        add_plot_cb=False,
+        show_fit_on_plot=False,
+        add_peak_stats=False,
+        add_human_readable_file_cb=False,
+    )
+    assert icc.subs[0] is icc.columns
+    assert icc.live_fit._columns is icc.columns  # pyright: ignore reportPrivateUsage
+
+
+def test_scan_columns_not_added_without_fit_or_plot():
+    icc = ISISCallbacks(
+        x="X_signal",
+        y="Y_signal",
+        add_table_cb=False,
+        add_plot_cb=False,
+        show_fit_on_plot=False,
+        add_peak_stats=False,
+        add_human_readable_file_cb=False,
+    )
+    assert not any(isinstance(i, ScanColumns) for i in icc.subs)
+    with pytest.raises(ValueError, match=r"scan columns were not added as a callback"):
+        _ = icc.columns
+
+
+def test_png_saver_in_background():
+    icc = ISISCallbacks(
+        x="X_signal",
+        y="Y_signal",
+        ax=MagicMock(spec=Axes),
+        add_table_cb=False,
+        add_peak_stats=False,
+        add_human_readable_file_cb=False,
+        save_plot_png_in_background=True,
+    )
+    (png_saver,) = (i for i in icc.subs if isinstance(i, PlotPNGSaver))
+    assert png_saver.save_in_background
+
+
+def test_write_files_in_background():
+    icc = ISISCallbacks(
+        x="X_signal",
+        y="Y_signal",
+        fit=Linear().fit(),
+        ax=MagicMock(spec=Axes),
+        add_table_cb=False,
+        add_peak_stats=False,
+        add_binary_file_cb=True,
+        write_files_in_background=True,
+    )
+    background = [i for i in icc.subs if isinstance(i, BackgroundCallback)]
+    assert [type(i.callback) for i in background] == [
+        HumanReadableFileCallback,
+        BinaryFileCallback,
+        LiveFitLogger,
+    ]
+    assert not any(
+        isinstance(i, (HumanReadableFileCallback, BinaryFileCallback, LiveFitLogger))
+        for i in icc.subs
+    )
+
+
+def test_add_binary_file_cb(tmp_path):
+    icc = ISISCallbacks(
+        x="X_signal",
+        y="Y_signal",
+        add_table_cb=False,
+        add_plot_cb=False,
+        add_peak_stats=False,
+        add_centre_of_mass=False,
+        add_human_readable_file_cb=False,
+        add_binary_file_cb=True,
+        binary_file_output_dir=tmp_path,
+        human_readable_file_postfix="_postfix",
+    )
+    (binary_file_cb,) = (i for i in icc.subs if isinstance(i, BinaryFileCallback))
+    assert binary_file_cb.output_dir == tmp_path
+    assert binary_file_cb.postfix == "_postfix"
+
+
 @pytest.mark.parametrize("matplotlib_using_qt", [True, False])
 def test_call_decorator(RE, matplotlib_using_qt):
     with patch(
@@ -1,6 +1,12 @@
+# pyright: reportMissingParameterType=false
+
+import logging
+import queue
 import re
+import threading
 from unittest import mock
 
+import msgpack_numpy
 import pytest
 
 from ibex_bluesky_core.callbacks._kafka import KafkaCallback, get_kafka_topic_name
@@ -27,9 +33,183 @@ def test_init_kafka_callback_with_duplicate_bootstrap_servers():
         KafkaCallback(bootstrap_servers=["abc"], kafka_config={"bootstrap.servers": "foo"}, key="")
 
 
-def test_exceptions_suppressed():
+@pytest.fixture
+def producer():
+    with mock.patch("ibex_bluesky_core.callbacks._kafka.Producer") as producer_cls:
+        producer = producer_cls.return_value
+        producer.flush.return_value = 0
+        yield producer
+
+
+def test_exceptions_suppressed(producer):
     cb = KafkaCallback(bootstrap_servers=["abc"], kafka_config={}, key="")
     with mock.patch(
         "ibex_bluesky_core.callbacks._kafka.msgpack_numpy.dumps", side_effect=ValueError
     ):
         cb("start", {})
+        assert cb.flush(timeout_s=1)
+
+    assert cb.documents_queued == 1
+    assert cb.documents_failed == 1
+    producer.produce.assert_not_called()
+
+
+def test_kafka_config_defaults_can_be_overridden():
+    with mock.patch("ibex_bluesky_core.callbacks._kafka.Producer") as producer_cls:
+        KafkaCallback(
+            bootstrap_servers=["abc", "def"],
+            kafka_config={"compression.type": "zstd"},
+            key="",
+            linger_ms=10,
+        )
+
+    producer_cls.assert_called_once_with(
+        {
+            "linger.ms": 10,
+            "batch.num.messages": 1000,
+            "compression.type": "zstd",
+            "bootstrap.servers": "abc,def",
+        }
+    )
+
+
+def test_documents_delivered(producer, caplog):
+    def produce(*, on_delivery, **kwargs):
+        if kwargs["value"] == msgpack_numpy.dumps(["event", {"bad": True}]):
+            on_delivery(mock.Mock(), mock.Mock())
+        else:
+            on_delivery(None, mock.Mock())
+
+    producer.produce.side_effect = produce
+    cb = KafkaCallback(bootstrap_servers=["abc"], kafka_config={}, key="doc", topic="topic")
+
+    with caplog.at_level(logging.ERROR, logger="ibex_bluesky_core.callbacks._kafka"):
+        cb("start", {"uid": "abc"})
+        cb("event", {"bad": True})
+        cb("stop", {"run_start": "abc"})
+        assert cb.flush(timeout_s=1)
+
+    assert cb.documents_queued == 3
+    assert cb.documents_delivered == 2
+    assert cb.documents_failed == 1
+    assert "Failed to deliver Kafka message" in caplog.text
+    producer.produce.assert_any_call(
+        topic="topic",
+        key=msgpack_numpy.dumps("doc"),
+        value=msgpack_numpy.dumps(["start", {"uid": "abc"}]),
+        on_delivery=cb._sender._on_delivery,
+    )
+    # Flushed once at run stop, and once explicitly.
+    assert producer.flush.call_count == 2
+
+
+def test_produce_retried_when_local_queue_full(producer):
+    producer.produce.side_effect = [BufferError, None]
+    cb = KafkaCallback(bootstrap_servers=["abc"], kafka_config={}, key="", poll_interval_s=0.01)
+
+    cb("start", {})
+    assert cb.flush(timeout_s=1)
+
+    assert producer.produce.call_count == 2
+    producer.poll.assert_any_call(0.01)
+    assert cb.documents_failed == 0
+
+
+def test_events_dropped_when_queue_full(producer, caplog):
+    cb = KafkaCallback(bootstrap_servers=["abc"], kafka_config={}, key="")
+
+    with (
+        mock.patch.object(cb._background._queue, "put_nowait", side_effect=queue.Full),
+        caplog.at_level(logging.WARNING),
+    ):
+        cb("start", {"uid": "abc"})
+        assert cb("event", {"seq_num": 1}) == ("event", {"seq_num": 1})
+        cb("stop", {"run_start": "abc"})
+        assert cb.flush(timeout_s=1)
+
+    assert cb.documents_queued == 3
+    assert cb.documents_failed == 1
+    assert producer.produce.call_count == 2
+    assert "dropped 1 events" in caplog.text
+
+
+def test_undelivered_messages_at_stop_are_logged(producer, caplog):
+    producer.flush.return_value = 3
+    cb = KafkaCallback(bootstrap_servers=["abc"], kafka_config={}, key="")
+
+    with caplog.at_level(logging.WARNING, logger="ibex_bluesky_core.callbacks._kafka"):
+        cb("stop", {})
+        assert not cb.flush(timeout_s=1)
+
+    assert "3 Kafka messages not delivered" in caplog.text
+
+
+def test_produce_gives_up_when_local_queue_stays_full(producer, caplog):
+    producer.produce.side_effect = BufferError
+    cb = KafkaCallback(
+        bootstrap_servers=["abc"],
+        kafka_config={},
+        key="",
+        poll_interval_s=0.001,
+        produce_timeout_s=0.01,
+    )
+
+    with caplog.at_level(logging.ERROR, logger="ibex_bluesky_core.callbacks._kafka"):
+        cb("start", {})
+        assert cb.flush(timeout_s=1)
+
+    assert producer.produce.call_count > 1
+    assert cb.documents_failed == 1
+    assert "Failed to publish Kafka message" in caplog.text
+
+
+def test_document_encoded_on_background_thread(producer):
+    threads = []
+
+    def dumps(obj):
+        threads.append(threading.current_thread().name)
+        return b""
+
+    cb = KafkaCallback(bootstrap_servers=["abc"], kafka_config={}, key="")
+    with mock.patch("ibex_bluesky_core.callbacks._kafka.msgpack_numpy.dumps", side_effect=dumps):
+        cb("start", {"uid": "abc"})
+        assert cb.flush(timeout_s=1)
+
+    assert threads == ["BackgroundCallback-_KafkaSender"]
+
+
+def test_run_stop_flushes_and_stops_thread_without_waiting(producer):
+    release = threading.Event()
+    producer.flush.side_effect = lambda timeout: release.wait(5) and 0
+    cb = KafkaCallback(bootstrap_servers=["abc"], kafka_config={}, key="")
+
+    cb("start", {})
+    thread = cb._background._thread
+    cb("stop", {})
+    # The run engine is not held up while the stop document is flushed.
+    assert thread is not None
+    assert thread.is_alive()
+
+    release.set()
+    thread.join(5)
+    assert not thread.is_alive()
+    producer.flush.assert_called_once_with(5.0)
+
+
+def test_close_stops_thread_after_flushing(producer):
+    cb = KafkaCallback(bootstrap_servers=["abc"], kafka_config={}, key="")
+    assert cb.close()
+    producer.flush.assert_called_once_with(5.0)
+
+    cb("start", {})
+    thread = cb._background._thread
+    assert thread is not None
+    assert cb.close(timeout_s=1)
+    assert not thread.is_alive()
+    assert producer.produce.call_count == 1
+    assert producer.flush.call_count == 2
+
+    # A new thread is started if more documents are received.
+    cb("stop", {})
+    assert cb.close(timeout_s=1)
+    assert producer.produce.call_count == 2
@@ -1,10 +1,16 @@
-from stat import S_IRGRP, S_IROTH, S_IRUSR
+# pyright: reportMissingParameterType=false
+import os
+import threading
+from stat import S_IMODE, S_IRGRP, S_IROTH, S_IRUSR
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+import matplotlib.image
+import numpy as np
 import pytest
 from matplotlib import pyplot as plt
 from matplotlib.axes import Axes
+from matplotlib.backends.backend_svg import FigureCanvasSVG
 from matplotlib.figure import Figure
 
 from ibex_bluesky_core.callbacks import LivePlot, PlotPNGSaver, show_plot
@@ -32,6 +38,10 @@ def test_ibex_plot_callback_calls_show_on_start():
 
         lp.event(sentinel)
         mock_event.assert_called_once_with(sentinel)
+
+        # The plot is shown whenever it is redrawn
+        with patch("ibex_bluesky_core.callbacks._plotting._DefaultLivePlot.update_plot"):
+            lp.update_plot()
         assert mock_plt_show.call_count == 2
 
 
@@ -159,3 +169,305 @@ def test_no_filename_raises():
     s = PlotPNGSaver(x="x", y="y", ax=ax, postfix="123", output_dir="")
     with pytest.raises(ValueError, match=r"No filename specified for plot PNG"):
         s.stop({"uid": "0", "exit_status": "success", "run_start": "", "time": 123456789})
+
+
+_START_DOC: Any = {"uid": "0", RB: 1234, "time": 123456789}
+_STOP_DOC: Any = {"time": 234567891, "uid": "2", "exit_status": "success", "run_start": ""}
+
+
+def test_png_saved_in_background(tmp_path):
+    fig, ax = plt.subplots(figsize=(4, 3), dpi=50)
+    ax.plot([1, 2, 3], [4, 5, 6])
+    s = PlotPNGSaver(
+        x="x", y="y", ax=ax, postfix="123", output_dir=tmp_path, save_in_background=True
+    )
+
+    with patch.object(fig, "savefig") as savefig:
+        s.start(_START_DOC)
+        s.stop(_STOP_DOC)
+    savefig.assert_not_called()
+
+    assert s.flush(timeout_s=10)
+    assert s.filename is not None
+    assert s.filename.parent.name == "bluesky_scans"
+    image = matplotlib.image.imread(s.filename)
+    assert image.shape == (150, 200, 4)
+    assert S_IMODE(os.stat(s.filename).st_mode) == S_IRUSR | S_IRGRP | S_IROTH
+    assert s.write_errors == 0
+
+
+def test_png_saved_in_background_matches_figure(tmp_path):
+    fig, ax = plt.subplots(figsize=(2, 2), dpi=20)
+    ax.plot([1, 2, 3], [4, 5, 6])
+    s = PlotPNGSaver(
+        x="x", y="y", ax=ax, postfix="123", output_dir=tmp_path, save_in_background=True
+    )
+    s.start(_START_DOC)
+    s.stop(_STOP_DOC)
+    assert s.flush(timeout_s=10)
+    assert s.filename is not None
+
+    fig.savefig(tmp_path / "expected.png", format="png")
+    np.testing.assert_array_equal(
+        matplotlib.image.imread(s.filename), matplotlib.image.imread(tmp_path / "expected.png")
+    )
+
+
+def test_png_saved_in_background_ignores_savefig_settings(tmp_path):
+    _, ax = plt.subplots(figsize=(2, 2), dpi=20)
+    ax.plot([1, 2, 3], [4, 5, 6])
+    s = PlotPNGSaver(
+        x="x", y="y", ax=ax, postfix="123", output_dir=tmp_path, save_in_background=True
+    )
+    s.start(_START_DOC)
+    # A cropped savefig would not have the size of the figure.
+    with matplotlib.rc_context({"savefig.bbox": "tight"}):
+        s.stop(_STOP_DOC)
+    assert s.flush(timeout_s=10)
+    assert s.write_errors == 0
+    assert s.filename is not None
+    assert matplotlib.image.imread(s.filename).shape == (40, 40, 4)
+
+
+def test_png_saved_directly_if_canvas_cannot_render_to_buffer(tmp_path):
+    fig, ax = plt.subplots(figsize=(1, 1), dpi=10)
+    FigureCanvasSVG(fig)
+    s = PlotPNGSaver(
+        x="x", y="y", ax=ax, postfix="123", output_dir=tmp_path, save_in_background=True
+    )
+    s.start(_START_DOC)
+    s.stop(_STOP_DOC)
+
+    assert s._threads == []
+    assert s.filename is not None
+    assert matplotlib.image.imread(s.filename).shape == (10, 10, 4)
+
+
+def test_png_background_write_error_logged(tmp_path, caplog):
+    _, ax = plt.subplots(figsize=(1, 1), dpi=10)
+    s = PlotPNGSaver(
+        x="x", y="y", ax=ax, postfix="123", output_dir=tmp_path, save_in_background=True
+    )
+    s.start(_START_DOC)
+    with patch(
+        "ibex_bluesky_core.callbacks._plotting.matplotlib.image.imsave",
+        side_effect=OSError("share unavailable"),
+    ):
+        s.stop(_STOP_DOC)
+        assert s.flush(timeout_s=10)
+
+    assert s.write_errors == 1
+    assert "Failed to write plot PNG" in caplog.text
+
+
+def test_png_background_thread_exits_once_written(tmp_path):
+    _, ax = plt.subplots(figsize=(1, 1), dpi=10)
+    s = PlotPNGSaver(
+        x="x", y="y", ax=ax, postfix="123", output_dir=tmp_path, save_in_background=True
+    )
+    release = threading.Event()
+    imsave = matplotlib.image.imsave
+
+    def slow_imsave(*args, **kwargs):
+        release.wait(5)
+        imsave(*args, **kwargs)
+
+    s.start(_START_DOC)
+    with patch(
+        "ibex_bluesky_core.callbacks._plotting.matplotlib.image.imsave", side_effect=slow_imsave
+    ):
+        s.stop(_STOP_DOC)
+        (thread,) = s._threads
+        # Not a daemon thread, so Python waits for the file to be written before exiting.
+        assert not thread.daemon
+        assert not s.flush(timeout_s=0.01)
+        release.set()
+        assert s.flush(timeout_s=10)
+
+    assert not thread.is_alive()
+    assert s._threads == []
+    assert s.filename is not None
+    assert s.filename.exists()
+
+
+def _start(lp: LivePlot) -> None:
+    lp.start({"time": 0, "uid": "0", "scan_id": 0})
+
+
+def _event(lp: LivePlot, x: float, y: float, yerr: float) -> None:
+    lp.event({"data": {"y": y, "x": x, "yerr": yerr}})  # type: ignore
+
+
+def test_errorbars_updated_in_place():
+    _, ax = plt.subplots()
+    lp = LivePlot(y="y", x="x", yerr="yerr", ax=ax, max_redraw_rate_hz=None)
+    _start(lp)
+
+    with patch.object(ax, "errorbar", wraps=ax.errorbar) as errorbar:
+        _event(lp, 1, 2, 3)
+        _event(lp, 2, 4, 1)
+        _event(lp, 3, 6, 0.5)
+
+    errorbar.assert_called_once()
+    assert lp._mpl_errorbar_container is not None
+    (barlines,) = lp._mpl_errorbar_container.lines[2]
+    assert [seg.tolist() for seg in barlines.get_segments()] == [
+        [[1, -1], [1, 5]],
+        [[2, 3], [2, 5]],
+        [[3, 5.5], [3, 6.5]],
+    ]
+
+
+def test_errorbars_from_previous_run_removed_on_start():
+    _, ax = plt.subplots()
+    lp = LivePlot(y="y", x="x", yerr="yerr", ax=ax)
+    _start(lp)
+    _event(lp, 1, 2, 3)
+    old_container = lp._mpl_errorbar_container
+    assert old_container is not None
+
+    _start(lp)
+    _event(lp, 5, 6, 7)
+
+    (old_barlines,) = old_container.lines[2]
+    assert old_barlines not in ax.collections
+    assert list(lp.yerr_data) == [7]
+
+
+def test_redraws_are_throttled_and_final_redraw_at_stop():
+    _, ax = plt.subplots()
+    lp = LivePlot(y="y", x="x", yerr="yerr", ax=ax, max_redraw_rate_hz=5)
+    _start(lp)
+
+    with (
+        patch("ibex_bluesky_core.callbacks._plotting.time.monotonic") as monotonic,
+        patch("ibex_bluesky_core.callbacks._plotting._DefaultLivePlot.update_plot") as redraw,
+    ):
+        monotonic.return_value = 100.0
+        _event(lp, 1, 1, 1)  # First point is always drawn
+        assert redraw.call_count == 1
+
+        monotonic.return_value = 100.1
+        _event(lp, 2, 2, 1)
+        _event(lp, 3, 3, 1)
+        assert redraw.call_count == 1
+
+        monotonic.return_value = 100.3
+        _event(lp, 4, 4, 1)  # Coalesces all pending points into one redraw
+        assert redraw.call_count == 2
+
+        monotonic.return_value = 100.4
+        _event(lp, 5, 5, 1)
+        assert redraw.call_count == 2
+
+        lp.stop({"time": 1, "uid": "1", "exit_status": "success", "run_start": "0"})
+        assert redraw.call_count == 3
+
+    (barlines,) = lp._mpl_errorbar_container.lines[2]  # pyright: ignore
+    assert len(barlines.get_segments()) == 5
+
+
+def test_redraw_held_back_by_throttle_is_drawn_by_timer():
+    fig, ax = plt.subplots()
+    lp = LivePlot(y="y", x="x", yerr="yerr", ax=ax, max_redraw_rate_hz=5)
+    _start(lp)
+
+    with (
+        patch("ibex_bluesky_core.callbacks._plotting.time.monotonic") as monotonic,
+        patch("ibex_bluesky_core.callbacks._plotting._DefaultLivePlot.update_plot") as redraw,
+        patch.object(fig.canvas, "new_timer") as new_timer,
+    ):
+        monotonic.return_value = 100.0
+        _event(lp, 1, 1, 1)
+        new_timer.assert_not_called()
+
+        monotonic.return_value = 100.05
+        _event(lp, 2, 2, 1)
+        _event(lp, 3, 3, 1)
+        # One timer, which fires once the next redraw is allowed.
+        new_timer.assert_called_once_with(interval=150)
+        timer = new_timer.return_value
+        assert timer.single_shot
+        timer.start.assert_called_once()
+        (on_timer,), _ = timer.add_callback.call_args
+        assert redraw.call_count == 1
+
+        monotonic.return_value = 100.2
+        on_timer()
+        assert redraw.call_count == 2
+        assert not lp._throttle.pending
+        # Nothing left to draw, so neither the timer nor stop redraws again.
+        on_timer()
+        lp.stop({"time": 1, "uid": "1", "exit_status": "success", "run_start": "0"})
+        assert redraw.call_count == 2
+
+
+def test_timer_cancelled_by_redraw_and_errors_logged(caplog):
+    fig, ax = plt.subplots()
+    lp = LivePlot(y="y", x="x", ax=ax, max_redraw_rate_hz=5)
+    _start(lp)
+
+    with (
+        patch("ibex_bluesky_core.callbacks._plotting.time.monotonic") as monotonic,
+        patch("ibex_bluesky_core.callbacks._plotting._DefaultLivePlot.update_plot") as redraw,
+        patch.object(fig.canvas, "new_timer") as new_timer,
+    ):
+        monotonic.return_value = 100.0
+        _event(lp, 1, 1, 1)
+        monotonic.return_value = 100.1
+        _event(lp, 2, 2, 1)
+        monotonic.return_value = 100.3
+        _event(lp, 3, 3, 1)
+        # Redrawn by the event, so the timer is no longer needed.
+        new_timer.return_value.stop.assert_called_once()
+
+        monotonic.return_value = 100.4
+        _event(lp, 4, 4, 1)
+        (on_timer,), _ = new_timer.return_value.add_callback.call_args
+        redraw.side_effect = RuntimeError("figure closed")
+        monotonic.return_value = 100.6
+        on_timer()
+
+    assert "Failed to draw plot" in caplog.text
+
+
+def test_no_redraw_at_stop_if_up_to_date():
+    _, ax = plt.subplots()
+    lp = LivePlot(y="y", x="x", ax=ax)
+    _start(lp)
+    _event(lp, 1, 1, 1)
+
+    with patch("ibex_bluesky_core.callbacks._plotting._DefaultLivePlot.update_plot") as redraw:
+        lp.stop({"time": 1, "uid": "1", "exit_status": "success", "run_start": "0"})
+
+    redraw.assert_not_called()
+
+
+def test_event_page_adds_all_points_and_redraws_once():
+    _, ax = plt.subplots()
+    lp = LivePlot(y="y", x="x", yerr="yerr", ax=ax, max_redraw_rate_hz=None)
+    _start(lp)
+
+    with patch("ibex_bluesky_core.callbacks._plotting._DefaultLivePlot.update_plot") as redraw:
+        lp.event_page({"data": {"x": [1, 2, 3], "y": [2, 4, 6], "yerr": [1, 1, 0.5]}})  # type: ignore
+        # Pages from other streams are skipped.
+        lp.event_page({"data": {"x": [4]}})  # type: ignore
+        lp.event_page({"data": {"y": [8]}})  # type: ignore
+
+    redraw.assert_called_once()
+    assert list(lp.x_data) == [1, 2, 3]
+    assert list(lp.y_data) == [2, 4, 6]
+    assert list(lp.yerr_data) == [1, 1, 0.5]
+    assert lp._yerr_segments[2] == ((3, 5.5), (3, 6.5))  # pyright: ignore
+
+
+@pytest.mark.parametrize(("x", "expected"), [("seq_num", [1, 2]), ("time", [10, 11])])
+def test_event_page_x_from_event(x, expected):
+    _, ax = plt.subplots()
+    lp = LivePlot(y="y", x=x, ax=ax)
+    lp.start({"time": 100, "uid": "0", "scan_id": 0})
+
+    lp.event_page({"data": {"y": [2, 4]}, "seq_num": [1, 2], "time": [110, 111]})  # type: ignore
+
+    assert list(lp.x_data) == expected
+    assert list(lp.y_data) == [2, 4]
@@ -0,0 +1,254 @@
+# pyright: reportMissingParameterType=false
+from typing import Any
+
+import numpy as np
+import pytest
+from matplotlib import pyplot as plt
+
+from ibex_bluesky_core.callbacks import LiveFit, LiveFitLogger, LivePlot, ScanColumns
+from ibex_bluesky_core.callbacks._fitting import _LiveFitPlot
+from ibex_bluesky_core.fitting import Linear
+
+_START: Any = {"time": 0, "uid": "0", "scan_id": 0}
+_STOP: Any = {"time": 1, "uid": "1", "exit_status": "success", "run_start": "0"}
+
+
+def _event(x: float, y: float, yerr: float | None = None, seq_num: int = 1) -> Any:
+    data = {"x": x, "y": y}
+    if yerr is not None:
+        data["yerr"] = yerr
+    return {"data": data, "seq_num": seq_num, "time": 123.0}
+
+
+def _send(callbacks: list[Any], name: str, doc: Any) -> None:
+    for callback in callbacks:
+        getattr(callback, name)(doc)
+
+
+def test_scan_columns_ignore_events_without_x_or_y():
+    columns = ScanColumns(x="x", y="y", yerr="yerr")
+    columns.start(_START)
+    columns.event(_event(1, 2, 0.5))
+    columns.event({"data": {"y": 3, "yerr": 1}, "seq_num": 2, "time": 0})  # type: ignore
+    columns.event({"data": {"x": 3, "yerr": 1}, "seq_num": 3, "time": 0})  # type: ignore
+    columns.event_page({"data": {"other": [1]}, "seq_num": [4], "time": [0]})  # type: ignore
+    columns.event(_event(5, 6, 0.25))
+
+    np.testing.assert_array_equal(columns["x"].values, [1, 5])
+    np.testing.assert_array_equal(columns["y"].values, [2, 6])
+    np.testing.assert_array_equal(columns["yerr"].values, [0.5, 0.25])
+
+
+def test_events_without_yerr_keep_columns_aligned(tmp_path):
+    columns = ScanColumns(x="x", y="y", yerr="yerr")
+    fit = LiveFit(Linear.fit(), y="y", x="x", yerr="yerr", columns=columns)
+    _, ax = plt.subplots()
+    plot = LivePlot(y="y", x="x", yerr="yerr", ax=ax, columns=columns)
+    callbacks = [columns, fit, plot]
+
+    _send(callbacks, "start", _START)
+    _send(callbacks, "event", _event(0, 1, 0.5))
+    with pytest.warns(UserWarning, match=r"yerr is not in event, therefore applying weight of 0"):
+        _send(callbacks, "event", _event(1, 100))
+    _send(callbacks, "event", _event(2, 5, 0.5))
+    _send(
+        callbacks,
+        "event_page",
+        {"data": {"x": [3, 4], "y": [7, 9]}, "seq_num": [4, 5], "time": [0, 0]},
+    )
+    _send(callbacks, "stop", _STOP)
+
+    np.testing.assert_array_equal(columns["x"].values, [0, 1, 2, 3, 4])
+    np.testing.assert_array_equal(columns["yerr"].values, [0.5, np.nan, 0.5, np.nan, np.nan])
+    for view in (fit.ydata, plot.y_data, plot.yerr_data):
+        assert len(view) == 5
+    # Points without an uncertainty are given a weight of zero, so are not fitted.
+    np.testing.assert_array_equal(fit._weights(), [2, 0, 2, 0, 0])
+    assert fit.result is not None
+    assert fit.result.values["c1"] == pytest.approx(2)
+
+
+def test_livefit_without_shared_columns_gives_page_without_yerr_zero_weight():
+    fit = LiveFit(Linear.fit(), y="y", x="x", yerr="yerr")
+    fit.start(_START)
+    with pytest.warns(UserWarning, match=r"yerr is not in event page"):
+        fit.event_page({"data": {"x": [0, 1, 2], "y": [1, 100, 5]}})  # type: ignore
+
+    np.testing.assert_array_equal(fit.weight_data.values, [0, 0, 0])
+
+
+def test_scan_columns_take_seq_num_from_event():
+    columns = ScanColumns(x="seq_num", y="y")
+    columns.start(_START)
+    columns.event(_event(1, 2, seq_num=7))
+    columns.event_page({"data": {"y": [3, 4]}, "seq_num": [8, 9], "time": [0, 0]})  # type: ignore
+
+    np.testing.assert_array_equal(columns["seq_num"].values, [7, 8, 9])
+    np.testing.assert_array_equal(columns["y"].values, [2, 3, 4])
+
+
+def test_start_invalidates_views_until_they_are_cleared():
+    columns = ScanColumns(x="x", y="y")
+    columns.start(_START)
+    view = columns.view("y")
+    columns.event(_event(1, 2))
+    view.append(2)
+    earlier_values = view.values
+
+    columns.start(_START)
+    columns.event(_event(3, 4))
+
+    np.testing.assert_array_equal(earlier_values, [2])
+    with pytest.raises(RuntimeError, match=r"Shared column has been cleared"):
+        view.append(4)
+    with pytest.raises(RuntimeError, match=r"Shared column has been cleared"):
+        list(view)
+    view.clear()
+    view.append(4)
+    assert list(view) == [4]
+
+
+def test_callback_subscribed_before_scan_columns_raises():
+    _, ax = plt.subplots()
+    columns = ScanColumns(x="x", y="y")
+    lp = LivePlot(y="y", x="x", ax=ax, columns=columns, max_redraw_rate_hz=None)
+
+    _send([columns], "start", _START)
+    _send([lp], "start", _START)
+    with pytest.raises(RuntimeError, match=r"View counted 1 values, but the shared column only"):
+        _send([lp, columns], "event", _event(1, 2))
+
+
+def test_view_of_unknown_field_raises():
+    columns = ScanColumns(x="x", y="y")
+    with pytest.raises(ValueError, match=r"yerr is not stored"):
+        columns.view("yerr")
+
+
+def test_callbacks_with_different_fields_raise():
+    columns = ScanColumns(x="x", y="y")
+    with pytest.raises(ValueError, match=r"callback uses x=x, y=y, yerr=yerr"):
+        LiveFit(Linear.fit(), y="y", x="x", yerr="yerr", columns=columns)
+    with pytest.raises(ValueError, match=r"callback uses x=z, y=y, yerr=None"):
+        LivePlot(y="y", x="z", columns=columns)
+
+
+def test_livefit_with_shared_columns_matches_own_data():
+    columns = ScanColumns(x="x", y="y", yerr="yerr")
+    shared = LiveFit(Linear.fit(), y="y", x="x", yerr="yerr", columns=columns)
+    own = LiveFit(Linear.fit(), y="y", x="x", yerr="yerr")
+
+    _send([columns, shared, own], "start", _START)
+    for x, y, yerr in [(0, 1.1, 0.1), (1, 2.9, 0.2), (2, 5.2, 0.1), (3, 7.0, 0.3)]:
+        _send([columns, shared, own], "event", _event(x, y, yerr))
+    _send([columns, shared, own], "stop", _STOP)
+
+    assert len(shared.ydata) == len(own.ydata) == 4
+    assert shared.result is not None
+    assert own.result is not None
+    assert shared.result.params["c1"].value == pytest.approx(own.result.params["c1"].value)
+    assert shared.result.params["c0"].value == pytest.approx(own.result.params["c0"].value)
+
+
+def test_livefit_with_shared_columns_gives_zero_uncertainty_zero_weight():
+    columns = ScanColumns(x="x", y="y", yerr="yerr")
+    lf = LiveFit(Linear.fit(), y="y", x="x", yerr="yerr", columns=columns, update_every=None)
+
+    _send([columns, lf], "start", _START)
+    with pytest.warns(UserWarning, match=r"standard deviation for y is 0"):
+        _send([columns, lf], "event", _event(0, 1, 0))
+    _send([columns, lf], "event", _event(1, 2, 0.5))
+
+    np.testing.assert_array_equal(lf._weights(), [0, 2])  # pyright: ignore reportPrivateUsage
+
+
+def test_livefitlogger_with_shared_columns_cleared_on_start(tmp_path):
+    columns = ScanColumns(x="x", y="y", yerr="yerr")
+    lf = LiveFit(Linear.fit(), y="y", x="x", yerr="yerr", columns=columns)
+    lfl = LiveFitLogger(
+        lf, y="y", x="x", yerr="yerr", postfix="", output_dir=tmp_path, columns=columns
+    )
+
+    for points in ([(0, 1, 1), (1, 2, 1)], [(2, 3, 1), (3, 4, 1), (4, 5, 1)]):
+        _send([columns, lf, lfl], "start", _START)
+        for point in points:
+            _send([columns, lf, lfl], "event", _event(*point))
+        _send([columns, lf, lfl], "stop", _STOP)
+
+    assert list(lfl.x_data) == [2, 3, 4]
+    assert list(lfl.yerr_data) == [1, 1, 1]
+
+
+def test_liveplot_with_shared_columns():
+    _, ax = plt.subplots()
+    columns = ScanColumns(x="x", y="y", yerr="yerr")
+    lp = LivePlot(y="y", x="x", yerr="yerr", ax=ax, columns=columns, max_redraw_rate_hz=None)
+
+    _send([columns, lp], "start", _START)
+    _send([columns, lp], "event", _event(1, 2, 0.5))
+    _send([columns, lp], "event", _event(3, 4, 1))
+
+    assert list(lp.x_data) == [1, 3]
+    assert list(lp.yerr_data) == [0.5, 1]
+    np.testing.assert_array_equal(lp.current_line.get_ydata(), [2, 4])
+
+
+def test_liveplot_against_time_keeps_own_x_data():
+    _, ax = plt.subplots()
+    columns = ScanColumns(x="time", y="y")
+    lp = LivePlot(y="y", x="time", ax=ax, columns=columns, max_redraw_rate_hz=None)
+
+    _send([columns, lp], "start", _START)
+    _send([columns, lp], "event", _event(1, 2))
+
+    assert lp.x_data == [123.0]
+    assert list(columns["time"]) == [123.0]
+    assert list(lp.y_data) == [2]
+
+
+def test_scan_columns_store_each_event_once_when_called():
+    columns = ScanColumns(x="x", y="y")
+    columns("start", _START)
+    columns("event", _event(1, 2))
+
+    np.testing.assert_array_equal(columns["x"].values, [1])
+
+
+def test_callbacks_with_shared_columns_handle_event_pages():
+    _, ax = plt.subplots()
+    columns = ScanColumns(x="x", y="y", yerr="yerr")
+    lf = LiveFit(Linear.fit(), y="y", x="x", yerr="yerr", columns=columns)
+    lfp = _LiveFitPlot(livefit=lf, ax=ax, num_points=10)
+    lp = LivePlot(y="y", x="x", yerr="yerr", ax=ax, columns=columns)
+    page = {"data": {"x": [0, 1, 2, 3], "y": [1, 3, 5, 7], "yerr": [1, 1, 1, 0.5]}}
+
+    for callback in [columns, lfp, lp]:
+        callback("start", _START)
+    for callback in [columns, lfp, lp]:
+        callback("event_page", page)
+    # Pages without x and y (for example, from another stream) are ignored.
+    for callback in [columns, lfp, lp]:
+        callback("event_page", {"data": {"other": [4]}})
+
+    np.testing.assert_array_equal(columns["yerr"].values, [1, 1, 1, 0.5])
+    assert len(lf.ydata) == 4
+    assert list(lp.x_data) == [0, 1, 2, 3]
+    np.testing.assert_array_equal(lf._weights(), [1, 1, 1, 2])  # pyright: ignore reportPrivateUsage
+    assert lf.result is not None
+    assert lf.result.values["c1"] == pytest.approx(2)
+    np.testing.assert_allclose(lfp.x_data, np.linspace(0, 3, 10))
+    np.testing.assert_allclose(lfp.y_data, 2 * np.linspace(0, 3, 10) + 1)
+
+
+def test_live_fit_plot_event_page_uses_xlim_and_skips_failed_fit():
+    _, ax = plt.subplots()
+    lf = LiveFit(Linear.fit(), y="y", x="x")
+    lfp = _LiveFitPlot(livefit=lf, ax=ax, num_points=3, xlim=(-1, 1))
+    lfp.start(_START)
+
+    lfp.event_page({"data": {"x": [0], "y": [1]}})  # type: ignore
+    assert lf.result is None
+
+    lfp.event_page({"data": {"x": [1, 2], "y": [3, 5]}})  # type: ignore
+    np.testing.assert_allclose(lfp.x_data, [-1, 0, 1])
+    np.testing.assert_allclose(lfp.y_data, [-1, 1, 3])
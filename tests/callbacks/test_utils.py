@@ -1,9 +1,11 @@
 import os
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 
 from ibex_bluesky_core.callbacks import get_default_output_path
+from ibex_bluesky_core.callbacks._utils import FloatColumn, FloatColumnView
 
 
 def test_default_output_location_with_env_var():
@@ -15,3 +17,100 @@ def test_default_output_location_with_env_var():
 def test_default_output_location_without_env_var():
     with patch("ibex_bluesky_core.callbacks._utils.os.environ.get", return_value=None):
         assert str(get_default_output_path()) == r"C:\Data"
+
+
+def test_float_column_grows_and_keeps_values():
+    column = FloatColumn()
+    for i in range(100):
+        column.append(i)
+
+    assert len(column) == 100
+    assert column[-1] == 99.0
+    assert list(column) == [float(i) for i in range(100)]
+    np.testing.assert_array_equal(np.asarray(column), np.arange(100))
+
+
+def test_float_column_values_are_read_only_views():
+    column = FloatColumn()
+    column.append(1.0)
+    view = column.values
+
+    with pytest.raises(ValueError, match="read-only"):
+        view[0] = 2.0
+
+
+def test_float_column_views_not_changed_by_later_appends_or_clear():
+    column = FloatColumn()
+    column.append(1.0)
+    view = column.values
+
+    for i in range(100):
+        column.append(i)
+    column.clear()
+    column.append(5.0)
+
+    np.testing.assert_array_equal(view, [1.0])
+    assert list(column) == [5.0]
+
+
+def test_float_column_generation_increments_on_clear():
+    column = FloatColumn()
+    column.append(1.0)
+    assert column.generation == 0
+
+    column.clear()
+    column.append(2.0)
+
+    assert column.generation == 1
+
+
+def test_float_column_view_contains_only_counted_values():
+    column = FloatColumn()
+    view = FloatColumnView(column)
+    for value in (1.0, 2.0, 3.0):
+        column.append(value)
+    view.append(1.0)
+    view.append(2.0)
+
+    assert len(view) == 2
+    assert view[-1] == 2.0
+    np.testing.assert_array_equal(np.asarray(view), [1.0, 2.0])
+
+
+def test_float_column_extend():
+    column = FloatColumn()
+    column.append(0.0)
+    column.extend(np.arange(1, 100))
+    column.extend([])
+
+    assert list(column) == [float(i) for i in range(100)]
+
+    view = FloatColumnView(column)
+    view.extend([0.0, 1.0, 2.0])
+    np.testing.assert_array_equal(np.asarray(view), [0.0, 1.0, 2.0])
+
+
+def test_float_column_view_raises_once_column_is_cleared_until_view_is_cleared():
+    column = FloatColumn()
+    view = FloatColumnView(column)
+    column.append(1.0)
+    view.append(1.0)
+
+    column.clear()
+    column.extend([2.0, 3.0])
+
+    with pytest.raises(RuntimeError, match=r"Shared column has been cleared"):
+        view.extend([2.0, 3.0])
+    view.clear()
+    view.extend([2.0, 3.0])
+    assert list(view) == [2.0, 3.0]
+
+
+def test_float_column_view_raises_if_it_counts_values_not_in_column():
+    column = FloatColumn()
+    view = FloatColumnView(column)
+    column.append(1.0)
+
+    with pytest.raises(RuntimeError, match=r"View counted 2 values, but the shared column only"):
+        view.extend([1.0, 2.0])
+    assert len(view) == 0
@@ -6,8 +6,9 @@ from platform import node
 from stat import S_IRGRP, S_IROTH, S_IRUSR
 from unittest.mock import call, mock_open, patch
 
+import numpy as np
 import pytest
-from event_model import DataKey, Event, EventDescriptor, RunStart, RunStop
+from event_model import DataKey, Event, EventDescriptor, EventPage, RunStart, RunStop
 
 from ibex_bluesky_core.callbacks import HumanReadableFileCallback
 
@@ -38,7 +39,7 @@ def test_header_data_all_available_on_start(cb):
             / f"{node()}_block_2024-10-04_13-43-43Z.txt"
         )
 
-    mock_file.assert_called_with(result, "a", newline="\n", encoding="utf-8")
+    mock_file.assert_called_with(result, "a", newline="", encoding="utf-8")
     writelines_call_args = mock_file().writelines.call_args[0][0]
     # time should have been renamed to start_time and converted to human readable
     assert "start_time: 2024-10-04_13-43-43\n" in writelines_call_args
@@ -61,7 +62,7 @@ def test_no_rb_number_folder(cb):
         )
         assert mock_mkdir.called
 
-    mock_file.assert_called_with(result, "a", newline="\n", encoding="utf-8")
+    mock_file.assert_called_with(result, "a", newline="", encoding="utf-8")
     # time should have been renamed to start_time and converted to human-readable
     writelines_call_args = mock_file().writelines.call_args[0][0]
     assert "start_time: 2024-10-04_13-43-43\n" in writelines_call_args
@@ -82,7 +83,7 @@ def test_no_motors_doesnt_append_to_filename(cb):
         result = save_path / "Unknown RB" / "bluesky_scans" / f"{node()}_2024-10-04_13-43-43Z.txt"
         assert mock_mkdir.called
 
-    mock_file.assert_called_with(result, "a", newline="\n", encoding="utf-8")
+    mock_file.assert_called_with(result, "a", newline="", encoding="utf-8")
     # time should have been renamed to start_time and converted to human readable
     writelines_call_args = mock_file().writelines.call_args[0][0]
     assert "start_time: 2024-10-04_13-43-43\n" in writelines_call_args
@@ -240,3 +241,131 @@ def test_file_set_readonly_when_finished(cb):
         )
         cb.stop(run_stop)
     mock_chmod.assert_called_with(result, S_IRUSR | S_IRGRP | S_IROTH)
+
+
+def test_file_opened_once_per_run_and_output_written(tmp_path):
+    cb = HumanReadableFileCallback(["block", "dae"], output_dir=tmp_path)
+    start_uid = "start"
+    run_start = RunStart(time=1728049423.5860472, uid=start_uid, scan_id=1, motors=("block",))
+    desc = EventDescriptor(
+        uid="desc",
+        run_start=start_uid,
+        time=0.1,
+        name="primary",
+        data_keys={
+            "block": DataKey(precision=2, units="mm"),
+            "dae": DataKey(precision=None, units=None),
+        },
+    )
+    events = [
+        Event(uid=f"ev{i}", data={"block": 1.2345 * i, "dae": i}, descriptor="desc", seq_num=i)
+        for i in range(1, 4)
+    ]
+
+    with (
+        patch("ibex_bluesky_core.callbacks._file_logger.open", wraps=open) as mock_file,
+        patch("ibex_bluesky_core.callbacks._file_logger.os.chmod"),
+    ):
+        cb.start(run_start)
+        cb.descriptor(desc)
+        for event in events:
+            cb.event(event)
+        cb.stop(RunStop(time=0.2, run_start=start_uid, uid="stop", exit_status="success"))
+
+    mock_file.assert_called_once()
+    assert cb.filename is not None
+    content = cb.filename.read_text(encoding="utf-8")
+    assert content.endswith("\nblock(mm),dae\n1.23,1\n2.47,2\n3.70,3\n")
+
+
+def test_event_pages_written_as_for_events(tmp_path):
+    cb = HumanReadableFileCallback(["block", "dae"], output_dir=tmp_path, flush_every_n_events=2)
+    start_uid = "start"
+    run_start = RunStart(time=1728049423.5860472, uid=start_uid, scan_id=1, motors=("block",))
+    desc = EventDescriptor(
+        uid="desc",
+        run_start=start_uid,
+        time=0.1,
+        name="primary",
+        data_keys={
+            "block": DataKey(precision=2, units="mm"),
+            "dae": DataKey(precision=None, units=None),
+        },
+    )
+
+    with patch("ibex_bluesky_core.callbacks._file_logger.os.chmod"):
+        cb.start(run_start)
+        cb.descriptor(desc)
+        cb.event_page(
+            EventPage(
+                data={"block": np.array([1.2345, 2.469]), "dae": np.array([1, 2])},
+                descriptor="desc",
+                seq_num=[1, 2],
+            )
+        )
+        cb.event_page(EventPage(data={"block": [], "dae": []}, descriptor="desc", seq_num=[]))
+        cb.event_page(
+            EventPage(data={"block": [3.7035], "dae": [3]}, descriptor="desc", seq_num=[3])
+        )
+        cb.stop(RunStop(time=0.2, run_start=start_uid, uid="stop", exit_status="success"))
+
+    assert cb.filename is not None
+    content = cb.filename.read_text(encoding="utf-8")
+    assert content.endswith("\nblock(mm),dae\n1.23,1\n2.47,2\n3.70,3\n")
+
+
+def test_event_page_called_before_filename_specified_does_nothing(cb):
+    with patch("ibex_bluesky_core.callbacks._file_logger.open", mock_open()) as mock_file:
+        cb.event_page(EventPage(data={"block": [1], "dae": [2]}, descriptor="desc", seq_num=[1]))
+
+    mock_file.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("flush_every_n_events", "flush_interval_s", "expected_flushes"),
+    [
+        (1, None, 4),
+        (2, None, 2),
+        (None, None, 0),
+        (None, 0.0, 4),
+        (None, 3600.0, 0),
+    ],
+)
+def test_event_flush_policy(flush_every_n_events, flush_interval_s, expected_flushes):
+    field_name = "test"
+    cb = HumanReadableFileCallback(
+        [field_name],
+        output_dir=save_path,
+        flush_every_n_events=flush_every_n_events,
+        flush_interval_s=flush_interval_s,
+    )
+    desc = EventDescriptor(uid="desc", data_keys={field_name: DataKey(precision=None)})
+    cb.descriptors["desc"] = desc
+    cb.filename = Path("test")
+
+    with patch("ibex_bluesky_core.callbacks._file_logger.open", mock_open()) as mock_file:
+        for i in range(1, 5):
+            cb.event(Event(uid="ev", data={field_name: i}, descriptor="desc", seq_num=i))
+
+        handle = mock_file.return_value
+        assert handle.flush.call_count == expected_flushes
+        handle.close.assert_not_called()
+
+        with patch("ibex_bluesky_core.callbacks._file_logger.os.chmod"):
+            cb.stop(RunStop(uid="stop", run_start="", time=0.1, exit_status="success"))
+        handle.close.assert_called_once()
+
+    mock_file.assert_called_once_with(cb.filename, "a", newline="", encoding="utf-8")
+
+
+def test_start_closes_file_left_open_by_previous_run(cb):
+    run_start = RunStart(time=1728049423.5860472, uid="start", scan_id=1)
+    with (
+        patch("ibex_bluesky_core.callbacks._file_logger.open", mock_open()) as mock_file,
+        patch("ibex_bluesky_core.callbacks._file_logger.os.makedirs"),
+    ):
+        cb.start(run_start)
+        cb.start(run_start)
+
+    assert mock_file.call_count == 2
+    mock_file.return_value.close.assert_called_once()
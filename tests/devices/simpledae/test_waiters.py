@@ -3,9 +3,12 @@ import asyncio
 import pytest
 from ophyd_async.core import set_mock_value
 
+from ibex_bluesky_core.devices.block import BlockMot
 from ibex_bluesky_core.devices.simpledae import (
     GoodUahWaiter,
     MEventsWaiter,
+    MotorPositionWaiter,
+    MotorTimeWaiter,
     PeriodGoodFramesWaiter,
     SimpleDae,
     TimeWaiter,
@@ -69,3 +72,95 @@ async def test_time_waiter(simpledae: "SimpleDae"):
     waiter = TimeWaiter(seconds=0.01)
     await waiter.wait(simpledae)
     assert waiter.additional_readable_signals(simpledae) == []
+
+
+@pytest.fixture
+async def mot() -> BlockMot:
+    mot = BlockMot(prefix="UNITTEST:", block_name="mot")
+    await mot.connect(mock=True)
+    return mot
+
+
+async def test_motor_time_waiter_records_interval(simpledae: "SimpleDae", mot: BlockMot):
+    waiter = MotorTimeWaiter(mot, seconds=0.01)
+    set_mock_value(mot.motor_done_move, 0)
+    set_mock_value(mot.user_readback, 1.0)
+
+    async def _move() -> None:
+        await asyncio.sleep(0)
+        set_mock_value(mot.user_readback, 2.0)
+
+    await asyncio.gather(waiter.wait(simpledae), _move())
+
+    assert await waiter.start_position.get_value() == pytest.approx(1.0)
+    assert await waiter.end_position.get_value() == pytest.approx(2.0)
+    assert await waiter.centre_position.get_value() == pytest.approx(1.5)
+    assert waiter.additional_readable_signals(simpledae) == [
+        waiter.start_position,
+        waiter.end_position,
+        waiter.centre_position,
+    ]
+    assert waiter.centre_position.name == "mot_centre"
+
+
+async def test_motor_position_waiter_waits_for_distance(simpledae: "SimpleDae", mot: BlockMot):
+    waiter = MotorPositionWaiter(mot, distance=-0.5)
+    set_mock_value(mot.motor_done_move, 0)
+    set_mock_value(mot.user_readback, 1.0)
+
+    task = asyncio.create_task(waiter.wait(simpledae))
+    await asyncio.sleep(SHORT_TIMEOUT)
+    set_mock_value(mot.user_readback, 1.4)
+    await asyncio.sleep(SHORT_TIMEOUT)
+    assert not task.done()
+
+    set_mock_value(mot.user_readback, 1.5)
+    await asyncio.wait_for(task, timeout=SHORT_TIMEOUT)
+
+    assert await waiter.start_position.get_value() == pytest.approx(1.0)
+    assert await waiter.end_position.get_value() == pytest.approx(1.5)
+
+
+async def test_motor_position_waiter_finishes_if_motor_stops(simpledae: "SimpleDae", mot: BlockMot):
+    waiter = MotorPositionWaiter(mot, distance=0.5)
+    set_mock_value(mot.motor_done_move, 0)
+    set_mock_value(mot.user_readback, 1.0)
+
+    task = asyncio.create_task(waiter.wait(simpledae))
+    await asyncio.sleep(SHORT_TIMEOUT)
+    set_mock_value(mot.user_readback, 1.2)
+    set_mock_value(mot.motor_done_move, 1)
+    await asyncio.wait_for(task, timeout=SHORT_TIMEOUT)
+
+    assert await waiter.end_position.get_value() == pytest.approx(1.2)
+
+
+@pytest.mark.parametrize(
+    ("waiter_kwargs", "expected"),
+    [
+        ({"seconds": 0.5}, 20),
+        ({"seconds": 0.1}, 100),
+        ({"seconds": 3}, 4),
+        ({"distance": 0.1}, 30),
+        ({"distance": -0.7}, 5),
+    ],
+)
+def test_motor_waiter_expected_intervals(
+    mot: BlockMot, waiter_kwargs: dict[str, float], expected: int
+):
+    if "seconds" in waiter_kwargs:
+        waiter = MotorTimeWaiter(mot, **waiter_kwargs)
+    else:
+        waiter = MotorPositionWaiter(mot, **waiter_kwargs)
+    assert waiter.expected_intervals(-3.0, 10.0) == expected
+
+
+@pytest.mark.parametrize("seconds", [0, -1])
+def test_motor_time_waiter_rejects_non_positive_time(mot: BlockMot, seconds: float):
+    with pytest.raises(ValueError, match="must be positive"):
+        MotorTimeWaiter(mot, seconds=seconds)
+
+
+def test_motor_position_waiter_rejects_zero_distance(mot: BlockMot):
+    with pytest.raises(ValueError, match="must not be zero"):
+        MotorPositionWaiter(mot, distance=0)
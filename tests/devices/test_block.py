@@ -1,23 +1,30 @@
 # pyright: reportMissingParameterType=false
+import asyncio
+import logging
 from contextlib import nullcontext
 from unittest.mock import ANY, MagicMock, call, patch
 
 import bluesky.plan_stubs as bps
 import bluesky.plans as bp
 import pytest
-from ophyd_async.core import get_mock_put, set_mock_value
+from ophyd_async.core import DeviceMock, get_mock, get_mock_put, set_mock_value
 from ophyd_async.epics.motor import MotorLimitsError
+from ophyd_async.plan_stubs import ensure_connected
 
 from ibex_bluesky_core.devices.block import (
     GLOBAL_MOVING_FLAG_PRE_WAIT,
     BlockMot,
     BlockR,
+    BlockReadConfig,
     BlockRw,
+    BlockRwGroup,
     BlockRwRbv,
     BlockWriteConfig,
+    _keep_monitor_alive,
     block_mot,
     block_r,
     block_rw,
+    block_rw_group,
     block_rw_rbv,
     block_w,
 )
@@ -145,6 +152,136 @@ async def test_describe(rw_rbv_block):
     assert descriptor["float_block-setpoint_readback"]["dtype"] == "number"
 
 
+@pytest.mark.parametrize("clazz", [BlockR, BlockRw, BlockRwRbv])
+async def test_read_with_monitor_cache_gives_same_reading_as_without(clazz):
+    uncached = clazz(float, MOCK_PREFIX, "float_block")
+    await uncached.connect(mock=True)
+    cached = clazz(
+        float, MOCK_PREFIX, "float_block", read_config=BlockReadConfig(use_monitor_cache=True)
+    )
+    await cached.connect(mock=True)
+
+    for block in (uncached, cached):
+        set_mock_value(block.readback, 10.0)
+        if isinstance(block, BlockRwRbv):
+            set_mock_value(block.setpoint_readback, 30.0)
+
+    uncached_reading = await uncached.read()
+    cached_reading = await cached.read()
+
+    assert uncached_reading.keys() == cached_reading.keys()
+    for key, reading in uncached_reading.items():
+        assert cached_reading[key]["value"] == reading["value"]
+
+
+async def test_read_with_monitor_cache_follows_monitor_updates():
+    block = BlockRwRbv(
+        float, MOCK_PREFIX, "float_block", read_config=BlockReadConfig(use_monitor_cache=True)
+    )
+    await block.connect(mock=True)
+    set_mock_value(block.readback, 10.0)
+    assert (await block.read())["float_block"]["value"] == 10.0
+
+    set_mock_value(block.readback, 20.0)
+    set_mock_value(block.setpoint_readback, 30.0)
+    reading = await block.read()
+    assert reading["float_block"]["value"] == 20.0
+    assert reading["float_block-setpoint_readback"]["value"] == 30.0
+
+
+async def test_read_with_monitor_cache_keeps_monitor_after_unstage():
+    block = BlockR(
+        float, MOCK_PREFIX, "float_block", read_config=BlockReadConfig(use_monitor_cache=True)
+    )
+    await block.connect(mock=True)
+    await block.stage()
+    await block.read()
+    await block.unstage()
+
+    # Cache is still populated, so a read explicitly from the cache works.
+    set_mock_value(block.readback, 20.0)
+    assert (await block.readback.read(cached=True))["float_block"]["value"] == 20.0
+
+
+async def test_stop_monitoring_removes_monitor_subscription():
+    block = BlockRwRbv(
+        float, MOCK_PREFIX, "float_block", read_config=BlockReadConfig(use_monitor_cache=True)
+    )
+    await block.connect(mock=True)
+    await block.read()
+
+    with (
+        patch.object(block.readback, "clear_sub", wraps=block.readback.clear_sub) as clear_rbv,
+        patch.object(
+            block.setpoint_readback, "clear_sub", wraps=block.setpoint_readback.clear_sub
+        ) as clear_sp_rbv,
+    ):
+        block.stop_monitoring()
+        block.stop_monitoring()  # Already stopped, so does nothing.
+
+    clear_rbv.assert_called_once_with(_keep_monitor_alive)
+    clear_sp_rbv.assert_called_once_with(_keep_monitor_alive)
+
+    # Reading again reopens the monitors.
+    with patch.object(
+        block.readback, "subscribe_reading", wraps=block.readback.subscribe_reading
+    ) as subscribe:
+        await block.read()
+    subscribe.assert_called_once_with(_keep_monitor_alive)
+
+
+@pytest.mark.parametrize("force_reconnect", [True, False])
+async def test_reconnecting_block_stops_monitoring_only_if_forced(force_reconnect):
+    block = BlockR(
+        float, MOCK_PREFIX, "float_block", read_config=BlockReadConfig(use_monitor_cache=True)
+    )
+    await block.connect(mock=True)
+    await block.read()
+
+    with patch.object(block.readback, "clear_sub") as clear_sub:
+        await block.connect(mock=True, force_reconnect=force_reconnect)
+
+    assert clear_sub.called == force_reconnect
+
+
+async def test_read_with_monitor_cache_rereads_stale_readings():
+    block = BlockR(
+        float,
+        MOCK_PREFIX,
+        "float_block",
+        read_config=BlockReadConfig(use_monitor_cache=True, max_age_s=60),
+    )
+    await block.connect(mock=True)
+    set_mock_value(block.readback, 10.0)
+    await block.read()
+
+    with (
+        patch.object(block.readback, "read", wraps=block.readback.read) as mock_read,
+        patch("ibex_bluesky_core.devices.block.time.time", return_value=1e12),
+    ):
+        reading = await block.read()
+
+    assert reading["float_block"]["value"] == 10.0
+    assert mock_read.mock_calls == [call(cached=True), call(cached=False)]
+
+
+async def test_read_with_monitor_cache_uses_fresh_enough_readings():
+    block = BlockR(
+        float,
+        MOCK_PREFIX,
+        "float_block",
+        read_config=BlockReadConfig(use_monitor_cache=True, max_age_s=60),
+    )
+    await block.connect(mock=True)
+    set_mock_value(block.readback, 10.0)
+
+    with patch.object(block.readback, "read", wraps=block.readback.read) as mock_read:
+        reading = await block.read()
+
+    assert reading["float_block"]["value"] == 10.0
+    assert mock_read.mock_calls == [call(cached=True)]
+
+
 async def test_read_and_describe_configuration(readable_block):
     # Blocks don't have any configuration signals at the moment so these should be empty
     configuration_reading = await readable_block.read_configuration()
@@ -208,6 +345,82 @@ async def test_block_set_with_settle_time_longer_than_timeout():
         mock_aio_sleep.assert_called_once_with(30)
 
 
+async def test_block_set_with_fixed_settle_time_records_settle_time():
+    block = await _block_with_write_config(
+        BlockWriteConfig(use_completion_callback=False, settle_time_s=0.01)
+    )
+    assert block.last_settle_time_s is None
+
+    await block.set(20)
+
+    assert block.last_settle_time_s is not None
+    assert block.last_settle_time_s >= 0.01
+
+
+async def test_block_set_with_stable_readback_settles_after_dwell_time():
+    block = await _block_with_write_config(
+        BlockWriteConfig(
+            use_completion_callback=False,
+            settle_time_s=30,
+            settle_tolerance=0.1,
+            settle_dwell_s=0.05,
+        )
+    )
+    set_mock_value(block.readback, 20)
+
+    await block.set(20)
+
+    assert block.last_settle_time_s is not None
+    assert 0.05 <= block.last_settle_time_s < 30
+
+
+async def test_block_set_with_unstable_readback_restarts_dwell_window():
+    block = await _block_with_write_config(
+        BlockWriteConfig(
+            use_completion_callback=False,
+            settle_time_s=30,
+            settle_tolerance=0.1,
+            settle_dwell_s=0.5,
+        )
+    )
+    set_mock_value(block.readback, 10)
+
+    async def move_readback():
+        await asyncio.sleep(0.05)
+        set_mock_value(block.readback, 10.05)  # Within tolerance, does not restart window
+        await asyncio.sleep(0.05)
+        set_mock_value(block.readback, 20)  # Outside tolerance, restarts window
+
+    mover = asyncio.create_task(move_readback())
+    await block.set(20)
+    await mover
+
+    assert block.last_settle_time_s is not None
+    assert 0.55 <= block.last_settle_time_s < 30
+
+
+@pytest.mark.parametrize("settle_time_s", [0.0, -1.0])
+def test_block_write_config_with_settle_tolerance_requires_max_settle_time(settle_time_s):
+    with pytest.raises(ValueError, match="settle_time_s"):
+        BlockWriteConfig(settle_tolerance=0.1, settle_time_s=settle_time_s)
+
+
+async def test_block_set_with_never_stable_readback_settles_after_max_settle_time():
+    block = await _block_with_write_config(
+        BlockWriteConfig(
+            use_completion_callback=False,
+            settle_time_s=0.1,
+            settle_tolerance=0.1,
+            settle_dwell_s=30,
+        )
+    )
+
+    await block.set(20)
+
+    assert block.last_settle_time_s is not None
+    assert 0.1 <= block.last_settle_time_s < 30
+
+
 async def test_block_set_waiting_for_global_moving_flag():
     block = await _block_with_write_config(
         BlockWriteConfig(use_global_moving_flag=True, set_timeout_s=0.1)
@@ -377,3 +590,208 @@ async def test_block_failing_write_with_default_write_config(writable_block):
     get_mock_put(writable_block.setpoint).side_effect = TimeoutError
     with pytest.raises(TimeoutError):
         await writable_block.set(1)
+
+
+async def test_block_write_setpoint_does_not_wait_for_set_success_or_settle():
+    func = MagicMock(return_value=False)  # Would never complete if waited on.
+    block = await _block_with_write_config(
+        BlockWriteConfig(set_success_func=func, settle_time_s=1000)
+    )
+
+    await block.write_setpoint(1.0)
+
+    get_mock_put(block.setpoint).assert_called_once_with(1.0)
+    func.assert_not_called()
+    assert block.last_settle_time_s is None
+    assert block.write_config.settle_time_s == 1000
+
+
+async def _block_group(*write_configs: BlockWriteConfig[float], set_timeout_s=None):
+    blocks = [
+        BlockRw(float, MOCK_PREFIX, f"block{i}", write_config=write_config)
+        for i, write_config in enumerate(write_configs)
+    ]
+    group = BlockRwGroup(MOCK_PREFIX, blocks, name="group", set_timeout_s=set_timeout_s)
+    await group.connect(mock=True)
+    return group, blocks
+
+
+async def test_block_group_set_sets_all_blocks():
+    group, blocks = await _block_group(BlockWriteConfig(), BlockWriteConfig())
+
+    await group.set([1.0, 2.0])
+
+    get_mock_put(blocks[0].setpoint).assert_called_once_with(1.0)
+    get_mock_put(blocks[1].setpoint).assert_called_once_with(2.0)
+
+
+async def test_block_group_set_with_wrong_number_of_values_raises():
+    group, _ = await _block_group(BlockWriteConfig(), BlockWriteConfig())
+
+    with pytest.raises(ValueError, match="Expected 2 values"):
+        await group.set([1.0])
+
+
+async def test_block_group_waits_for_global_moving_flag_once():
+    group, blocks = await _block_group(
+        BlockWriteConfig(use_global_moving_flag=True),
+        BlockWriteConfig(use_global_moving_flag=True),
+    )
+    set_mock_value(group.global_moving, False)
+
+    with patch("ibex_bluesky_core.devices.block.asyncio.sleep") as mock_aio_sleep:
+        await group.set([1.0, 2.0])
+
+    assert mock_aio_sleep.mock_calls.count(call(GLOBAL_MOVING_FLAG_PRE_WAIT)) == 1
+    get_mock_put(blocks[0].setpoint).assert_called_once_with(1.0)
+    get_mock_put(blocks[1].setpoint).assert_called_once_with(2.0)
+
+
+async def test_block_group_without_global_moving_flag_does_not_wait_for_it():
+    group, _ = await _block_group(BlockWriteConfig(), BlockWriteConfig())
+    set_mock_value(group.global_moving, True)  # Would never complete if waited on.
+
+    await group.set([1.0, 2.0])
+
+
+async def test_block_group_checks_set_success_func_for_each_block():
+    func0 = MagicMock(return_value=True)
+    func1 = MagicMock(return_value=True)
+    group, blocks = await _block_group(
+        BlockWriteConfig(set_success_func=func0), BlockWriteConfig(set_success_func=func1)
+    )
+    set_mock_value(blocks[0].readback, 10.0)
+    set_mock_value(blocks[1].readback, 20.0)
+
+    await group.set([1.0, 2.0])
+
+    func0.assert_called_once_with(1.0, 10.0)
+    func1.assert_called_once_with(2.0, 20.0)
+
+
+async def test_block_group_set_timeout():
+    group, _ = await _block_group(
+        BlockWriteConfig(use_global_moving_flag=True), BlockWriteConfig(), set_timeout_s=0.2
+    )
+    set_mock_value(group.global_moving, True)
+
+    with pytest.raises(TimeoutError):
+        await group.set([1.0, 2.0])
+
+
+async def test_block_group_settles_each_block():
+    group, blocks = await _block_group(
+        BlockWriteConfig(settle_time_s=0.01), BlockWriteConfig(settle_time_s=0.02)
+    )
+
+    await group.set([1.0, 2.0])
+
+    assert blocks[0].last_settle_time_s is not None
+    assert blocks[0].last_settle_time_s >= 0.01
+    assert blocks[1].last_settle_time_s is not None
+    assert blocks[1].last_settle_time_s >= 0.02
+
+
+async def test_block_group_read_reads_all_blocks():
+    group, blocks = await _block_group(BlockWriteConfig(), BlockWriteConfig())
+    set_mock_value(blocks[0].readback, 10.0)
+    set_mock_value(blocks[1].readback, 20.0)
+
+    reading = await group.read()
+
+    assert reading["block0"]["value"] == 10.0
+    assert reading["block1"]["value"] == 20.0
+    assert group.hints == {"fields": ["block0", "block1"]}
+
+
+def test_plan_mv_block_group(RE):
+    group = BlockRwGroup(
+        MOCK_PREFIX, [BlockRw(float, MOCK_PREFIX, "a"), BlockRw(float, MOCK_PREFIX, "b")]
+    )
+    RE(ensure_connected(group, mock=True))
+    RE(bps.mv(group, [1.0, 2.0]))
+    assert repr(group) == "BlockRwGroup(name=, blocks=[BlockRw(name=a), BlockRw(name=b)])"
+
+
+def test_block_group_utility_function():
+    with patch("ibex_bluesky_core.devices.block.get_pv_prefix") as mock_get_prefix:
+        mock_get_prefix.return_value = MOCK_PREFIX
+        group = block_rw_group([BlockRw(float, MOCK_PREFIX, "a")], name="some_group")
+        assert group.name == "some_group"
+        assert group.global_moving.source.endswith("UNITTEST:MOCK:CS:MOT:MOVING:STR")
+
+
+async def test_block_group_connects_blocks_with_children_of_its_device_mock():
+    blocks = [BlockRw(float, MOCK_PREFIX, "a"), BlockRw(float, MOCK_PREFIX, "b")]
+    group = BlockRwGroup(MOCK_PREFIX, blocks, name="group")
+    parent = DeviceMock()
+
+    await group.connect(mock=parent)
+    await group.set([1.0, 2.0])
+
+    assert get_mock(blocks[0]) is parent().a
+    assert parent().mock_calls == [call.a.setpoint.put(1.0), call.b.setpoint.put(2.0)]
+
+
+async def test_block_group_applies_each_blocks_set_timeout():
+    group, _ = await _block_group(
+        BlockWriteConfig(set_timeout_s=0.1, set_success_func=lambda _sp, _rbv: False),
+        BlockWriteConfig(),
+    )
+
+    with pytest.raises(TimeoutError):
+        await group.set([1.0, 2.0])
+
+
+async def test_block_group_continues_if_block_times_out_without_timeout_is_error(caplog):
+    group, blocks = await _block_group(
+        BlockWriteConfig(
+            set_timeout_s=0.1,
+            timeout_is_error=False,
+            set_success_func=lambda _sp, _rbv: False,
+            settle_time_s=0.01,
+        ),
+        BlockWriteConfig(settle_time_s=0.01),
+    )
+
+    with caplog.at_level(logging.INFO, logger="ibex_bluesky_core.devices.block"):
+        await group.set([1.0, 2.0])
+
+    assert "continuing anyway" in caplog.text
+    get_mock_put(blocks[1].setpoint).assert_called_once_with(2.0)
+    assert blocks[0].last_settle_time_s is None
+    assert blocks[1].last_settle_time_s is not None
+
+
+async def test_block_group_waits_for_global_moving_flag_after_all_setpoints_written():
+    group, blocks = await _block_group(
+        BlockWriteConfig(use_global_moving_flag=True), BlockWriteConfig()
+    )
+    write_finished = asyncio.Event()
+
+    async def slow_write(_value: float) -> None:
+        await write_finished.wait()
+
+    with (
+        patch.object(blocks[1], "write_setpoint", slow_write),
+        patch("ibex_bluesky_core.devices.block._wait_for_global_moving_flag") as wait_for_flag,
+    ):
+        status = group.set([1.0, 2.0])
+        await asyncio.sleep(0.05)
+        wait_for_flag.assert_not_called()
+        write_finished.set()
+        await status
+
+    wait_for_flag.assert_awaited_once_with(group.global_moving)
+
+
+async def test_block_group_stops_waiting_for_global_moving_flag_on_timeout():
+    group, _ = await _block_group(
+        BlockWriteConfig(use_global_moving_flag=True, set_timeout_s=0.1, timeout_is_error=False),
+        BlockWriteConfig(use_global_moving_flag=True),
+        set_timeout_s=0.2,
+    )
+    set_mock_value(group.global_moving, True)
+
+    with pytest.raises(TimeoutError):
+        await group.set([1.0, 2.0])
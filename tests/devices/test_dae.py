@@ -32,13 +32,17 @@ from ibex_bluesky_core.devices.dae import (
     TimeRegime,
     TimeRegimeMode,
     TimeRegimeRow,
+    calculate_tcb_edges,
 )
 from ibex_bluesky_core.devices.dae._helpers import (
     _convert_xml_to_names_and_values,
     _set_value_in_dae_xml,
 )
 from ibex_bluesky_core.devices.dae._period_settings import _convert_period_settings_to_xml
-from ibex_bluesky_core.devices.dae._tcb_settings import _convert_tcb_settings_to_xml
+from ibex_bluesky_core.devices.dae._tcb_settings import (
+    _convert_tcb_settings_to_xml,
+    _convert_xml_to_tcb_settings,
+)
 from tests.conftest import MOCK_PREFIX
 from tests.devices.dae_testing_data import (
     dae_settings_template,
@@ -1016,3 +1020,189 @@ async def test_if_tof_edges_has_no_units_then_read_spec_dataarray_gives_error(
 
 def test_dae_repr():
     assert repr(Dae(prefix="foo", name="bar")) == "Dae(name=bar, prefix=foo)"
+
+
+def _tcb_settings_with_rows(*rows: TimeRegimeRow) -> DaeTCBSettingsData:
+    return DaeTCBSettingsData(
+        time_unit=TCBTimeUnit.MICROSECONDS,
+        tcb_calculation_method=TCBCalculationMethod.SPECIFY_PARAMETERS,
+        tcb_tables={1: TimeRegime(rows=dict(enumerate(rows, start=1)))},
+    )
+
+
+def test_calculate_tcb_edges_linear():
+    settings = _tcb_settings_with_rows(
+        TimeRegimeRow(from_=100, to=200, steps=25, mode=TimeRegimeMode.DT),
+    )
+
+    scipp.testing.assert_identical(
+        calculate_tcb_edges(settings),
+        sc.array(dims=["tof"], values=[100, 125, 150, 175, 200], unit=sc.units.us, dtype="float64"),
+    )
+
+
+def test_calculate_tcb_edges_linear_overshoots_to_whole_step():
+    settings = _tcb_settings_with_rows(
+        TimeRegimeRow(from_=0, to=25, steps=10, mode=TimeRegimeMode.DT),
+    )
+
+    np.testing.assert_allclose(calculate_tcb_edges(settings).values, [0, 10, 20, 30])
+
+
+def test_calculate_tcb_edges_linear_ignores_float_rounding_noise():
+    settings = _tcb_settings_with_rows(
+        TimeRegimeRow(from_=0, to=0.3, steps=0.1, mode=TimeRegimeMode.DT),
+    )
+
+    np.testing.assert_allclose(calculate_tcb_edges(settings).values, [0, 0.1, 0.2, 0.3])
+
+
+def test_calculate_tcb_edges_dt_div_t():
+    settings = _tcb_settings_with_rows(
+        TimeRegimeRow(from_=100, to=400, steps=1, mode=TimeRegimeMode.DTDIVT),
+    )
+
+    np.testing.assert_allclose(calculate_tcb_edges(settings).values, [100, 200, 400])
+
+
+def test_calculate_tcb_edges_dt_div_t_squared():
+    settings = _tcb_settings_with_rows(
+        TimeRegimeRow(from_=1, to=100, steps=1, mode=TimeRegimeMode.DTDIVT2),
+    )
+
+    # t -> t + t**2
+    np.testing.assert_allclose(calculate_tcb_edges(settings).values, [1, 2, 6, 42, 1806])
+
+
+def test_calculate_tcb_edges_multiple_rows_are_contiguous_and_skip_blank_rows():
+    settings = _tcb_settings_with_rows(
+        TimeRegimeRow(from_=0, to=0, steps=0, mode=TimeRegimeMode.BLANK),
+        TimeRegimeRow(from_=10, to=30, steps=10, mode=TimeRegimeMode.DT),
+        TimeRegimeRow(from_=30, to=120, steps=1, mode=TimeRegimeMode.DTDIVT),
+        TimeRegimeRow(mode=None),
+    )
+
+    np.testing.assert_allclose(calculate_tcb_edges(settings).values, [10, 20, 30, 60, 120])
+
+
+def test_calculate_tcb_edges_row_continues_from_previous_row_which_overshot():
+    settings = _tcb_settings_with_rows(
+        TimeRegimeRow(from_=0, to=25, steps=10, mode=TimeRegimeMode.DT),
+        TimeRegimeRow(from_=25, to=50, steps=10, mode=TimeRegimeMode.DT),
+    )
+
+    np.testing.assert_allclose(calculate_tcb_edges(settings).values, [0, 10, 20, 30, 40, 50])
+
+
+def test_calculate_tcb_edges_uses_from_of_row_after_gap():
+    settings = _tcb_settings_with_rows(
+        TimeRegimeRow(from_=10, to=30, steps=10, mode=TimeRegimeMode.DT),
+        TimeRegimeRow(from_=50, to=70, steps=10, mode=TimeRegimeMode.DT),
+    )
+
+    np.testing.assert_allclose(calculate_tcb_edges(settings).values, [10, 20, 30, 50, 60, 70])
+
+
+def test_calculate_tcb_edges_uses_time_unit_and_regime():
+    settings = DaeTCBSettingsData(
+        time_unit=TCBTimeUnit.NANOSECONDS,
+        tcb_tables={
+            1: TimeRegime(rows={1: TimeRegimeRow(from_=0, to=1, steps=1, mode=TimeRegimeMode.DT)}),
+            2: TimeRegime(rows={1: TimeRegimeRow(from_=0, to=2, steps=1, mode=TimeRegimeMode.DT)}),
+        },
+    )
+
+    scipp.testing.assert_identical(
+        calculate_tcb_edges(settings, time_regime=2),
+        sc.array(dims=["tof"], values=[0, 1, 2], unit=sc.units.ns, dtype="float64"),
+    )
+
+
+def test_calculate_tcb_edges_from_dae_xml():
+    settings = _convert_xml_to_tcb_settings(initial_tcb_settings)
+    settings.tcb_tables = {
+        1: TimeRegime(rows={1: TimeRegimeRow(from_=5, to=20, steps=5, mode=TimeRegimeMode.DT)})
+    }
+
+    np.testing.assert_allclose(calculate_tcb_edges(settings).values, [5, 10, 15, 20])
+
+
+@pytest.mark.parametrize(
+    ("settings", "err"),
+    [
+        (
+            DaeTCBSettingsData(tcb_calculation_method=TCBCalculationMethod.USE_TCB_FILE),
+            "TCB file",
+        ),
+        (DaeTCBSettingsData(tcb_tables={}), "time unit"),
+        (DaeTCBSettingsData(time_unit=TCBTimeUnit.MICROSECONDS), "do not contain time regime 1"),
+        (
+            DaeTCBSettingsData(time_unit=TCBTimeUnit.MICROSECONDS, tcb_tables={2: TimeRegime({})}),
+            "do not contain time regime 1",
+        ),
+        (
+            _tcb_settings_with_rows(TimeRegimeRow(mode=TimeRegimeMode.BLANK)),
+            "does not contain any non-blank rows",
+        ),
+        (
+            _tcb_settings_with_rows(TimeRegimeRow(to=10, steps=1, mode=TimeRegimeMode.DT)),
+            "must specify 'from_'",
+        ),
+        (
+            _tcb_settings_with_rows(TimeRegimeRow(from_=0, steps=1, mode=TimeRegimeMode.DT)),
+            "must specify 'to' and 'steps'",
+        ),
+        (
+            _tcb_settings_with_rows(TimeRegimeRow(from_=0, to=10, mode=TimeRegimeMode.DT)),
+            "must specify 'to' and 'steps'",
+        ),
+        (
+            _tcb_settings_with_rows(TimeRegimeRow(from_=0, to=10, steps=0, mode=TimeRegimeMode.DT)),
+            "must have positive 'steps'",
+        ),
+        (
+            _tcb_settings_with_rows(TimeRegimeRow(from_=10, to=5, steps=1, mode=TimeRegimeMode.DT)),
+            "must end after it starts",
+        ),
+        (
+            _tcb_settings_with_rows(
+                TimeRegimeRow(from_=0, to=10, steps=1, mode=TimeRegimeMode.DTDIVT)
+            ),
+            "must start at a positive time",
+        ),
+        (
+            _tcb_settings_with_rows(
+                TimeRegimeRow(from_=1, to=10, steps=1, mode=TimeRegimeMode.SHIFTED)
+            ),
+            "cannot be calculated locally",
+        ),
+        (
+            _tcb_settings_with_rows(
+                TimeRegimeRow(from_=0, to=30, steps=10, mode=TimeRegimeMode.DT),
+                TimeRegimeRow(from_=20, to=40, steps=10, mode=TimeRegimeMode.DT),
+            ),
+            "overlaps the previous row, which ends at 30",
+        ),
+        (
+            _tcb_settings_with_rows(
+                TimeRegimeRow(from_=0, to=1e9, steps=1, mode=TimeRegimeMode.DT)
+            ),
+            "more than 1000000 time channel boundaries",
+        ),
+        (
+            _tcb_settings_with_rows(
+                TimeRegimeRow(from_=1, to=1e9, steps=1e-9, mode=TimeRegimeMode.DTDIVT)
+            ),
+            "more than 1000000 time channel boundaries",
+        ),
+        (
+            _tcb_settings_with_rows(
+                TimeRegimeRow(from_=1e-9, to=1, steps=1e-3, mode=TimeRegimeMode.DTDIVT2)
+            ),
+            "more than 1000000 time channel boundaries",
+        ),
+    ],
+)
+def test_calculate_tcb_edges_invalid_settings(settings: DaeTCBSettingsData, err: str):
+    with pytest.raises(ValueError, match=err):
+        calculate_tcb_edges(settings)
@@ -0,0 +1,34 @@
+from unittest.mock import AsyncMock, call
+
+from ophyd_async.core import DeviceMock, get_mock, soft_signal_rw
+
+from ibex_bluesky_core.devices._group import connect_with_members
+
+
+async def test_connect_with_members_passes_bool_mock_to_members():
+    group_connect = AsyncMock()
+    member = soft_signal_rw(float, name="member")
+    member.connect = AsyncMock()
+
+    await connect_with_members(
+        group_connect(), [member], mock=True, timeout=1.0, force_reconnect=False
+    )
+
+    group_connect.assert_awaited_once()
+    member.connect.assert_awaited_once_with(mock=True, timeout=1.0, force_reconnect=False)
+
+
+async def test_connect_with_members_gives_each_member_a_child_of_the_device_mock():
+    parent = DeviceMock()
+    named = soft_signal_rw(float, name="named")
+    unnamed = soft_signal_rw(float)
+
+    await connect_with_members(
+        AsyncMock()(), [named, unnamed], mock=parent, timeout=1.0, force_reconnect=False
+    )
+    await named.set(1.0)
+    await unnamed.set(2.0)
+
+    assert get_mock(named) is parent().named
+    assert get_mock(unnamed) is getattr(parent(), "1")
+    assert call.named.put(1.0) in parent().mock_calls
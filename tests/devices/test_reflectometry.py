@@ -1,11 +1,18 @@
 # pyright: reportMissingParameterType=false
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+import logging
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import bluesky.plan_stubs as bps
 import numpy as np
 import pytest
-from ophyd_async.core import callback_on_mock_put, get_mock_put, set_mock_value
+from ophyd_async.core import (
+    DeviceMock,
+    callback_on_mock_put,
+    get_mock,
+    get_mock_put,
+    set_mock_value,
+)
 from ophyd_async.plan_stubs import ensure_connected
 
 from ibex_bluesky_core.devices import NoYesChoice
@@ -13,8 +20,10 @@ from ibex_bluesky_core.devices.dae import Dae
 from ibex_bluesky_core.devices.reflectometry import (
     AngleMappingReducer,
     ReflParameter,
+    ReflParameterGroup,
     ReflParameterRedefine,
     refl_parameter,
+    refl_parameter_group,
 )
 
 
@@ -51,6 +60,181 @@ async def test_times_out_if_changing_never_finishes_on_reflectometry_parameter(R
         await param.set(new_value)
 
 
+async def test_set_waits_for_changing_to_start_and_finish_on_reflectometry_parameter(RE):
+    param = ReflParameter(prefix="UNITTEST:", name="S1VG", changing_timeout_s=1)
+    RE(ensure_connected(param, mock=True))
+    set_mock_value(param.changing, False)
+    callback_on_mock_put(param.setpoint, lambda *a, **k: set_mock_value(param.changing, True))
+
+    status = param.set(456.0)
+    await asyncio.sleep(0.2)
+    assert not status.done
+
+    set_mock_value(param.changing, False)
+    await asyncio.wait_for(status, timeout=0.1)
+    assert status.success
+
+
+async def test_set_returns_quickly_if_changing_never_starts_on_reflectometry_parameter(RE):
+    param = ReflParameter(
+        prefix="UNITTEST:", name="S1VG", changing_timeout_s=60, changing_race_guard_s=0.01
+    )
+    RE(ensure_connected(param, mock=True))
+    set_mock_value(param.changing, False)
+
+    await asyncio.wait_for(param.set(456.0), timeout=0.5)
+    get_mock_put(param.setpoint).assert_called_once_with(456.0)
+
+
+async def test_redefine_waits_for_readback(RE):
+    param = ReflParameterRedefine(prefix="UNITTEST:", name="S1VG")
+    RE(ensure_connected(param, mock=True))
+    set_mock_value(param.manager_mode, NoYesChoice.YES)
+    set_mock_value(param.readback, 123.0)
+
+    status = param.set(456.0)
+    await asyncio.sleep(0.1)
+    assert not status.done
+
+    set_mock_value(param.readback, 456.0001)
+    await asyncio.wait_for(status, timeout=0.1)
+    get_mock_put(param.define_pos_sp).assert_called_once_with(456.0)
+
+
+async def test_redefine_logs_warning_if_readback_never_updates(RE, caplog):
+    param = ReflParameterRedefine(prefix="UNITTEST:", name="S1VG", timeout_s=0.01)
+    RE(ensure_connected(param, mock=True))
+    set_mock_value(param.manager_mode, NoYesChoice.YES)
+    set_mock_value(param.readback, 123.0)
+
+    with caplog.at_level(logging.WARNING):
+        await param.set(456.0)
+
+    get_mock_put(param.define_pos_sp).assert_called_once_with(456.0)
+    assert "did not show redefined position 456.0 within 0.01 seconds" in caplog.text
+
+
+@pytest.mark.parametrize(
+    ("tolerance", "precision", "readback", "redefined"),
+    [
+        # Tolerance from the parameter's precision.
+        (None, 1, 456.04, True),
+        (None, 3, 456.04, False),
+        # Default tolerance, if the parameter has no precision.
+        (None, None, 456.0009, True),
+        (None, None, 456.04, False),
+        # An explicit tolerance overrides the parameter's precision.
+        (0.1, 3, 456.04, True),
+    ],
+)
+async def test_redefine_tolerance(RE, caplog, tolerance, precision, readback, redefined):
+    param = ReflParameterRedefine(
+        prefix="UNITTEST:", name="S1VG", timeout_s=0.1, tolerance=tolerance
+    )
+    RE(ensure_connected(param, mock=True))
+    set_mock_value(param.manager_mode, NoYesChoice.YES)
+    set_mock_value(param.readback, readback)
+    description = {"dtype": "number", "shape": [], "source": "UNITTEST:"}
+    if precision is not None:
+        description["precision"] = precision
+
+    with (
+        patch.object(
+            param.readback, "describe", AsyncMock(return_value={param.readback.name: description})
+        ),
+        caplog.at_level(logging.WARNING),
+    ):
+        await param.set(456.0)
+
+    assert ("did not show redefined position" in caplog.text) != redefined
+
+
+async def _refl_group(**kwargs):
+    params = [
+        ReflParameter(prefix="UNITTEST:", name=name, changing_timeout_s=1)
+        for name in ["THETA", "HEIGHT"]
+    ]
+    group = ReflParameterGroup("UNITTEST:", params, name="group", **kwargs)
+    await group.connect(mock=True)
+    return group, params
+
+
+async def test_refl_group_sets_setpoints_without_action_then_moves_once():
+    group, params = await _refl_group()
+    set_mock_value(group.changing, False)
+    callback_on_mock_put(group.move, lambda *a, **k: set_mock_value(group.changing, True))
+
+    status = group.set([1.0, 2.0])
+    await asyncio.sleep(0.2)
+    assert not status.done
+
+    set_mock_value(group.changing, False)
+    await asyncio.wait_for(status, timeout=0.1)
+
+    get_mock_put(params[0].setpoint_no_action).assert_called_once_with(1.0)
+    get_mock_put(params[1].setpoint_no_action).assert_called_once_with(2.0)
+    get_mock_put(params[0].setpoint).assert_not_called()
+    get_mock_put(params[1].setpoint).assert_not_called()
+    get_mock_put(group.move).assert_called_once_with(1)
+
+
+async def test_refl_group_set_with_wrong_number_of_values_raises():
+    group, _ = await _refl_group()
+    with pytest.raises(ValueError, match="Expected 2 values to set on group, got 1"):
+        await group.set([1.0])
+
+
+async def test_refl_group_times_out_if_changing_never_finishes():
+    group, _ = await _refl_group(changing_timeout_s=0.01)
+    set_mock_value(group.changing, True)
+    with pytest.raises(asyncio.TimeoutError):
+        await group.set([1.0, 2.0])
+
+
+async def test_refl_group_read_reads_all_parameters():
+    group, params = await _refl_group()
+    set_mock_value(params[0].readback, 10.0)
+    set_mock_value(params[1].readback, 20.0)
+
+    reading = await group.read()
+
+    assert reading["THETA"]["value"] == 10.0
+    assert reading["HEIGHT"]["value"] == 20.0
+
+
+async def test_refl_group_connects_parameters_with_children_of_its_device_mock():
+    params = [ReflParameter(prefix="UNITTEST:", name="THETA", changing_timeout_s=1)]
+    group = ReflParameterGroup("UNITTEST:", params, name="group", changing_race_guard_s=0.01)
+    parent = DeviceMock()
+
+    await group.connect(mock=parent)
+    await group.set([1.0])
+
+    assert get_mock(params[0]) is parent().THETA
+    assert call.THETA.setpoint_no_action.put(1.0) in parent().mock_calls
+
+
+def test_plan_mv_refl_group(RE):
+    group = ReflParameterGroup(
+        "UNITTEST:",
+        [ReflParameter(prefix="UNITTEST:", name="THETA", changing_timeout_s=1)],
+        changing_race_guard_s=0.01,
+    )
+    RE(ensure_connected(group, mock=True))
+    RE(bps.mv(group, [1.0]))
+    assert repr(group) == "ReflParameterGroup(name=, parameters=[ReflParameter(name=THETA)])"
+
+
+def test_refl_group_utility_function():
+    with patch("ibex_bluesky_core.devices.reflectometry.get_pv_prefix", return_value="UNITTEST:"):
+        group = refl_parameter_group(
+            [ReflParameter(prefix="UNITTEST:", name="THETA", changing_timeout_s=1)],
+            name="some_group",
+        )
+    assert group.name == "some_group"
+    assert group.changing.source == "ca://UNITTEST:REFL_01:BL:CHANGING"
+
+
 async def test_fails_to_redefine_and_raises_if_not_in_manager_mode(RE):
     param = ReflParameterRedefine(prefix="UNITTEST:", name="S1VG")
     RE(ensure_connected(param, mock=True))
@@ -0,0 +1,103 @@
+# pyright: reportMissingParameterType=false
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from ophyd_async.core import Device
+
+from ibex_bluesky_core.devices import DeviceRegistry, get_device_registry
+from ibex_bluesky_core.devices.block import BlockR, BlockWriteConfig, block_r, block_rw
+from ibex_bluesky_core.devices.reflectometry import refl_parameter
+from tests.conftest import MOCK_PREFIX
+
+
+@pytest.fixture
+def registry():
+    with patch("ibex_bluesky_core.devices.block.get_pv_prefix", return_value=MOCK_PREFIX):
+        yield DeviceRegistry()
+
+
+def test_get_returns_same_device_for_same_arguments(registry):
+    block = registry.get(block_r, float, "some_block")
+    assert registry.get(block_r, float, "some_block") is block
+    assert block in registry
+    assert len(registry) == 1
+
+
+def test_get_returns_different_devices_for_different_arguments(registry):
+    devices = [
+        registry.get(block_r, float, "some_block"),
+        registry.get(block_r, float, "other_block"),
+        registry.get(block_r, int, "some_block"),
+        registry.get(block_rw, float, "some_block"),
+        registry.get(block_rw, float, "some_block", write_config=BlockWriteConfig(settle_time_s=1)),
+    ]
+    assert len({id(d) for d in devices}) == len(devices)
+    assert registry.devices == devices
+
+
+def test_get_with_unhashable_arguments_raises(registry):
+    with pytest.raises(TypeError, match="not hashable"):
+        registry.get(BlockR, float, MOCK_PREFIX, ["unhashable"])  # pyright: ignore
+
+
+def test_evict(registry):
+    block = registry.get(block_r, float, "some_block")
+    registry.evict(block)
+    assert block not in registry
+    assert registry.get(block_r, float, "some_block") is not block
+
+    # Evicting a device which isn't in the registry does nothing
+    registry.evict(block)
+
+
+def test_clear(registry):
+    registry.get(block_r, float, "some_block")
+    registry.clear()
+    assert len(registry) == 0
+
+
+def test_get_device_registry_is_process_wide():
+    assert get_device_registry() is get_device_registry()
+
+
+def test_registry_refl_parameter():
+    registry = DeviceRegistry()
+    with patch("ibex_bluesky_core.devices.reflectometry.get_pv_prefix", return_value=MOCK_PREFIX):
+        param = registry.get(refl_parameter, "S1VG", changing_timeout_s=10)
+        assert registry.get(refl_parameter, "S1VG", changing_timeout_s=10) is param
+
+
+async def test_check_health_with_healthy_devices(registry):
+    block = registry.get(block_r, float, "some_block")
+    await block.connect(mock=True)
+
+    assert await registry.check_health() == []
+    assert block in registry
+
+
+async def test_check_health_evicts_unreadable_devices(registry):
+    healthy = registry.get(block_r, float, "healthy")
+    unhealthy = registry.get(block_r, float, "unhealthy")
+    await healthy.connect(mock=True)
+    await unhealthy.connect(mock=True)
+    unhealthy.read = AsyncMock(side_effect=OSError("disconnected"))
+
+    assert await registry.check_health() == [unhealthy]
+    assert healthy in registry
+    assert unhealthy not in registry
+
+
+async def test_check_health_without_evict(registry):
+    block = registry.get(block_r, float, "unhealthy")
+    await block.connect(mock=True)
+    block.read = AsyncMock(side_effect=TimeoutError())
+
+    assert await registry.check_health(evict=False) == [block]
+    assert block in registry
+
+
+async def test_check_health_of_non_readable_device(registry):
+    device = registry.get(Device)
+
+    assert await registry.check_health(timeout_s=1) == []
+    assert device in registry
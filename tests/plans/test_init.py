@@ -1,4 +1,5 @@
 # pyright: reportMissingParameterType=false
+import asyncio
 import functools
 from typing import Any
 from unittest.mock import patch
@@ -6,7 +7,7 @@ from unittest.mock import patch
 import bluesky.utils
 import pytest
 from bluesky.preprocessors import run_decorator
-from ophyd_async.core import callback_on_mock_put, get_mock_put, set_mock_value
+from ophyd_async.core import AsyncStatus, callback_on_mock_put, get_mock_put, set_mock_value
 from ophyd_async.plan_stubs import ensure_connected
 from ophyd_async.sim import SimMotor
 
@@ -14,6 +15,8 @@ from ibex_bluesky_core.devices.block import BlockMot, BlockR, BlockRw
 from ibex_bluesky_core.devices.simpledae import (
     Controller,
     MonitorNormalizer,
+    MotorPositionWaiter,
+    MotorTimeWaiter,
     PeriodPerPointController,
     RunPerPointController,
     SimpleDae,
@@ -23,7 +26,9 @@ from ibex_bluesky_core.fitting import Gaussian
 from ibex_bluesky_core.plan_stubs import polling_plan
 from ibex_bluesky_core.plans import (
     adaptive_scan,
+    fly_scan,
     motor_adaptive_scan,
+    motor_fly_scan,
     motor_scan,
     scan,
 )
@@ -359,3 +364,170 @@ async def test_polling_plan_drops_readable_updates_if_no_new_motor_position(RE):
     )
 
     assert all(readable == 10 for motor, readable in [x.values() for x in captured_events])
+
+
+class _CountingPeriodController(PeriodPerPointController):
+    def __init__(self, points: int) -> None:
+        super().__init__(save_run=False)
+        self.points = points
+        self.counted = 0
+        self.staged = False
+        self.finished = asyncio.Event()
+
+    async def setup(self, dae) -> None:
+        self.staged = True
+
+    async def start_counting(self, dae) -> None:
+        pass
+
+    async def stop_counting(self, dae) -> None:
+        self.counted += 1
+        if self.counted >= self.points:
+            self.finished.set()
+
+    async def teardown(self, dae) -> None:
+        self.staged = False
+
+
+async def test_fly_scan_counts_periods_until_motion_complete(RE, block):
+    controller = _CountingPeriodController(points=3)
+    fly_dae = SimpleDae(
+        prefix="UNITTEST:",
+        name="dae",
+        controller=controller,
+        waiter=MotorTimeWaiter(block, seconds=0.1),
+        reducer=MonitorNormalizer(prefix="UNITTEST:", detector_spectra=[1], monitor_spectra=[2]),
+    )
+    await fly_dae.connect(mock=True)
+    set_mock_value(fly_dae.max_periods, 50)
+    set_mock_value(block.velocity, 5.0)
+
+    events = []
+    start_docs = []
+
+    def _complete():
+        return AsyncStatus(controller.finished.wait())
+
+    with (
+        patch("ibex_bluesky_core.plans.ensure_connected"),
+        patch.object(block, "complete", side_effect=_complete),
+        patch.object(fly_dae.reducer, "reduce_data"),
+    ):
+        RE(
+            fly_scan(fly_dae, block, 0, 10, time_for_move=5, md={"foo": "bar"}),
+            {
+                "event": lambda name, doc: events.append(doc["data"]),
+                "start": lambda name, doc: start_docs.append(doc),
+            },
+        )
+
+    assert len(events) == 3
+    assert all(
+        {"SOME_BLOCK_start", "SOME_BLOCK_end", "SOME_BLOCK_centre", "dae-period_num"} <= set(e)
+        for e in events
+    )
+    assert start_docs[0]["plan_name"] == "fly_scan"
+    assert start_docs[0]["motors"] == ["SOME_BLOCK"]
+    assert start_docs[0]["foo"] == "bar"
+    assert not controller.staged
+
+    get_mock_put(fly_dae.number_of_periods.signal).assert_called_with(50)
+    # Velocity is set to 2 for the fly motion (10 units in 5 seconds), then restored.
+    velocities = [c.args[0] for c in get_mock_put(block.velocity).call_args_list]
+    assert velocities[-2:] == [pytest.approx(2.0), pytest.approx(5.0)]
+
+
+async def test_fly_scan_raises_if_move_needs_more_than_max_periods(RE, block):
+    fly_dae = SimpleDae(
+        prefix="UNITTEST:",
+        name="dae",
+        controller=PeriodPerPointController(save_run=False),
+        waiter=MotorTimeWaiter(block, seconds=0.1),
+        reducer=MonitorNormalizer(prefix="UNITTEST:", detector_spectra=[1], monitor_spectra=[2]),
+    )
+    await fly_dae.connect(mock=True)
+    set_mock_value(fly_dae.max_periods, 49)
+
+    with (
+        patch("ibex_bluesky_core.plans.ensure_connected"),
+        pytest.raises(ValueError, match=r"needs at least 50 periods.*maximum of 49"),
+    ):
+        RE(fly_scan(fly_dae, block, 0, 10, time_for_move=5))
+
+    get_mock_put(fly_dae.number_of_periods.signal).assert_not_called()
+    get_mock_put(block.user_setpoint).assert_not_called()
+
+
+async def test_fly_scan_stops_motor_if_it_runs_out_of_periods(RE, block):
+    controller = _CountingPeriodController(points=3)
+    fly_dae = SimpleDae(
+        prefix="UNITTEST:",
+        name="dae",
+        controller=controller,
+        waiter=MotorTimeWaiter(block, seconds=0.01),
+        reducer=MonitorNormalizer(prefix="UNITTEST:", detector_spectra=[1], monitor_spectra=[2]),
+    )
+    await fly_dae.connect(mock=True)
+    set_mock_value(fly_dae.max_periods, 2)
+    events = []
+
+    def _complete():
+        return AsyncStatus(controller.finished.wait())
+
+    with (
+        patch("ibex_bluesky_core.plans.ensure_connected"),
+        patch.object(fly_dae.waiter, "expected_intervals", return_value=2),
+        patch.object(block, "complete", side_effect=_complete),
+        patch.object(fly_dae.reducer, "reduce_data"),
+        pytest.raises(ValueError, match="used all 2 DAE periods"),
+    ):
+        RE(
+            fly_scan(fly_dae, block, 0, 10, time_for_move=5),
+            {"event": lambda name, doc: events.append(doc)},
+        )
+
+    assert len(events) == 2
+    get_mock_put(block.motor_stop).assert_called()
+    assert not controller.staged
+
+
+def test_fly_scan_requires_period_per_point_controller_and_motor_waiter(RE, dae, block):
+    with pytest.raises(TypeError, match="controller"):
+        RE(fly_scan(dae, block, 0, 10, time_for_move=5))
+
+    dae.controller = PeriodPerPointController(save_run=False)
+    with pytest.raises(TypeError, match="waiter"):
+        RE(fly_scan(dae, block, 0, 10, time_for_move=5))
+
+
+@pytest.mark.parametrize(
+    ("bin_by_position", "waiter_type"),
+    [(True, MotorPositionWaiter), (False, MotorTimeWaiter)],
+)
+def test_motor_fly_scan_creates_block_device_and_dae(RE, bin_by_position, waiter_type):
+    prefix = "UNITTEST:"
+    block_name = "some_block"
+    with (
+        patch("ibex_bluesky_core.devices.block.get_pv_prefix", return_value=prefix),
+        patch("ibex_bluesky_core.plans.get_pv_prefix", return_value=prefix),
+        patch("ibex_bluesky_core.plans.fly_scan") as fly_scan_mock,
+    ):
+        RE(
+            motor_fly_scan(
+                block_name,
+                0,
+                2,
+                4,
+                time_for_move=10,
+                det=1,
+                mon=3,
+                bin_by_position=bin_by_position,
+            )
+        )
+    fly_scan_mock.assert_called_once()
+    dae = fly_scan_mock.call_args[1]["dae"]
+    assert isinstance(dae, SimpleDae)
+    assert isinstance(dae.controller, PeriodPerPointController)
+    assert isinstance(dae.waiter, waiter_type)
+    assert isinstance(fly_scan_mock.call_args[1]["block"], BlockMot)
+    assert fly_scan_mock.call_args[1]["block"].name == block_name
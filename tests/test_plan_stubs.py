@@ -10,7 +10,7 @@ from bluesky import RunEngine
 from bluesky import plan_stubs as bps
 from bluesky.utils import Msg
 from ibex_non_ca_helpers.compress_hex import compress_and_hex, dehex_and_decompress
-from ophyd_async.core import get_mock_put, set_mock_value
+from ophyd_async.core import callback_on_mock_put, get_mock_put, set_mock_value
 from ophyd_async.epics.motor import UseSetMode
 from ophyd_async.plan_stubs import ensure_connected
 
@@ -170,6 +170,10 @@ async def test_redefine_refl_parameter(RE):
     param = ReflParameter(prefix="", name="some_refl_parameter", changing_timeout_s=60)
     await param.connect(mock=True)
     set_mock_value(param.redefine.manager_mode, NoYesChoice.YES)  # pyright: ignore [reportOptionalMemberAccess]
+    callback_on_mock_put(
+        param.redefine.define_pos_sp,  # pyright: ignore [reportOptionalMemberAccess]
+        lambda value, **_: set_mock_value(param.redefine.readback, value),  # pyright: ignore [reportOptionalMemberAccess]
+    )
 
     RE(redefine_refl_parameter(param, 42.0))
 
@@ -0,0 +1,248 @@
+# pyright: reportMissingParameterType=false
+
+import gzip
+import json
+import os
+from itertools import starmap
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, call
+
+import orjson
+import pytest
+from event_model import compose_run
+
+from ibex_bluesky_core.replay import (
+    ReplayIndex,
+    index_file,
+    iter_documents,
+    read_document_at,
+    replay,
+)
+
+
+def make_documents(num_events: int = 3, **md: Any) -> tuple[list[tuple[str, dict[str, Any]]], str]:
+    bundle = compose_run(metadata={"plan_name": "scan", "motors": ["mot"], **md})
+    primary = bundle.compose_descriptor(
+        name="primary",
+        data_keys={"mot": {"source": "", "dtype": "number", "shape": []}},
+    )
+    baseline = bundle.compose_descriptor(
+        name="baseline",
+        data_keys={"other": {"source": "", "dtype": "number", "shape": []}},
+    )
+    docs: list[tuple[str, dict[str, Any]]] = [
+        ("start", dict(bundle.start_doc)),
+        ("descriptor", dict(primary.descriptor_doc)),
+        ("descriptor", dict(baseline.descriptor_doc)),
+        ("event", dict(baseline.compose_event(data={"other": 0}, timestamps={"other": 0}))),
+    ]
+    docs += [
+        ("event", dict(primary.compose_event(data={"mot": i}, timestamps={"mot": 0})))
+        for i in range(num_events)
+    ]
+    docs.append(("event", dict(baseline.compose_event(data={"other": 1}, timestamps={"other": 0}))))
+    docs.append(("stop", dict(bundle.compose_stop())))
+    return docs, bundle.start_doc["uid"]
+
+
+def encode(docs: list[tuple[str, dict[str, Any]]]) -> bytes:
+    return b"".join(
+        orjson.dumps({"type": name, "document": doc}, option=orjson.OPT_APPEND_NEWLINE)
+        for name, doc in docs
+    )
+
+
+def write_orjson(path: Path, docs: list[tuple[str, dict[str, Any]]]) -> None:
+    path.write_bytes(encode(docs))
+
+
+def test_index_file(tmp_path):
+    docs, uid = make_documents()
+    path = tmp_path / f"{uid}.log"
+    write_orjson(path, docs)
+
+    scan = index_file(path)
+
+    assert scan.uid == uid
+    assert scan.plan_name == "scan"
+    assert scan.motors == ("mot",)
+    assert scan.time_start == docs[0][1]["time"]
+    assert scan.time_stop == docs[-1][1]["time"]
+    assert scan.exit_status == "success"
+    assert scan.num_events == 5
+    assert scan.descriptor_offset is not None
+    assert scan.first_event_offset is not None
+    assert read_document_at(path, scan.descriptor_offset) == docs[1]
+    assert read_document_at(path, scan.first_event_offset) == docs[3]
+
+
+def test_index_incomplete_file_written_with_json(tmp_path):
+    docs, uid = make_documents(num_events=0)
+    path = tmp_path / f"{uid}.log"
+    # Older files were written using json, with a space after each separator,
+    # and a trailing blank line is tolerated.
+    path.write_text(
+        "".join(json.dumps({"type": name, "document": doc}) + "\n" for name, doc in docs[:2]) + "\n"
+    )
+
+    scan = index_file(path)
+
+    assert scan.uid == uid
+    assert scan.time_stop is None
+    assert scan.exit_status is None
+    assert scan.num_events == 0
+    assert scan.first_event_offset is None
+
+
+def test_index_file_of_unknown_format(tmp_path):
+    path = tmp_path / "x.log"
+    path.write_bytes(b'{"document": {"uid": "abc", "time": 1.0}, "type": "start"}')
+
+    assert index_file(path).uid == "abc"
+
+
+def test_index_file_without_start_document(tmp_path):
+    path = tmp_path / "empty.log"
+    path.write_bytes(b"")
+
+    with pytest.raises(ValueError, match="does not contain a start document"):
+        index_file(path)
+
+
+def test_index_and_replay_compressed_file(tmp_path):
+    docs, uid = make_documents()
+    path = tmp_path / f"{uid}.log.gz"
+    path.write_bytes(gzip.compress(encode(docs)))
+
+    assert index_file(path).num_events == 5
+    assert list(iter_documents(path)) == docs
+
+
+def test_iter_documents_filters_streams(tmp_path):
+    docs, uid = make_documents()
+    path = tmp_path / f"{uid}.log"
+    write_orjson(path, docs)
+
+    names = [(name, doc.get("name")) for name, doc in iter_documents(path, streams=["primary"])]
+
+    assert names == [
+        ("start", None),
+        ("descriptor", "primary"),
+        ("event", None),
+        ("event", None),
+        ("event", None),
+        ("stop", None),
+    ]
+
+
+def test_replay_into_callbacks(tmp_path):
+    docs, uid = make_documents()
+    path = tmp_path / f"{uid}.log"
+    write_orjson(path, docs)
+    cb1, cb2 = MagicMock(), MagicMock()
+
+    replay(index_file(path), [cb1, cb2])
+
+    assert cb1.mock_calls == list(starmap(call, docs))
+    assert cb2.mock_calls == cb1.mock_calls
+
+
+def test_replay_in_batches(tmp_path):
+    docs, uid = make_documents(num_events=5)
+    path = tmp_path / f"{uid}.log"
+    write_orjson(path, docs)
+    cb = MagicMock()
+
+    replay(path, cb, streams=["primary"], batch_size=2)
+
+    names = [c.args[0] for c in cb.mock_calls]
+    assert names == ["start", "descriptor", "event_page", "event_page", "event_page", "stop"]
+    pages = [c.args[1] for c in cb.mock_calls if c.args[0] == "event_page"]
+    assert [page["data"]["mot"] for page in pages] == [[0, 1], [2, 3], [4]]
+
+
+def test_replay_in_batches_split_by_descriptor(tmp_path):
+    docs, uid = make_documents(num_events=2)
+    path = tmp_path / f"{uid}.log"
+    write_orjson(path, docs[:-1])
+    cb = MagicMock()
+
+    replay(path, cb, batch_size=10)
+
+    pages = [c.args[1] for c in cb.mock_calls if c.args[0] == "event_page"]
+    assert [next(iter(page["data"].values())) for page in pages] == [[0], [0, 1], [1]]
+
+
+def test_replay_index(tmp_path):
+    docs1, uid1 = make_documents(plan_name="scan")
+    docs2, uid2 = make_documents(plan_name="adaptive_scan", motors=["other_mot"])
+    write_orjson(tmp_path / f"{uid1}.log", docs1)
+    write_orjson(tmp_path / f"{uid2}.log", docs2)
+    (tmp_path / "broken.log").write_bytes(b"")
+
+    index = ReplayIndex(tmp_path)
+    scans = index.refresh()
+
+    assert [scan.uid for scan in scans] == [uid1, uid2]
+    assert index.find(uid=uid1[:8]) == [scans[0]]
+    assert index.find(plan_name="adaptive_scan") == [scans[1]]
+    assert index.find(motor="other_mot") == [scans[1]]
+    assert index.find(since=scans[1].time_start) == [scans[1]]
+    assert index.find(until=scans[0].time_start) == [scans[0]]
+
+
+def test_replay_index_only_reindexes_changed_files(tmp_path, monkeypatch):
+    docs1, uid1 = make_documents()
+    docs2, uid2 = make_documents()
+    write_orjson(tmp_path / f"{uid1}.log", docs1)
+    write_orjson(tmp_path / f"{uid2}.log", docs2[:-1])
+    cache_path = tmp_path / "index.json"
+
+    ReplayIndex(tmp_path, cache_path=cache_path).refresh()
+
+    # Complete the second scan, and delete the first.
+    write_orjson(tmp_path / f"{uid2}.log", docs2)
+    os.remove(tmp_path / f"{uid1}.log")
+
+    indexed = []
+    monkeypatch.setattr(
+        "ibex_bluesky_core.replay.index_file",
+        lambda path: indexed.append(path) or index_file(path),
+    )
+    index = ReplayIndex(tmp_path, cache_path=cache_path)
+    assert [scan.uid for scan in index.scans] == [uid1, uid2]
+    scans = index.refresh()
+
+    assert indexed == [tmp_path / f"{uid2}.log"]
+    assert [scan.uid for scan in scans] == [uid2]
+    assert scans[0].exit_status == "success"
+
+    # Unchanged files are not reindexed.
+    indexed.clear()
+    ReplayIndex(tmp_path, cache_path=cache_path).refresh()
+    assert indexed == []
+
+
+@pytest.mark.parametrize(
+    "cache",
+    [
+        b"not json",
+        b'{"not": "a list"}',
+        # Stale or foreign caches, with missing or unexpected keys.
+        b'[{"path": "a.log"}]',
+        b'[{"path": "a.log", "motors": [], "unexpected": 1}]',
+    ],
+)
+def test_replay_index_ignores_invalid_cache(tmp_path, cache):
+    docs, uid = make_documents()
+    write_orjson(tmp_path / f"{uid}.log", docs)
+    cache_path = tmp_path / "index.json"
+    cache_path.write_bytes(cache)
+
+    index = ReplayIndex(tmp_path, cache_path=cache_path)
+    assert index.scans == []
+
+    # The cache is rebuilt on the next refresh.
+    assert [scan.uid for scan in index.refresh()] == [uid]
+    assert [scan.uid for scan in ReplayIndex(tmp_path, cache_path=cache_path).scans] == [uid]
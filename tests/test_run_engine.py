@@ -1,17 +1,28 @@
 # pyright: reportMissingParameterType=false
 
+import logging
 import threading
+import time
 from collections.abc import Generator
+from enum import Enum
 from typing import Any
 from unittest.mock import MagicMock
 
 import bluesky.plan_stubs as bps
+import bluesky.plans as bp
 import bluesky.preprocessors as bpp
 import pytest
 from bluesky.run_engine import RunEngineResult
-from bluesky.utils import Msg, RequestAbort, RunEngineInterrupted
-
-from ibex_bluesky_core.run_engine import _DuringTask, get_run_engine, run_plan
+from bluesky.utils import (
+    CallbackRegistry,
+    Msg,
+    RequestAbort,
+    RunEngineInterrupted,
+    _BoundMethodProxy,
+)
+from ophyd_async.core import SignalRW, soft_signal_rw
+
+from ibex_bluesky_core.run_engine import CallbackProfiler, _DuringTask, get_run_engine, run_plan
 from ibex_bluesky_core.version import version
 
 
@@ -146,3 +157,158 @@ def test_run_plan_happy_path(RE):
     result = run_plan(plan())
     assert result.plan_result == "happy_path_result"
     assert result.exit_status == "success"
+
+
+def _detector() -> SignalRW[float]:
+    return soft_signal_rw(float, 1.0, "det")
+
+
+def _slow_callback(name: str, doc: dict[str, Any]) -> None:
+    if name == "event":
+        time.sleep(0.02)
+
+
+def test_callback_profiler_times_each_callback_by_document_type(RE, caplog):
+    profiler = CallbackProfiler(warn_threshold_s=0.01)
+    profiler.install(RE)
+    RE.subscribe(_slow_callback)
+
+    with caplog.at_level(logging.INFO, logger="ibex_bluesky_core.run_engine._profiling"):
+        RE(bp.count([_detector()], num=3))
+
+    summary = profiler.last_run_summary
+    assert summary is not None
+    slow = summary["callbacks"]["_slow_callback"]
+    assert slow["event"]["count"] == 3
+    assert slow["event"]["slow"] == 3
+    assert slow["event"]["total_s"] >= 0.06
+    assert slow["event"]["mean_s"] == pytest.approx(slow["event"]["total_s"] / 3)
+    assert sum(slow["event"]["histogram"]) == 3
+    assert slow["stop"]["count"] == 1
+    assert "DocLoggingCallback" in summary["callbacks"]
+
+    warnings = [r for r in caplog.records if r.levelno == logging.WARNING]
+    assert len(warnings) == 1
+    assert "_slow_callback" in warnings[0].getMessage()
+    assert any("Callback timings for run" in r.getMessage() for r in caplog.records)
+
+
+def test_callback_profiler_summary_includes_stop_callbacks_without_changing_stop_document(RE):
+    profiler = CallbackProfiler()
+    profiler.install(RE)
+    stops = []
+    RE.subscribe(lambda name, doc: stops.append(doc) if name == "stop" else None)
+    RE.subscribe(_slow_callback)
+
+    RE(bp.count([_detector()], num=2))
+    RE(bp.count([_detector()], num=1))
+
+    assert len(stops) == 2
+    assert "callback_timings" not in stops[1]
+    summary = profiler.last_run_summary
+    assert summary is not None
+    assert summary["histogram_edges_s"] == [0.0001, 0.001, 0.01, 0.1, 1.0]
+    # Timings are reset at the start of each run, and include every stop callback.
+    assert summary["callbacks"]["DocLoggingCallback"]["event"]["count"] == 1
+    assert summary["callbacks"]["DocLoggingCallback"]["stop"]["count"] == 1
+    assert summary["callbacks"]["_slow_callback"]["stop"]["count"] == 1
+
+
+def test_callback_profiler_keeps_registry_signal_validation(RE):
+    class NotADocument(Enum):
+        datum = "datum"
+
+    profiler = CallbackProfiler()
+    profiler.install(RE)
+
+    with pytest.raises(ValueError, match="Allowed signals"):
+        RE.dispatcher.cb_registry.connect(NotADocument.datum, _slow_callback)
+    with pytest.raises(ValueError, match="Allowed signals"):
+        RE.dispatcher.cb_registry.process(NotADocument.datum, "datum", {})
+
+
+def test_callback_profiler_names_callbacks():
+    class Callable:
+        def __call__(self, name: str, doc: dict[str, Any]) -> None:
+            pass
+
+        def method(self, name: str, doc: dict[str, Any]) -> None:
+            pass
+
+    profiler = CallbackProfiler()
+    instance = Callable()
+    registry = CallbackRegistry()
+    registry.connect("event", instance)
+    registry.connect("event", instance.method)
+    registry.connect("event", Callable())
+    registry.connect("event", _slow_callback)
+
+    names = [profiler._name(func) for func in registry.callbacks["event"].values()]  # pyright: ignore reportPrivateUsage
+    assert names == ["Callable", "Callable.method", "Callable#2", "_slow_callback"]
+
+
+def test_callback_profiler_removes_dead_callbacks(RE):
+    def dead_callback(name: str, doc: dict[str, Any]) -> None:
+        # Raised by bluesky's proxy when a subscribed method's instance no longer exists.
+        raise ReferenceError
+
+    profiler = CallbackProfiler()
+    profiler.install(RE)
+    RE.subscribe(dead_callback)
+
+    RE(bp.count([_detector()], num=1))
+
+    assert profiler.last_run_summary is not None
+    assert not any("dead_callback" in name for name in profiler.last_run_summary["callbacks"])
+    registered = [
+        proxy.func
+        for callbacks in RE.dispatcher.cb_registry.callbacks.values()
+        for proxy in callbacks.values()
+    ]
+    assert dead_callback not in registered
+
+
+def test_callback_profiler_times_and_reraises_failing_callbacks(RE):
+    def failing_callback(name: str, doc: dict[str, Any]) -> None:
+        if name == "event":
+            raise ValueError("bad callback")
+
+    profiler = CallbackProfiler()
+    profiler.install(RE)
+    RE.subscribe(failing_callback)
+
+    with pytest.raises(ValueError, match="bad callback"):
+        RE(bp.count([_detector()], num=1))
+
+    RE.dispatcher.cb_registry.ignore_exceptions = True
+    with pytest.warns(UserWarning, match="bad callback"):
+        RE(bp.count([_detector()], num=1))
+    assert profiler.last_run_summary is not None
+    assert (
+        profiler.last_run_summary["callbacks"][
+            "test_callback_profiler_times_and_reraises_failing_callbacks.<locals>.failing_callback"
+        ]["event"]["count"]
+        == 1
+    )
+
+
+def test_callback_profiler_install_and_uninstall(RE):
+    profiler = CallbackProfiler()
+    profiler.install(RE)
+    with pytest.raises(RuntimeError, match="already installed"):
+        profiler.install(RE)
+
+    RE.subscribe(_slow_callback)
+    token = RE.subscribe(_slow_callback, "event")
+    RE.unsubscribe(token)
+
+    profiler.uninstall()
+    profiler.uninstall()
+    RE(bp.count([_detector()], num=1))
+
+    assert profiler.last_run_summary is None
+    assert all(
+        isinstance(func, _BoundMethodProxy)
+        for callbacks in RE.dispatcher.cb_registry.callbacks.values()
+        for func in callbacks.values()
+    )